@@ -1,17 +1,40 @@
 """The Google Wifi Integration for Home Assistant."""
 import asyncio
+import json
 import logging
 import time
+from collections import deque
+from contextlib import AsyncExitStack
 from datetime import timedelta
+from functools import partial
 
 import voluptuous as vol
+from aiohttp import ClientError, ClientSession
 from googlewifi import GoogleHomeIgnoreDevice, GoogleWifi, GoogleWifiException
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL
-from homeassistant.core import CoreState, HomeAssistant, callback
-from homeassistant.exceptions import ConfigEntryNotReady, PlatformNotReady
-from homeassistant.helpers import aiohttp_client
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.const import ATTR_ENTITY_ID, CONF_SCAN_INTERVAL
+from homeassistant.core import (
+    CoreState,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import (
+    ConfigEntryNotReady,
+    HomeAssistantError,
+    PlatformNotReady,
+)
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -20,18 +43,62 @@ from homeassistant.helpers.update_coordinator import (
 
 from .const import (
     ADD_DISABLED,
+    CIRCUIT_BREAKER_COOLDOWN,
+    CIRCUIT_BREAKER_THRESHOLD,
+    COMMAND_CONFIRM_TIMEOUT,
+    COMMAND_LATENCY_SAMPLES,
+    CONF_ADAPTIVE_POLLING,
+    CONF_DATA_USAGE,
+    CONF_DEVICE_FILTER,
+    CONF_DEVICE_FILTER_MODE,
+    CONF_MAIN_NETWORK_ONLY,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
     CONF_SPEEDTEST,
     CONF_SPEEDTEST_INTERVAL,
+    CONF_SPEEDTEST_PARALLEL,
+    CONF_TRAFFIC_STATISTICS,
+    CONF_TRAFFIC_WINDOW,
+    CONF_TRACKERS_ONLY,
     COORDINATOR,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_DATA_USAGE,
+    DEFAULT_DEVICE_FILTER_MODE,
+    DEFAULT_MAIN_NETWORK_ONLY,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_SPEEDTEST,
     DEFAULT_SPEEDTEST_INTERVAL,
+    DEFAULT_SPEEDTEST_PARALLEL,
+    DEFAULT_TRAFFIC_STATISTICS,
+    DEFAULT_TRACKERS_ONLY,
+    DEFAULT_TRAFFIC_WINDOW,
     DOMAIN,
     GOOGLEWIFI_API,
     POLLING_INTERVAL,
+    RECONNECT_MAX_INTERVAL,
     REFRESH_TOKEN,
     SIGNAL_ADD_DEVICE,
     SIGNAL_DELETE_DEVICE,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_KEY,
+    SPEEDTEST_HISTORY,
+    TOP_DEVICES,
+    STORAGE_VERSION,
+    SYSTEM_REFRESH_INTERVAL,
+    account_unique_id,
 )
+from .auth import async_get_token_cache
+from .commands import COMMAND_ERRORS, CommandQueue, PendingCommand
+from .device_index import DeviceIndex
+from .models import DeviceView, SystemView
+from .network import SubnetClassifier
+from .policy import DevicePolicy
+from .reconnect import ReconnectPolicy
+from .session import async_close_session, async_get_session
+from .timing import PhaseTimings
+from .traffic import TrafficHistory, top_devices, traffic_samples
+from .usage import DataUsage
 
 CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
 _LOGGER = logging.getLogger(__name__)
@@ -39,13 +106,103 @@ _LOGGER = logging.getLogger(__name__)
 PLATFORMS = ["binary_sensor", "device_tracker", "switch", "light", "sensor"]
 
 
+SERVICE_PAUSE_DEVICES = "pause_devices"
+ATTR_DEVICE_IDS = "device_ids"
+ATTR_MACS = "macs"
+ATTR_PAUSED = "paused"
+
+PAUSE_DEVICES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID, default=[]): cv.entity_ids,
+        vol.Optional(ATTR_MACS, default=[]): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_DEVICE_IDS, default=[]): vol.All(
+            cv.ensure_list, [cv.string]
+        ),
+        vol.Required(ATTR_PAUSED): cv.boolean,
+    }
+)
+
+
 async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the Google WiFi component."""
     hass.data.setdefault(DOMAIN, {})
 
+    async def async_pause_devices(call: ServiceCall) -> ServiceResponse:
+        """Pause or unpause many client devices in one call."""
+        return await _async_pause_devices(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PAUSE_DEVICES,
+        async_pause_devices,
+        schema=PAUSE_DEVICES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
     return True
 
 
+async def _async_pause_devices(hass: HomeAssistant, call: ServiceCall):
+    """Fan out pause commands and refresh each coordinator once at the end."""
+    coordinators = {
+        entry_id: entry_data[COORDINATOR]
+        for entry_id, entry_data in hass.data[DOMAIN].items()
+        if isinstance(entry_data, dict) and COORDINATOR in entry_data
+    }
+    device_ids = set(call.data[ATTR_DEVICE_IDS])
+    macs = {mac.lower() for mac in call.data[ATTR_MACS]}
+
+    entity_registry = er.async_get(hass)
+    for entity_id in call.data[ATTR_ENTITY_ID]:
+        entity_entry = entity_registry.async_get(entity_id)
+        if entity_entry and entity_entry.config_entry_id in coordinators:
+            device_ids.add(entity_entry.unique_id)
+        else:
+            _LOGGER.warning("%s is not a Google Wifi client device", entity_id)
+
+    targets = {}
+    found_macs = set()
+    for coordinator in coordinators.values():
+        for system_id, system in (coordinator.data or {}).items():
+            for device_id, device in system.devices.items():
+                mac = device.mac_address.lower() if device.mac_address else None
+
+                if device_id in device_ids or mac in macs:
+                    targets[device_id] = (coordinator, system_id)
+                    found_macs.add(mac)
+
+    paused = call.data[ATTR_PAUSED]
+
+    # The command queue sends the commands of a system one at a time, in order
+    # with those of the switches, so only different systems run in parallel.
+    results = await asyncio.gather(
+        *[
+            coordinator.commands.async_send(
+                system_id,
+                device_id,
+                coordinator.api.pause_device,
+                system_id,
+                device_id,
+                paused,
+            )
+            for device_id, (coordinator, system_id) in targets.items()
+        ]
+    )
+
+    for coordinator, system_id in set(targets.values()):
+        coordinator.async_note_command(system_id)
+
+    for coordinator in {coordinator for coordinator, _ in targets.values()}:
+        await coordinator.async_request_refresh()
+
+    results = dict(zip(targets, results))
+    for missing in (device_ids - results.keys()) | (macs - found_macs):
+        _LOGGER.warning("Google Wifi client device %s was not found", missing)
+        results[missing] = False
+
+    return {"results": results}
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up Google WiFi component from a config entry."""
     polling_interval = entry.options.get(CONF_SCAN_INTERVAL, POLLING_INTERVAL)
@@ -53,22 +210,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     conf = entry.data
     conf_options = entry.options
 
-    session = aiohttp_client.async_get_clientsession(hass)
+    session = async_get_session(hass)
 
     api = GoogleWifi(refresh_token=conf[REFRESH_TOKEN], session=session)
 
-    try:
-        await api.connect()
-    except ConnectionError as error:
-        _LOGGER.debug(f"Google WiFi API: {error}")
-        raise PlatformNotReady from error
-    except ValueError as error:
-        _LOGGER.debug(f"Google WiFi API: {error}")
-        raise ConfigEntryNotReady from error
-
     coordinator = GoogleWiFiUpdater(
         hass,
         api=api,
+        session=session,
         name="GoogleWifi",
         polling_interval=polling_interval,
         refresh_token=conf[REFRESH_TOKEN],
@@ -78,23 +227,102 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         speedtest_interval=conf_options.get(
             CONF_SPEEDTEST_INTERVAL, DEFAULT_SPEEDTEST_INTERVAL
         ),
+        speedtest_parallel=conf_options.get(
+            CONF_SPEEDTEST_PARALLEL, DEFAULT_SPEEDTEST_PARALLEL
+        ),
+        adaptive_polling=conf_options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        ),
+        min_polling_interval=conf_options.get(
+            CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+        ),
+        max_polling_interval=conf_options.get(
+            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+        ),
+        traffic_statistics=conf_options.get(
+            CONF_TRAFFIC_STATISTICS, DEFAULT_TRAFFIC_STATISTICS
+        ),
+        traffic_window=conf_options.get(CONF_TRAFFIC_WINDOW, DEFAULT_TRAFFIC_WINDOW),
+        data_usage=conf_options.get(CONF_DATA_USAGE, DEFAULT_DATA_USAGE),
+        device_policy=DevicePolicy(
+            mode=conf_options.get(CONF_DEVICE_FILTER_MODE, DEFAULT_DEVICE_FILTER_MODE),
+            device_filter=conf_options.get(CONF_DEVICE_FILTER, ""),
+            main_network_only=conf_options.get(
+                CONF_MAIN_NETWORK_ONLY, DEFAULT_MAIN_NETWORK_ONLY
+            ),
+            trackers_only=conf_options.get(CONF_TRACKERS_ONLY, DEFAULT_TRACKERS_ONLY),
+        ),
     )
 
-    await coordinator.async_refresh()
+    # Spread the polls of several accounts over the polling interval.
+    entries = hass.config_entries.async_entries(DOMAIN)
+    coordinator.poll_slot = polling_interval / len(entries)
+    coordinator.poll_offset = round(entries.index(entry) * coordinator.poll_slot, 1)
+
+    if coordinator.usage is not None:
+        await coordinator.usage.async_load()
+
+    if not await coordinator.async_load_snapshot():
+        try:
+            await coordinator.tokens.async_connect(api, conf[REFRESH_TOKEN])
+        except ConnectionError as error:
+            _LOGGER.debug(f"Google WiFi API: {error}")
+            raise PlatformNotReady from error
+        except ValueError as error:
+            _LOGGER.debug(f"Google WiFi API: {error}")
+            raise ConfigEntryNotReady from error
+
+        await coordinator.async_refresh()
 
-    if not coordinator.last_update_success:
-        raise ConfigEntryNotReady
+        if not coordinator.last_update_success:
+            raise ConfigEntryNotReady
 
     hass.data[DOMAIN][entry.entry_id] = {
         COORDINATOR: coordinator,
         GOOGLEWIFI_API: api,
     }
 
+    _async_migrate_unique_id(hass, entry, coordinator)
+
+    await _async_remove_excluded_entities(hass, entry, coordinator)
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    
+
+    if coordinator.stale:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{coordinator.name} first refresh"
+        )
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
+@callback
+def _async_migrate_unique_id(hass, entry, coordinator):
+    """Identify an entry by the systems of its account, not its refresh token.
+
+    Entries created before used the refresh token, which is a secret and
+    differs for every token issued for the same account.
+    """
+    if entry.unique_id != entry.data[REFRESH_TOKEN] or not coordinator.data:
+        return
+
+    unique_id = account_unique_id(coordinator.data)
+    if any(
+        other.unique_id == unique_id
+        for other in hass.config_entries.async_entries(DOMAIN)
+    ):
+        return
+
+    hass.config_entries.async_update_entry(entry, unique_id=unique_id)
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Reload the config entry so changed options take effect."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
     unload_ok = all(
@@ -106,29 +334,234 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         )
     )
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)[COORDINATOR]
+        await coordinator.commands.async_shutdown()
+
+        if not any(
+            isinstance(entry_data, dict) and COORDINATOR in entry_data
+            for entry_data in hass.data[DOMAIN].values()
+        ):
+            await async_close_session(hass)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Remove the cached snapshot, data usage and tokens of a deleted config entry."""
+    await snapshot_store(hass, entry).async_remove()
+    await DataUsage(hass, entry.entry_id).async_remove()
+    await async_get_token_cache(hass).async_invalidate(entry.data[REFRESH_TOKEN])
+
+
+async def _async_remove_excluded_entities(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator
+):
+    """Remove the entities of client devices the device policy now excludes.
+
+    Client switches and trackers use the device id as unique id and the
+    device sensors use it as prefix. Devices whose network is unknown because
+    they are offline keep their entities.
+    """
+    clients = set()
+    excluded = set()
+    for system in coordinator.data.values():
+        for device_id, device in system.devices.items():
+            clients.add(device_id)
+            if coordinator.device_policy.excludes(device):
+                excluded.add(device_id)
+
+    trackers_only = coordinator.device_policy.trackers_only
+    if not excluded and not trackers_only:
+        return
+
+    entity_registry = er.async_get(hass)
+    devices = set()
+
+    for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
+        if entity.unique_id.split("_", 1)[0] in excluded or (
+            trackers_only and entity.domain == "switch" and entity.unique_id in clients
+        ):
+            entity_registry.async_remove(entity.entity_id)
+            devices.add(entity.device_id)
+
+    for device_id in devices:
+        await cleanup_device_registry(hass, device_id)
+
+
+def snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store holding the last snapshot of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{SNAPSHOT_STORAGE_KEY}.{entry.entry_id}")
+
+
 async def cleanup_device_registry(hass: HomeAssistant, device_id):
     """Remove device registry entry if there are no remaining entities."""
 
-    device_registry = await hass.helpers.device_registry.async_get_registry()
-    entity_registry = await hass.helpers.entity_registry.async_get_registry()
-    if device_id and not hass.helpers.entity_registry.async_entries_for_device(
+    device_registry = dr.async_get(hass)
+    entity_registry = er.async_get(hass)
+    if device_id and not er.async_entries_for_device(
         entity_registry, device_id, include_disabled_entities=True
     ):
         device_registry.async_remove_device(device_id)
 
 
-class GoogleWiFiUpdater(DataUpdateCoordinator):
+def _station_base(raw_system) -> dict:
+    """Return the parts of a system tier payload that station polls reuse.
+
+    Station polls refresh the status, traffic and stations. The system
+    settings, the access points and the pause state and MAC address of each
+    station come from the system tier, and everything else is dropped.
+    """
+    group_settings = raw_system.get("groupSettings") or {}
+    group_properties = raw_system.get("groupProperties") or {}
+    firmware_version = (group_properties.get("otherProperties") or {}).get(
+        "firmwareVersion"
+    )
+
+    return {
+        "groupProperties": {"otherProperties": {"firmwareVersion": firmware_version}},
+        "groupSettings": {"lanSettings": group_settings.get("lanSettings") or {}},
+        "access_points": {
+            ap_id: {
+                key: access_point[key]
+                for key in ("accessPointSettings", "accessPointProperties")
+                if key in access_point
+            }
+            for ap_id, access_point in raw_system["access_points"].items()
+        },
+        "devices": {
+            device_id: {
+                key: device[key] for key in ("paused", "macAddress") if key in device
+            }
+            for device_id, device in raw_system["devices"].items()
+        },
+    }
+
+
+def _merge_stations(base, status, metrics, stations):
+    """Lay fresh status, traffic and stations over the base of a system.
+
+    The base comes from _station_base and is not modified. Returns None when
+    an access point or station is not in it, so the system tier has to run. Raises
+    GoogleWifiException when the API rejected the tokens and ValueError on
+    any other unusable response.
+    """
+    for response in (status, metrics, stations):
+        _raise_for_api_error(response)
+
+    try:
+        ap_states = {
+            ap_status["apId"]: ap_status["apState"]
+            for ap_status in status["apStatuses"]
+        }
+        traffic = {
+            station_metrics["station"]["id"]: station_metrics.get("traffic", {})
+            for station_metrics in metrics.get("stationMetrics") or []
+        }
+
+        if ap_states.keys() != base["access_points"].keys():
+            return None
+
+        access_points = {}
+        for ap_id, access_point in base["access_points"].items():
+            access_points[ap_id] = {**access_point, "status": ap_states[ap_id]}
+
+        devices = {}
+        for station in stations["stations"]:
+            known = base["devices"].get(station["id"])
+            if known is None:
+                return None
+
+            device = devices[station["id"]] = {**station, **known}
+            if station["id"] in traffic:
+                device["traffic"] = traffic[station["id"]]
+
+        return {
+            **base,
+            "status": status["wanConnectionStatus"],
+            "groupTraffic": metrics.get("groupTraffic"),
+            "access_points": access_points,
+            "devices": devices,
+        }
+    except (KeyError, TypeError, AttributeError) as error:
+        raise ValueError(f"Unexpected station data: {error}") from error
+
+
+def _response_bytes(response) -> int:
+    """Return the size of API responses as compact (ASCII) JSON.
+
+    The client hands over the decoded responses, so this stands in for the
+    size of the response bodies, which are compact JSON too.
+    """
+    return len(json.dumps(response, separators=(",", ":")))
+
+
+def _raise_for_api_error(response):
+    """Raise if a Google Wifi API response is an error payload."""
+    error = response.get("error") if isinstance(response, dict) else None
+    if not isinstance(error, dict):
+        return
+
+    if error.get("code") in (401, 403):
+        raise GoogleWifiException(error.get("message", error))
+
+    raise ValueError(error.get("message", error))
+
+
+def _devices_settled(previous, system) -> bool:
+    """Return True if no device joined, left, (dis)connected or was paused.
+
+    Traffic rates differ on almost every poll, so they are not activity for
+    adaptive polling.
+    """
+    if previous.devices.keys() != system.devices.keys():
+        return False
+
+    return all(
+        device.connected == previous.devices[device_id].connected
+        and device.paused == previous.devices[device_id].paused
+        for device_id, device in system.devices.items()
+    )
+
+
+class _EarlyPollMixin:
+    """Let a coordinator poll before its scheduled refresh.
+
+    The coordinator schedules the next refresh when a poll ends, so a shorter
+    update_interval set afterwards only takes effect one poll later.
+    """
+
+    _unsub_early_poll = None
+
+    @callback
+    def async_poll_in(self, seconds):
+        """Poll in the given seconds unless another poll starts first."""
+        self.async_cancel_early_poll()
+        self._unsub_early_poll = async_call_later(
+            self.hass, seconds, self._async_early_poll
+        )
+
+    @callback
+    def async_cancel_early_poll(self):
+        """Cancel the early poll, if any."""
+        if self._unsub_early_poll is not None:
+            self._unsub_early_poll()
+            self._unsub_early_poll = None
+
+    @callback
+    def _async_early_poll(self, _now):
+        """Run the early poll."""
+        self._unsub_early_poll = None
+        self.hass.async_create_task(self.async_refresh(), f"{self.name} early poll")
+
+
+class GoogleWiFiUpdater(_EarlyPollMixin, DataUpdateCoordinator):
     """Class to manage fetching update data from the Google Wifi API."""
 
     def __init__(
         self,
         hass: HomeAssistant,
         api: str,
+        session: ClientSession,
         name: str,
         polling_interval: int,
         refresh_token: str,
@@ -136,115 +569,878 @@ class GoogleWiFiUpdater(DataUpdateCoordinator):
         add_disabled: bool,
         auto_speedtest: str,
         speedtest_interval: str,
+        speedtest_parallel: int = DEFAULT_SPEEDTEST_PARALLEL,
+        adaptive_polling: bool = DEFAULT_ADAPTIVE_POLLING,
+        min_polling_interval: int = DEFAULT_MIN_SCAN_INTERVAL,
+        max_polling_interval: int = DEFAULT_MAX_SCAN_INTERVAL,
+        traffic_statistics: bool = DEFAULT_TRAFFIC_STATISTICS,
+        traffic_window: int = DEFAULT_TRAFFIC_WINDOW,
+        data_usage: bool = DEFAULT_DATA_USAGE,
+        device_policy: DevicePolicy = None,
     ):
         """Initialize the global Google Wifi data updater."""
         self.api = api
+        self.session = session
         self.refresh_token = refresh_token
         self.entry = entry
         self.add_disabled = add_disabled
         self._last_speedtest = 0
         self.auto_speedtest = auto_speedtest
         self.speedtest_interval = speedtest_interval
-        self._force_speed_update = None
-        self.devicelist = []
+        self.speedtest_parallel = speedtest_parallel
+        self._force_speed_update = set()
+        self._speedtest_task = None
+        self._speedtest_results = {}
+        self.speedtest_history = deque(maxlen=SPEEDTEST_HISTORY)
+        self.device_index = DeviceIndex()
+        self._classifiers = {}
+        self.traffic = {} if traffic_statistics else None
+        self.traffic_window = traffic_window * 60
+        self.usage = DataUsage(hass, entry.entry_id) if data_usage else None
+        self.top_devices = {}
+        self.device_policy = device_policy or DevicePolicy()
+        self.entity_device_keys = set()
+        self._changed = None
+        self.state_writes = 0
+        self.skipped_writes = 0
+        self.polling_interval = polling_interval
+        self.adaptive_polling = adaptive_polling
+        self.min_polling_interval = min(min_polling_interval, polling_interval)
+        self.max_polling_interval = max(max_polling_interval, polling_interval)
+        self.system_interval = max(SYSTEM_REFRESH_INTERVAL, polling_interval)
+        self.traffic_samples = traffic_samples(
+            self.traffic_window,
+            self.min_polling_interval if adaptive_polling else polling_interval,
+            self.system_interval,
+        )
+        self.commands = CommandQueue(hass, on_sent=self.async_request_refresh)
+        self.command_latency = {}
+        self.stale = False
+        self.poll_offset = 0
+        self.poll_slot = polling_interval
+        self._staggered = False
+        self.system_updaters = {}
+        self._unavailable_systems = set()
+        self._station_bases = {}
+        self._system_locks = {}
+        self._system_refresh_until = 0
+        self.system_refreshes = 0
+        self.station_refreshes = 0
+        self.response_bytes = 0
+        self.station_response_bytes = {}
+        self.tokens = async_get_token_cache(hass)
+        self.timings = PhaseTimings()
+        self._store = snapshot_store(hass, entry)
+        self.reconnect = ReconnectPolicy(
+            base_interval=self.system_interval,
+            max_interval=RECONNECT_MAX_INTERVAL,
+            threshold=CIRCUIT_BREAKER_THRESHOLD,
+            cooldown=CIRCUIT_BREAKER_COOLDOWN,
+        )
 
         super().__init__(
             hass=hass,
             logger=_LOGGER,
             name=name,
-            update_interval=timedelta(seconds=polling_interval),
+            update_interval=timedelta(seconds=self.system_interval),
         )
 
     async def force_speed_test(self, system_id):
         """Set the flag to force a speed test."""
-        self._force_speed_update = system_id
+        self._force_speed_update.add(system_id)
+        await self.async_request_refresh()
         return True
 
-    async def _async_update_data(self):
-        """Fetch data from Google Wifi API."""
+    @callback
+    def async_note_command(self, system_id):
+        """Refresh the system tier at the polling interval after a command.
+
+        The system tier holds the pause and lighting settings a command
+        changes, so it is polled like the stations until the command can be
+        confirmed, at the minimum interval when adaptive polling is on. The
+        stations of the system are polled faster as well.
+        """
+        if system_id in self.system_updaters:
+            self.system_updaters[system_id].adapt_interval(True, False)
+
+        self._system_refresh_until = time.monotonic() + COMMAND_CONFIRM_TIMEOUT
+        interval = self._system_refresh_interval()
+
+        if self.update_interval.total_seconds() > interval:
+            self.update_interval = timedelta(seconds=interval)
+            self.async_poll_in(interval)
+
+    def _system_refresh_interval(self):
+        """Return the interval of the system tier."""
+        if time.monotonic() >= self._system_refresh_until:
+            return self.system_interval
+
+        if self.adaptive_polling:
+            return self.min_polling_interval
+
+        return self.polling_interval
+
+    @callback
+    def async_record_command(self, platform, result, elapsed):
+        """Record how a command ended and how long confirmation took."""
+        if result == "confirmed":
+            self.command_latency.setdefault(
+                platform, deque(maxlen=COMMAND_LATENCY_SAMPLES)
+            ).append(round(elapsed, 2))
 
+        _LOGGER.debug(
+            "Google Wifi %s command %s after %.1f seconds", platform, result, elapsed
+        )
+
+    async def async_load_snapshot(self) -> bool:
+        """Start from the snapshot saved by a previous run.
+
+        The cached data is marked stale until the first live refresh
+        succeeds. Returns False when there is no usable snapshot.
+        """
         try:
-            system_data = await self.api.get_systems()
+            cached = await self._store.async_load()
+        except HomeAssistantError as error:
+            _LOGGER.warning("Unable to load the Google Wifi snapshot: %s", error)
+            return False
 
-            for system_id, system in system_data.items():
-                connected_count = 0
-                guest_connected_count = 0
-                main_network = system["groupSettings"]["lanSettings"].get(
-                    "dhcpPoolBegin", " " * 10
+        if not cached:
+            return False
+
+        try:
+            system_data = {
+                system_id: SystemView.from_dict(system)
+                for system_id, system in cached["systems"].items()
+            }
+        except (KeyError, TypeError, AttributeError) as error:
+            _LOGGER.warning("Ignoring invalid Google Wifi snapshot: %s", error)
+            return False
+
+        self.device_index.next_generation()
+        for system_id, system in system_data.items():
+            self.device_index.update(system_id, system.devices)
+            self._select_entity_devices(system_id, system, system.devices)
+            if system.wan_transmit_bps is not None:
+                self._speedtest_results[system_id] = {
+                    "transmitWanSpeedBps": system.wan_transmit_bps,
+                    "receiveWanSpeedBps": system.wan_receive_bps,
+                }
+
+        self.stale = True
+        self.data = system_data
+        self.last_update_success = True
+        return True
+
+    @callback
+    def _save_snapshot(self):
+        """Schedule a save of the current snapshot."""
+        self._store.async_delay_save(self.snapshot_data, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def snapshot_data(self) -> dict:
+        """Return the current snapshot in its stored form."""
+        return {
+            "systems": {
+                system_id: system.as_dict() for system_id, system in self.data.items()
+            }
+        }
+
+    @callback
+    def _start_speed_test(self, system_ids):
+        """Run speed tests as a background job off the polling path."""
+        self._speedtest_task = self.entry.async_create_background_task(
+            self.hass,
+            self._async_run_speed_tests(system_ids),
+            f"{self.name} speed test",
+        )
+
+    async def _async_run_speed_tests(self, system_ids):
+        """Run the speed tests and merge the results into the next snapshot."""
+        semaphore = asyncio.Semaphore(max(1, self.speedtest_parallel))
+
+        with self.timings.measure("speedtest"):
+            results = await asyncio.gather(
+                *[
+                    self._async_run_speed_test(system_id, semaphore)
+                    for system_id in system_ids
+                ],
+                return_exceptions=True,
+            )
+
+        for system_id, result in zip(system_ids, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Unexpected error in the speed test of %s",
+                    system_id,
+                    exc_info=result,
                 )
-                main_network = ".".join(main_network.split(".", 3)[:3])
-
-                for device_id, device in system["devices"].items():
-                    device_network = device.get("ipAddress", " " * 10)
-                    device_network = ".".join(device_network.split(".", 3)[:3])
-
-                    if device_id not in self.devicelist:
-                        to_add = {
-                            "system_id": system_id,
-                            "device_id": device_id,
-                            "device": device,
-                        }
-                        async_dispatcher_send(self.hass, SIGNAL_ADD_DEVICE, to_add)
-                        self.devicelist.append(device_id)
-
-                    if device.get("connected") and main_network == device_network:
-                        connected_count += 1
-                        device["network"] = "main"
-                    elif (
-                        device.get("connected")
-                        and device.get("unfilteredFriendlyType") != "Nest Wifi point"
-                    ):
-                        guest_connected_count += 1
-                        device["network"] = "guest"
-                    elif device.get("unfilteredFriendlyType") == "Nest Wifi point":
-                        connected_count += 1
-                        device["network"] = "main"
-
-                for known_device in self.devicelist:
-                    if known_device not in system["devices"]:
-                        async_dispatcher_send(
-                            self.hass, SIGNAL_DELETE_DEVICE, known_device
-                        )
-                        self.devicelist.remove(known_device)
-
-            system_data[system_id]["connected_devices"] = connected_count
-            system_data[system_id]["guest_devices"] = guest_connected_count
-            system_data[system_id]["total_devices"] = (
-                connected_count + guest_connected_count
+
+        await self.async_request_refresh()
+
+    async def _async_run_speed_test(self, system_id, semaphore):
+        """Run a single system speed test within the concurrency bound."""
+        async with semaphore:
+            started = time.time()
+            try:
+                speedtest_result = await self.api.run_speed_test(system_id=system_id)
+            except (*COMMAND_ERRORS, KeyError, TypeError) as error:
+                _LOGGER.warning("Speed test failed for %s: %s", system_id, error)
+                self.speedtest_history.append(
+                    {"system_id": system_id, "started": started, "error": str(error)}
+                )
+                return
+
+        self.speedtest_history.append(
+            {
+                "system_id": system_id,
+                "started": started,
+                "duration": round(time.time() - started, 1),
+                "result": speedtest_result,
+            }
+        )
+
+        if speedtest_result:
+            self._speedtest_results[system_id] = speedtest_result
+
+    async def _async_update_data(self):
+        """Fetch the systems of the account from the Google Wifi API.
+
+        This is the system tier. The stations of each system are polled in
+        between by its GoogleWifiSystemUpdater.
+        """
+        self.async_cancel_early_poll()
+
+        if self.reconnect.is_open:
+            self.update_interval = timedelta(seconds=self.reconnect.cooldown_remaining)
+            self._changed = set()
+            raise UpdateFailed("Google Wifi API paused after repeated failures")
+
+        started = time.perf_counter()
+
+        # Station polls wait for the system tier, so an older system payload
+        # never replaces the stations of a newer station poll.
+        async with AsyncExitStack() as stack:
+            for system_id in sorted(self._station_bases):
+                await stack.enter_async_context(self._system_lock(system_id))
+
+            try:
+                with self.timings.measure("fetch"):
+                    await self.tokens.async_connect(self.api, self.refresh_token)
+                    raw_data = await self.api.get_systems()
+            except GoogleWifiException as error:
+                await self.async_reconnect_api()
+                raise self._update_failed(f"Error connecting to GoogleWifi: {error}")
+            except (GoogleHomeIgnoreDevice, ConnectionError, ClientError) as error:
+                raise self._update_failed(f"Error connecting to GoogleWifi: {error}")
+            except (ValueError, asyncio.TimeoutError) as error:
+                raise self._update_failed(f"Invalid data from GoogleWifi: {error}")
+
+            self.system_refreshes += 1
+            self.response_bytes = _response_bytes(raw_data)
+
+            system_data, membership_changed = self._process_systems(
+                raw_data, self.timings, full=True
             )
 
+            self._station_bases = {
+                system_id: _station_base(raw_system)
+                for system_id, raw_system in raw_data.items()
+            }
+
+        if self._speedtest_task is None or self._speedtest_task.done():
             if (
                 time.time()
                 > (self._last_speedtest + (60 * 60 * self.speedtest_interval))
                 and self.auto_speedtest == True
                 and self.hass.state == CoreState.running
             ):
-                for system_id, system in system_data.items():
-                    speedtest_result = await self.api.run_speed_test(
-                        system_id=system_id
-                    )
-                    system_data[system_id]["speedtest"] = speedtest_result
-
+                self._start_speed_test(list(system_data))
                 self._last_speedtest = time.time()
             elif self._force_speed_update:
-                speedtest_result = await self.api.run_speed_test(system_id=system_id)
-                system_data[system_id]["speedtest"] = speedtest_result
-                self._force_speed_update = None
+                self._start_speed_test(
+                    [
+                        system_id
+                        for system_id in self._force_speed_update
+                        if system_id in system_data
+                    ]
+                )
+                self._force_speed_update = set()
+
+        self._async_sync_system_updaters(system_data)
+
+        # Joins and leaves found by the system tier speed up the station polls.
+        for system_id in membership_changed:
+            if self.system_updaters[system_id].adapt_interval(True, False) and (
+                self._changed is not None
+            ):
+                self._changed.add((system_id, None))
+
+        self.reconnect.record_success()
+
+        # Accounts set up together would otherwise poll at the same moment.
+        # Every poll is scheduled one interval after the previous one, so
+        # delaying the second poll by the offset keeps them apart.
+        interval = self._system_refresh_interval()
+        if not self._staggered:
+            interval += self.poll_offset
+            self._staggered = True
+        self.update_interval = timedelta(seconds=interval)
+
+        self.timings.record("poll", time.perf_counter() - started)
+
+        return system_data
+
+    def _process_systems(self, raw_data, timings, full=False):
+        """Build, classify, dispatch and diff the raw systems of a poll.
+
+        raw_data holds every system of the account after a system tier poll
+        (full) and a single system after a station poll. Sets the changed
+        slices and returns the system views with the ids of the systems
+        devices joined or left.
+        """
+        with timings.measure("classify"):
+            system_data = self._build_systems(raw_data)
+
+            if self.traffic is not None:
+                self._record_traffic(system_data, full)
+
+            if self.usage is not None:
+                self.usage.async_integrate(time.monotonic(), system_data)
 
-            return system_data
+            for system_id, system in system_data.items():
+                self.top_devices[system_id] = top_devices(system.devices.values())
+
+        with timings.measure("dispatch"):
+            membership_changed = self._dispatch_membership(system_data, full)
+
+        for system_id, system in system_data.items():
+            if system_id in self._speedtest_results:
+                system.set_speedtest(self._speedtest_results[system_id])
+
+        with timings.measure("diff"):
+            self._changed = self._diff_systems(system_data)
+
+        if self.stale:
+            self._changed = None
+            self.stale = False
+
+        if self._changed != set():
+            self._save_snapshot()
+
+        return system_data, membership_changed
+
+    @callback
+    def _async_sync_system_updaters(self, system_data):
+        """Start a station updater for every system and stop stale ones."""
+        for system_id in self.system_updaters.keys() - system_data.keys():
+            self._async_stop_system_updater(system_id)
+
+        for index, system_id in enumerate(system_data):
+            if system_id in self.system_updaters:
+                continue
+
+            # Spread the systems of the account within its share of the interval.
+            updater = GoogleWifiSystemUpdater(
+                self,
+                system_id,
+                offset=self.poll_offset + index * self.poll_slot / len(system_data),
+            )
+            updater.unsub = updater.async_add_listener(
+                partial(self._async_system_updated, system_id)
+            )
+            self.system_updaters[system_id] = updater
+
+    @callback
+    def _async_stop_system_updater(self, system_id):
+        """Stop polling the stations of a system."""
+        updater = self.system_updaters.pop(system_id)
+        updater.unsub()
+        updater.async_cancel_early_poll()
+        self._unavailable_systems.discard(system_id)
+        self.station_response_bytes.pop(system_id, None)
+
+    async def async_shutdown(self):
+        """Stop the station updaters with the account."""
+        for system_id in list(self.system_updaters):
+            self._async_stop_system_updater(system_id)
+
+        self.async_cancel_early_poll()
+        await super().async_shutdown()
+
+    def system_updater(self, system_id):
+        """Return the coordinator polling a system, the account until it starts."""
+        return self.system_updaters.get(system_id, self)
+
+    def system_available(self, system_id) -> bool:
+        """Return True if the last poll of a system succeeded."""
+        if system_id in self.system_updaters:
+            return system_id not in self._unavailable_systems
+
+        return self.last_update_success
+
+    def _system_lock(self, system_id) -> asyncio.Lock:
+        """Return the lock serializing the station and system polls of a system."""
+        return self._system_locks.setdefault(system_id, asyncio.Lock())
+
+    async def async_fetch_stations(self, system_id):
+        """Return a system with fresh station data, or None to run the system tier."""
+        async with self._system_lock(system_id):
+            await self.tokens.async_connect(self.api, self.refresh_token)
+
+            status, metrics, stations = await asyncio.gather(
+                self.api.get_status(system_id),
+                self.api.get_realtime_metrics(system_id),
+                self.api.get_devices(system_id),
+            )
+
+            self.station_refreshes += 1
+            self.station_response_bytes[system_id] = _response_bytes(
+                (status, metrics, stations)
+            )
+            base = self._station_bases.get(system_id)
+            if base is None:
+                return None
+
+            return _merge_stations(base, status, metrics, stations)
+
+    @callback
+    def _async_system_updated(self, system_id):
+        """Publish the station poll of a system to the entities."""
+        updater = self.system_updaters.get(system_id)
+        if updater is None or not self.data or system_id not in self.data:
+            return
+
+        if not updater.last_update_success:
+            if system_id not in self._unavailable_systems:
+                self._unavailable_systems.add(system_id)
+                self._changed = self._system_slices(system_id)
+                self.async_update_listeners()
+            return
+
+        if updater.data is None:
+            # A new station needs the MAC address and pause state of the
+            # system tier, and a new or missing access point its settings.
+            self.entry.async_create_background_task(
+                self.hass, self.async_request_refresh(), f"{self.name} new station"
+            )
+            return
+
+        previous = self.data[system_id]
+        system_data, membership_changed = self._process_systems(
+            {system_id: updater.data}, updater.timings
+        )
+        settled = _devices_settled(previous, system_data[system_id])
+
+        if system_id in self._unavailable_systems:
+            self._unavailable_systems.discard(system_id)
+            settled = False
+            if self._changed is not None:
+                self._changed |= self._system_slices(system_id)
+
+        self.data = {**self.data, **system_data}
+
+        adapted = updater.adapt_interval(system_id in membership_changed, settled)
+        if adapted and self._changed is not None:
+            self._changed.add((system_id, None))
+
+        self._async_write_listeners(updater.timings)
+        updater.timings.record("poll", time.perf_counter() - updater.started)
+
+    def _system_slices(self, system_id):
+        """Return the slices of every entity of a system."""
+        system = self.data[system_id]
+
+        return {
+            (system_id, None),
+            *((system_id, ap_id) for ap_id in system.access_points),
+            *((system_id, device_id) for device_id in system.devices),
+        }
+
+    def _build_systems(self, raw_data):
+        """Build the system views and classify the network of each device."""
+        system_data = {}
+
+        for system_id, raw_system in raw_data.items():
+            system = SystemView(system_id, raw_system)
+            system_data[system.system_id] = system
+
+            main_network = self._subnet_classifier(system)
+
+            for device_id, raw_device in raw_system["devices"].items():
+                device = DeviceView(device_id, raw_device)
+                system.devices[device.device_id] = device
+
+                if (
+                    device.connected
+                    and main_network is not None
+                    and device.ip_address in main_network
+                ):
+                    system.connected_devices += 1
+                    device.network = "main"
+                elif (
+                    device.connected
+                    and raw_device.get("unfilteredFriendlyType") != "Nest Wifi point"
+                ):
+                    system.guest_devices += 1
+                    device.network = "guest"
+                elif raw_device.get("unfilteredFriendlyType") == "Nest Wifi point":
+                    system.connected_devices += 1
+                    device.network = "main"
+
+            system.total_devices = system.connected_devices + system.guest_devices
+
+        return system_data
+
+    def _record_traffic(self, system_data, full):
+        """Add the traffic of the systems and connected devices to the history.
+
+        Every system has its own history, as systems are polled separately.
+        """
+        now = time.monotonic()
+
+        if full:
+            for system_id in self.traffic.keys() - system_data.keys():
+                del self.traffic[system_id]
+
+        for system_id, system in system_data.items():
+            samples = {
+                system_id: (system.transmit_bps or 0, system.receive_bps or 0)
+            }
+
+            for device_id, device in system.devices.items():
+                if device.connected:
+                    samples[(system_id, device_id)] = (
+                        device.transmit_bps,
+                        device.receive_bps,
+                    )
+
+            history = self.traffic.get(system_id)
+            if history is None:
+                history = self.traffic[system_id] = TrafficHistory(
+                    self.traffic_samples
+                )
+            history.record(now, samples)
+
+    def traffic_stats(self, system_id, device_id=None):
+        """Return the rolling traffic statistics of a system or device."""
+        if self.traffic is None or system_id not in self.traffic:
+            return None
+
+        key = (system_id, device_id) if device_id else system_id
+        return self.traffic[system_id].stats(
+            key, time.monotonic(), self.traffic_window
+        )
+
+    def rolling_top_devices(self, system_id):
+        """Return the devices of a system with the highest rolling traffic."""
+        if (
+            self.traffic is None
+            or system_id not in self.traffic
+            or system_id not in (self.data or {})
+        ):
+            return []
+
+        return [
+            device_id
+            for _system_id, device_id in self.traffic[system_id].largest(
+                ((system_id, device_id) for device_id in self.data[system_id].devices),
+                time.monotonic(),
+                self.traffic_window,
+                TOP_DEVICES,
+            )
+        ]
+
+    def _subnet_classifier(self, system):
+        """Return the LAN classifier of a system, rebuilt when its settings change."""
+        settings = (system.lan_address, system.netmask, system.dhcp_pool_begin)
+        cached = self._classifiers.get(system.system_id)
+
+        if cached is None or cached[0] != settings:
+            cached = (settings, SubnetClassifier.from_system(system))
+            self._classifiers[system.system_id] = cached
+
+        return cached[1]
+
+    def _dispatch_membership(self, system_data, full):
+        """Update the device index and signal the devices that joined or left.
+
+        Systems that left the account are only pruned after a full poll.
+        Returns the ids of the known systems whose devices changed.
+        """
+        self.device_index.next_generation()
+        membership_changed = set()
+        new_devices = []
+
+        for system_id, device_id in (
+            self.device_index.prune(system_data) if full else ()
+        ):
+            self.entity_device_keys.discard((system_id, device_id))
+            self._remove_device(system_id, device_id)
+
+        for system_id, system in system_data.items():
+            joined, left = self.device_index.update(system_id, system.devices)
+            if system_id in (self.data or {}) and (joined or left):
+                membership_changed.add(system_id)
+
+            # Known devices only need another look when the policy depends on
+            # the network, which is only classified while a device is connected.
+            candidates = (
+                system.devices if self.device_policy.main_network_only else joined
+            )
+
+            new_devices.extend(
+                {
+                    "system_id": system_id,
+                    "device_id": device_id,
+                    "device": system.devices[device_id],
+                }
+                for device_id in self._select_entity_devices(
+                    system_id, system, candidates
+                )
+            )
+
+            for device_id in left:
+                self.entity_device_keys.discard((system_id, device_id))
+                self._remove_device(system_id, device_id)
+
+        if new_devices:
+            async_dispatcher_send(
+                self.hass, f"{SIGNAL_ADD_DEVICE}_{self.entry.entry_id}", new_devices
+            )
+
+        return membership_changed
+
+    def _select_entity_devices(self, system_id, system, device_ids) -> list:
+        """Add the devices the policy allows to the entity devices and return them."""
+        selected = []
+
+        for device_id in device_ids:
+            key = (system_id, device_id)
+            if key not in self.entity_device_keys and self.device_policy.allows(
+                system.devices[device_id]
+            ):
+                self.entity_device_keys.add(key)
+                selected.append(device_id)
+
+        return selected
+
+    def entity_devices(self, system_id) -> dict:
+        """Return the devices of a system that have entities under the policy."""
+        return {
+            device_id: device
+            for device_id, device in self.data[system_id].devices.items()
+            if (system_id, device_id) in self.entity_device_keys
+        }
+
+    def _update_failed(self, message):
+        """Back off after a failed poll and return the error to raise.
+
+        The last good snapshot stays in place, so entities keep their data
+        while the API is unavailable.
+        """
+        delay = self.reconnect.record_failure()
+        self.update_interval = timedelta(seconds=delay)
+
+        # Entities only need a write when they turn unavailable, which only
+        # depends on the account until the station updaters start.
+        self._changed = (
+            None if self.last_update_success and not self.system_updaters else set()
+        )
+
+        if self.reconnect.is_open:
+            message = f"{message}; pausing polls for {int(delay)} seconds"
+
+        return UpdateFailed(message)
+
+    async def async_reconnect_api(self):
+        """Drop the rejected tokens and use a fresh client on the shared session."""
+        self.reconnect.reconnects += 1
+        await self.tokens.async_invalidate(self.refresh_token)
+        self.api = GoogleWifi(refresh_token=self.refresh_token, session=self.session)
+
+    @callback
+    def _remove_device(self, system_id, device_id):
+        """Signal the entities of a device that left the system."""
+        async_dispatcher_send(
+            self.hass, f"{SIGNAL_DELETE_DEVICE}_{system_id}_{device_id}", device_id
+        )
+
+    def _diff_systems(self, system_data):
+        """Return the (system_id, item_id) slices that changed since the last poll.
+
+        None means everything should be written, e.g. on the first poll or after
+        a failed one where availability may have flipped.
+        """
+        if not self.data or not (self.last_update_success or self.system_updaters):
+            return None
+
+        changed = set()
+
+        for system_id, system in system_data.items():
+            previous = self.data.get(system_id)
+
+            if previous is None:
+                return None
+
+            if previous != system:
+                changed.add((system_id, None))
+
+                if previous.prioritized_station != system.prioritized_station:
+                    changed.add((system_id, previous.prioritized_station))
+                    changed.add((system_id, system.prioritized_station))
+
+            changed_aps = set()
+            for ap_id, access_point in system.access_points.items():
+                if previous.access_points.get(ap_id) != access_point:
+                    changed_aps.add(ap_id)
+                    changed.add((system_id, ap_id))
+
+            for device_id, device in system.devices.items():
+                if (
+                    previous.devices.get(device_id) != device
+                    or device.ap_id in changed_aps
+                ):
+                    changed.add((system_id, device_id))
+
+        return changed
+
+    def has_changed(self, system_id, item_id):
+        """Return True if the entity slice changed in the last poll."""
+        return self._changed is None or (system_id, item_id) in self._changed
+
+    @callback
+    def async_update_listeners(self):
+        """Update listeners and log how many state writes were skipped."""
+        self._async_write_listeners(self.timings)
+
+    @callback
+    def _async_write_listeners(self, timings):
+        """Update listeners, timing the writes in the given timings."""
+        state_writes = self.state_writes
+        skipped_writes = self.skipped_writes
+
+        with timings.measure("write"):
+            super().async_update_listeners()
+
+        _LOGGER.debug(
+            "Google Wifi update wrote %s entity states and skipped %s unchanged",
+            self.state_writes - state_writes,
+            self.skipped_writes - skipped_writes,
+        )
+
+
+class GoogleWifiSystemUpdater(_EarlyPollMixin, DataUpdateCoordinator):
+    """Poll the stations of a single system between system tier polls.
+
+    Every system of an account has its own updater, so systems refresh in
+    parallel, each with its own interval, backoff and circuit breaker, and a
+    slow or failing system does not hold back the others. The account
+    coordinator listens to the updaters and publishes each poll to the
+    entities.
+    """
+
+    def __init__(self, account: GoogleWiFiUpdater, system_id: str, offset: float = 0):
+        """Initialize the station updater of a system.
+
+        The first poll is delayed by offset seconds to spread the polls of
+        the systems.
+        """
+        self.account = account
+        self.system_id = system_id
+        self.polling_interval = account.polling_interval
+        self.offset = offset
+        self.timings = PhaseTimings()
+        self.started = 0
+        self.unsub = None
+        self.reconnect = ReconnectPolicy(
+            base_interval=account.polling_interval,
+            max_interval=RECONNECT_MAX_INTERVAL,
+            threshold=CIRCUIT_BREAKER_THRESHOLD,
+            cooldown=CIRCUIT_BREAKER_COOLDOWN,
+        )
+
+        super().__init__(
+            hass=account.hass,
+            logger=_LOGGER,
+            name=f"{account.name} {system_id}",
+            update_interval=timedelta(seconds=account.polling_interval + offset),
+        )
+
+    async def _async_update_data(self):
+        """Fetch the status, traffic and stations of the system."""
+        self.async_cancel_early_poll()
+
+        if self.reconnect.is_open:
+            self.update_interval = timedelta(seconds=self.reconnect.cooldown_remaining)
+            raise UpdateFailed("Google Wifi API paused after repeated failures")
+
+        self.started = time.perf_counter()
+
+        try:
+            with self.timings.measure("fetch"):
+                raw_system = await self.account.async_fetch_stations(self.system_id)
         except GoogleWifiException as error:
-            session = aiohttp_client.async_create_clientsession(self.hass)
-            self.api = GoogleWifi(refresh_token=self.refresh_token, session=session)
-        except GoogleHomeIgnoreDevice as error:
-            raise UpdateFailed(f"Error connecting to GoogleWifi: {error}") from error
-        except ConnectionError as error:
-            raise ConfigEntryNotReady(
-                f"Error connecting to GoogleWifi: {error}"
-            ) from error
-        except ValueError as error:
-            raise ConfigEntryNotReady(
-                f"Invalid data from GoogleWifi: {error}"
-            ) from error
+            await self.account.async_reconnect_api()
+            raise self._update_failed(f"Error connecting to GoogleWifi: {error}")
+        except (GoogleHomeIgnoreDevice, ConnectionError, ClientError) as error:
+            raise self._update_failed(f"Error connecting to GoogleWifi: {error}")
+        except (ValueError, asyncio.TimeoutError) as error:
+            raise self._update_failed(f"Invalid data from GoogleWifi: {error}")
+
+        if self.reconnect.failures or self.offset:
+            self.offset = 0
+            self.update_interval = timedelta(seconds=self.polling_interval)
+        self.reconnect.record_success()
+
+        return raw_system
+
+    def _update_failed(self, message):
+        """Back off after a failed poll and return the error to raise."""
+        delay = self.reconnect.record_failure()
+        self.update_interval = timedelta(seconds=delay)
+
+        if self.reconnect.is_open:
+            message = f"{message}; pausing polls for {int(delay)} seconds"
+
+        return UpdateFailed(message)
+
+    def adapt_interval(self, active, settled) -> bool:
+        """Adjust the polling interval to the observed change rate.
+
+        Polls fall to the minimum interval while active (after joins, leaves
+        and commands), back off exponentially while no device connects,
+        disconnects or is paused and return to the configured interval
+        otherwise. A shorter interval brings the next poll forward. Returns
+        True if the interval changed.
+        """
+        account = self.account
+        if not account.adaptive_polling:
+            return False
+
+        interval = self.update_interval.total_seconds()
+
+        if active:
+            new_interval = account.min_polling_interval
+        elif settled:
+            new_interval = min(
+                max(interval, self.polling_interval) * 2,
+                account.max_polling_interval,
+            )
+        else:
+            new_interval = self.polling_interval
+
+        if new_interval == interval:
+            return False
+
+        _LOGGER.debug(
+            "Google Wifi polling interval of %s set to %s seconds",
+            self.system_id,
+            new_interval,
+        )
+        self.update_interval = timedelta(seconds=new_interval)
+        if new_interval < interval:
+            self.async_poll_in(new_interval)
+        return True
 
 
 class GoogleWifiEntity(CoordinatorEntity):
@@ -267,6 +1463,7 @@ class GoogleWifiEntity(CoordinatorEntity):
         self._system_id = system_id
         self._item_id = item_id
         self._attrs = {}
+        self._pending = None
 
     @property
     def unique_id(self) -> str:
@@ -286,7 +1483,6 @@ class GoogleWifiEntity(CoordinatorEntity):
     @property
     def extra_state_attributes(self):
         """Return the attributes."""
-        self._attrs["system"] = self._system_id
         return self._attrs
 
     @property
@@ -294,22 +1490,100 @@ class GoogleWifiEntity(CoordinatorEntity):
         """Return option setting to enable or disable by default."""
         return self.coordinator.add_disabled
 
+    @property
+    def available(self) -> bool:
+        """Return True if the last poll of the system succeeded."""
+        return self.coordinator.system_available(self._system_id)
+
     async def async_added_to_hass(self):
         """When entity is added to HASS."""
+        self._update_attrs()
         self.async_on_remove(self.coordinator.async_add_listener(self._update_callback))
 
+        if self._item_id:
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self.hass,
+                    f"{SIGNAL_DELETE_DEVICE}_{self._system_id}_{self._item_id}",
+                    self._delete_callback,
+                )
+            )
+
     @callback
     def _update_callback(self):
-        """Handle device update."""
+        """Handle device update, skipping entities whose data did not change."""
+        if not self._slice_changed():
+            self.coordinator.skipped_writes += 1
+            return
+
+        self.coordinator.state_writes += 1
+        self._async_write_state()
+
+    @callback
+    def _async_write_state(self):
+        """Recompute the state from the coordinator data and write it."""
+        self._update_attrs()
         self.async_write_ha_state()
 
+    @callback
+    def _update_attrs(self):
+        """Compute the state and attributes from the coordinator data.
+
+        Runs once per written update, so the properties read by Home
+        Assistant are plain attribute lookups. Platforms extend it.
+        """
+        self._attrs["system"] = self._system_id
+        if self.coordinator.stale:
+            self._attrs["stale"] = True
+        else:
+            self._attrs.pop("stale", None)
+
+    def _slice_changed(self):
+        """Return True if the coordinator data for this entity changed."""
+        return self.coordinator.has_changed(self._system_id, self._item_id)
+
+    @callback
+    def _start_command(self, value, previous):
+        """Show an optimistic value until a snapshot confirms the command.
+
+        Returns the failure callback to hand to the command queue.
+        """
+        pending = self._pending = PendingCommand(value, previous)
+        self.coordinator.async_note_command(self._system_id)
+        self._async_write_state()
+
+        @callback
+        def async_failed():
+            pending.failed = True
+            if self.hass and self._pending is pending:
+                self._async_write_state()
+
+        return async_failed
+
+    def _resolve_pending(self, observed):
+        """Resolve the pending command against the latest snapshot.
+
+        Returns True if the pending command was cleared.
+        """
+        if self._pending is None:
+            return False
+
+        result = self._pending.resolve(observed, COMMAND_CONFIRM_TIMEOUT)
+
+        if result is None:
+            return False
+
+        self.coordinator.async_record_command(
+            self.platform.domain, result, self._pending.elapsed
+        )
+        self._pending = None
+        return True
+
     async def _delete_callback(self, device_id):
         """Remove the device when it disappears."""
 
         if device_id == self._unique_id:
-            entity_registry = (
-                await self.hass.helpers.entity_registry.async_get_registry()
-            )
+            entity_registry = er.async_get(self.hass)
 
             if entity_registry.async_is_registered(self.entity_id):
                 entity_entry = entity_registry.async_get(self.entity_id)
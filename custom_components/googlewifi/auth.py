@@ -0,0 +1,95 @@
+"""Cached authentication for the Google Wifi API."""
+import asyncio
+from hashlib import sha256
+import time
+
+from googlewifi import GoogleWifi
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    API_TOKEN_LIFETIME,
+    API_TOKEN_REFRESH_MARGIN,
+    STORAGE_VERSION,
+    TOKEN_CACHE,
+    TOKEN_STORAGE_KEY,
+)
+
+
+@callback
+def async_get_token_cache(hass: HomeAssistant):
+    """Return the token cache shared by the config flow and the entries."""
+    if TOKEN_CACHE not in hass.data:
+        hass.data[TOKEN_CACHE] = TokenCache(hass)
+
+    return hass.data[TOKEN_CACHE]
+
+
+class TokenCache:
+    """Cache the tokens issued for a refresh token until shortly before expiry.
+
+    A GoogleWifi client without tokens exchanges the refresh token for an
+    access token and then an API token, two round trips for every setup,
+    reload and reconnect. The issued tokens are kept in memory and in a Store
+    with their expiry and handed to new clients while they are still valid.
+    The Google Wifi API does not report the expiry, so the documented one
+    hour lifetime of the issued token is assumed.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the cache."""
+        self._store = Store(hass, STORAGE_VERSION, TOKEN_STORAGE_KEY, private=True)
+        self._tokens = None
+        self._lock = asyncio.Lock()
+        self.exchanges = 0
+        self.hits = 0
+
+    async def async_connect(self, api: GoogleWifi, refresh_token: str) -> bool:
+        """Authenticate a client, reusing cached tokens when they are valid."""
+        key = _token_key(refresh_token)
+
+        async with self._lock:
+            if self._tokens is None:
+                self._tokens = await self._store.async_load() or {}
+
+            cached = self._tokens.get(key)
+            if cached and cached["expires"] - API_TOKEN_REFRESH_MARGIN > time.time():
+                if api._api_token != cached["api_token"]:
+                    api._access_token = cached["access_token"]
+                    api._api_token = cached["api_token"]
+                    self.hits += 1
+                return True
+
+            api._access_token = None
+            api._api_token = None
+            if not await api.connect():
+                return False
+
+            self.exchanges += 1
+            self._tokens[key] = {
+                "access_token": api._access_token,
+                "api_token": api._api_token,
+                "expires": time.time() + API_TOKEN_LIFETIME,
+            }
+            await self._store.async_save(self._tokens)
+
+        return True
+
+    async def async_invalidate(self, refresh_token: str):
+        """Forget the tokens of a refresh token after they were rejected."""
+        async with self._lock:
+            if self._tokens and self._tokens.pop(_token_key(refresh_token), None):
+                await self._store.async_save(self._tokens)
+
+    def expires_in(self, refresh_token: str):
+        """Return the seconds until the cached token expires, or None."""
+        cached = (self._tokens or {}).get(_token_key(refresh_token))
+        if cached is None:
+            return None
+
+        return max(0, cached["expires"] - time.time())
+
+
+def _token_key(refresh_token: str) -> str:
+    """Return the key the tokens of a refresh token are stored under."""
+    return sha256(refresh_token.encode()).hexdigest()
@@ -1,7 +1,9 @@
 """Definition and setup of the Google Wifi Sensors for Home Assistant."""
+from statistics import median
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.const import ATTR_NAME
+from homeassistant.core import callback
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
@@ -36,28 +38,10 @@ async def async_setup_entry(hass, entry, async_add_entities):
         )
         entities.append(entity)
 
-        for ap_id, access_point in system["access_points"].items():
-            ap_name = "Google Access Point"
-
-            if access_point["accessPointSettings"].get("accessPointOtherSettings"):
-                if access_point["accessPointSettings"]["accessPointOtherSettings"].get(
-                    "apName"
-                ):
-                    ap_name = access_point["accessPointSettings"][
-                        "accessPointOtherSettings"
-                    ]["apName"]
-
-                if access_point["accessPointSettings"]["accessPointOtherSettings"].get(
-                    "roomData"
-                ):
-                    if access_point["accessPointSettings"]["accessPointOtherSettings"][
-                        "roomData"
-                    ].get("name"):
-                        ap_name = f"{access_point['accessPointSettings']['accessPointOtherSettings']['roomData']['name']} Access Point"
-
+        for ap_id, access_point in system.access_points.items():
             entity = GoogleWifiBinarySensor(
                 coordinator=coordinator,
-                name=ap_name,
+                name=access_point.name,
                 icon=DEFAULT_ICON,
                 system_id=system_id,
                 item_id=ap_id,
@@ -92,69 +76,72 @@ class GoogleWifiBinarySensor(GoogleWifiEntity, BinarySensorEntity):
         self._state = None
         self._device_info = None
 
-    @property
-    def is_on(self) -> bool:
-        """Return the on/off state of the sensor."""
-
         try:
-            state = False
+            device_info = {
+                ATTR_MANUFACTURER: DEV_MANUFACTURER,
+                ATTR_NAME: self._name,
+            }
 
             if self._item_id:
-                if (
-                    self.coordinator.data[self._system_id]["access_points"][
-                        self._item_id
-                    ]["status"]
-                    == "AP_ONLINE"
-                ):
-                    state = True
+                device_info[ATTR_IDENTIFIERS] = {(DOMAIN, self._item_id)}
+                this_data = coordinator.data[self._system_id].access_points[
+                    self._item_id
+                ]
+                device_info[ATTR_MANUFACTURER] = this_data.hardware_type
+                device_info[ATTR_SW_VERSION] = this_data.firmware_version
+                device_info["via_device"] = (DOMAIN, self._system_id)
             else:
-                if self.coordinator.data[self._system_id]["status"] == "WAN_ONLINE":
-                    state = True
+                device_info[ATTR_IDENTIFIERS] = {(DOMAIN, self._system_id)}
+                device_info[ATTR_MODEL] = "Google Wifi"
+                device_info[ATTR_SW_VERSION] = coordinator.data[
+                    self._system_id
+                ].firmware_version
 
-            self._state = state
+            self._device_info = device_info
         except TypeError:
             pass
         except KeyError:
             pass
 
+    @property
+    def is_on(self) -> bool:
+        """Return the on/off state of the sensor."""
         return self._state
 
     @property
     def device_info(self):
         """Define the device as an individual Google WiFi system."""
+        return self._device_info
+
+    @callback
+    def _update_attrs(self):
+        """Compute the state, with polling and command stats on the system."""
+        super()._update_attrs()
 
         try:
-            device_info = {
-                ATTR_MANUFACTURER: DEV_MANUFACTURER,
-                ATTR_NAME: self._name,
-            }
+            system = self.coordinator.data[self._system_id]
 
             if self._item_id:
-                device_info[ATTR_IDENTIFIERS] = {(DOMAIN, self._item_id)}
-                this_data = self.coordinator.data[self._system_id]["access_points"][
-                    self._item_id
-                ]
-                device_info[ATTR_MANUFACTURER] = this_data["accessPointProperties"][
-                    "hardwareType"
-                ]
-                device_info[ATTR_SW_VERSION] = this_data["accessPointProperties"][
-                    "firmwareVersion"
-                ]
-                device_info["via_device"] = (DOMAIN, self._system_id)
+                self._state = system.access_points[self._item_id].status == "AP_ONLINE"
             else:
-                device_info[ATTR_IDENTIFIERS] = {(DOMAIN, self._system_id)}
-                device_info[ATTR_MODEL] = "Google Wifi"
-                device_info[ATTR_SW_VERSION] = self.coordinator.data[self._system_id][
-                    "groupProperties"
-                ]["otherProperties"]["firmwareVersion"]
-
-            self._device_info = device_info
+                self._state = system.status == "WAN_ONLINE"
         except TypeError:
             pass
         except KeyError:
             pass
 
-        return self._device_info
+        if not self._item_id:
+            attrs = self._attrs
+            attrs["polling_interval"] = (
+                self.coordinator.system_updater(self._system_id)
+                .update_interval.total_seconds()
+            )
+            attrs["commands_sent"] = self.coordinator.commands.sent
+            attrs["commands_collapsed"] = self.coordinator.commands.collapsed
+            attrs["command_latency"] = {
+                platform: median(samples)
+                for platform, samples in self.coordinator.command_latency.items()
+            }
 
     async def async_reset_device(self):
         """Reset the network or specific access point."""
@@ -0,0 +1,180 @@
+"""Coalescing command queue for the Google Wifi API."""
+import asyncio
+import logging
+import time
+
+from aiohttp import ClientError
+from googlewifi import GoogleHomeIgnoreDevice, GoogleWifiException
+from homeassistant.core import HomeAssistant, callback
+
+from .const import COMMAND_DEBOUNCE
+
+_LOGGER = logging.getLogger(__name__)
+
+COMMAND_ERRORS = (
+    GoogleWifiException,
+    GoogleHomeIgnoreDevice,
+    ConnectionError,
+    ClientError,
+    asyncio.TimeoutError,
+    ValueError,
+    AttributeError,
+)
+
+
+class CommandQueue:
+    """Debounce, collapse and serialize commands sent to the Google Wifi API.
+
+    Commands are keyed by system and target (a device or access point id).
+    A command waits for the debounce delay and is replaced if another command
+    for the same target arrives first, so only the last desired state is
+    sent. Commands for the same system are sent one at a time and in order.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, on_sent=None, delay: float = COMMAND_DEBOUNCE
+    ):
+        """Initialize the queue."""
+        self._hass = hass
+        self._on_sent = on_sent
+        self._delay = delay
+        self._pending = {}
+        self._timers = {}
+        self._locks = {}
+        self._tasks = set()
+        self.sent = 0
+        self.collapsed = 0
+        self.failed = 0
+
+    @callback
+    def async_submit(self, system_id: str, target: str, func, *args, on_failure=None):
+        """Queue a command, replacing a pending command for the same target."""
+        key = (system_id, target)
+
+        if key in self._pending:
+            self.collapsed += 1
+            self._timers.pop(key).cancel()
+
+        self._pending[key] = (func, args, on_failure)
+        self._timers[key] = self._hass.loop.call_later(
+            self._delay, self._async_flush, key
+        )
+
+    @callback
+    def _async_flush(self, key):
+        """Send the pending command of a target once the delay has passed."""
+        self._timers.pop(key, None)
+        command = self._pending.pop(key, None)
+
+        if command is None:
+            return
+
+        task = self._hass.async_create_background_task(
+            self._async_send(key, *command), f"googlewifi command {key[1]}"
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def async_send(self, system_id: str, target: str, func, *args) -> bool:
+        """Send a command right away, in order with the queued commands.
+
+        A pending command for the same target is dropped, as this one
+        replaces it. Returns True if the command was accepted.
+        """
+        key = (system_id, target)
+
+        if key in self._pending:
+            self.collapsed += 1
+            self._timers.pop(key).cancel()
+            del self._pending[key]
+
+        if not await self._async_call(key, func, args):
+            self.failed += 1
+            return False
+
+        self.sent += 1
+        return True
+
+    async def _async_send(self, key, func, args, on_failure):
+        """Send a queued command and report how it went."""
+        _system_id, target = key
+
+        if not await self._async_call(key, func, args):
+            self.failed += 1
+            if on_failure:
+                on_failure()
+            return
+
+        self.sent += 1
+        _LOGGER.debug(
+            "Google Wifi command for %s sent (%s sent, %s collapsed)",
+            target,
+            self.sent,
+            self.collapsed,
+        )
+
+        if self._on_sent:
+            await self._on_sent()
+
+    async def _async_call(self, key, func, args) -> bool:
+        """Call the API while holding the lock of the system.
+
+        Returns False if the call raised or the API rejected the command.
+        """
+        system_id, target = key
+        lock = self._locks.setdefault(system_id, asyncio.Lock())
+
+        async with lock:
+            try:
+                return await func(*args) is not False
+            except COMMAND_ERRORS as error:
+                _LOGGER.warning("Google Wifi command for %s failed: %s", target, error)
+                return False
+
+    async def async_shutdown(self):
+        """Drop pending commands and cancel the ones in flight."""
+        for timer in self._timers.values():
+            timer.cancel()
+
+        self._timers.clear()
+        self._pending.clear()
+
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+class PendingCommand:
+    """An optimistic entity value waiting to be confirmed by a snapshot."""
+
+    __slots__ = ("value", "previous", "started", "failed")
+
+    def __init__(self, value, previous):
+        """Initialize the pending command."""
+        self.value = value
+        self.previous = previous
+        self.started = time.monotonic()
+        self.failed = False
+
+    @property
+    def elapsed(self) -> float:
+        """Return the seconds since the command was issued."""
+        return time.monotonic() - self.started
+
+    def resolve(self, observed, timeout: float):
+        """Compare the command with the value observed in a snapshot.
+
+        Returns None while the command is still pending, otherwise one of
+        "confirmed", "contradicted", "failed" or "expired".
+        """
+        if observed == self.value:
+            return "confirmed"
+        if self.failed:
+            return "failed"
+        if observed != self.previous:
+            return "contradicted"
+        if self.elapsed > timeout:
+            return "expired"
+
+        return None
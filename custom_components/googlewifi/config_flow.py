@@ -2,26 +2,57 @@
 import logging
 
 import voluptuous as vol
-from googlewifi import GoogleWifi
+from aiohttp import ClientError
+from googlewifi import GoogleHomeIgnoreDevice, GoogleWifi, GoogleWifiException
 from homeassistant import config_entries
 from homeassistant.const import (
+    CONF_NAME,
     CONF_SCAN_INTERVAL,
     UnitOfDataRate
 )
 from homeassistant.core import callback
-from homeassistant.helpers import aiohttp_client, config_entry_flow
+from homeassistant.helpers import config_entry_flow
 
+from .auth import async_get_token_cache
 from .const import (
     ADD_DISABLED,
+    CONF_ADAPTIVE_POLLING,
+    CONF_DATA_USAGE,
+    CONF_DEVICE_FILTER,
+    CONF_DEVICE_FILTER_MODE,
+    CONF_MAIN_NETWORK_ONLY,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
     CONF_SPEED_UNITS,
     CONF_SPEEDTEST,
     CONF_SPEEDTEST_INTERVAL,
+    CONF_SPEEDTEST_PARALLEL,
+    CONF_TRAFFIC_STATISTICS,
+    CONF_TRACKERS_ONLY,
+    CONF_TRAFFIC_WINDOW,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_DATA_USAGE,
+    DEFAULT_DEVICE_FILTER_MODE,
+    DEFAULT_MAIN_NETWORK_ONLY,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_SPEEDTEST,
     DEFAULT_SPEEDTEST_INTERVAL,
+    DEFAULT_SPEEDTEST_PARALLEL,
+    DEFAULT_TRAFFIC_STATISTICS,
+    DEFAULT_TRACKERS_ONLY,
+    DEFAULT_NAME,
+    DEFAULT_TRAFFIC_WINDOW,
     DOMAIN,
+    FILTER_ALLOW,
+    FILTER_DENY,
+    FILTER_OFF,
+    MAX_TRAFFIC_WINDOW,
     POLLING_INTERVAL,
     REFRESH_TOKEN,
+    account_unique_id,
 )
+from .session import async_get_session
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,34 +73,47 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle the initial step."""
         errors = {}
 
-        config_entry = self.hass.config_entries.async_entries(DOMAIN)
-        if config_entry:
-            return self.async_abort(reason="single_instance_allowed")
-
         if user_input is not None:
-            session = aiohttp_client.async_get_clientsession(self.hass)
-
-            token = user_input[REFRESH_TOKEN]
-            api_client = GoogleWifi(token, session)
+            name = user_input[CONF_NAME].strip()
 
             try:
-                await api_client.connect()
+                systems = await self._async_fetch_systems(user_input[REFRESH_TOKEN])
             except ValueError:
                 errors["base"] = "invalid_auth"
-            except ConnectionError:
+            except (
+                ConnectionError,
+                ClientError,
+                GoogleHomeIgnoreDevice,
+                GoogleWifiException,
+            ):
                 errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                await self.async_set_unique_id(user_input[REFRESH_TOKEN])
+                # The systems identify the account; the token does not, as
+                # every token issued for the account is different.
+                await self.async_set_unique_id(account_unique_id(systems))
                 self._abort_if_unique_id_configured()
-                return self.async_create_entry(title="Google Wifi", data=user_input)
+
+                if any(
+                    entry.title == name for entry in self._async_current_entries()
+                ):
+                    errors[CONF_NAME] = "name_exists"
+                else:
+                    return self.async_create_entry(
+                        title=name,
+                        data={
+                            REFRESH_TOKEN: user_input[REFRESH_TOKEN],
+                            ADD_DISABLED: user_input[ADD_DISABLED],
+                        },
+                    )
 
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema(
                 {
+                    vol.Required(CONF_NAME, default=DEFAULT_NAME): str,
                     vol.Required(REFRESH_TOKEN): str,
                     vol.Required(ADD_DISABLED, default=True): bool,
                 }
@@ -77,6 +121,20 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def _async_fetch_systems(self, token):
+        """Authenticate a refresh token and return the systems of its account.
+
+        Raises ValueError if the token is not accepted.
+        """
+        api_client = GoogleWifi(token, async_get_session(self.hass))
+        await async_get_token_cache(self.hass).async_connect(api_client, token)
+
+        systems = await api_client.get_systems()
+        if not systems:
+            raise ValueError("The refresh token was not accepted")
+
+        return systems
+
 
 class OptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options flow changes."""
@@ -104,6 +162,30 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         vol.Coerce(int),
                         vol.Range(min=3),
                     ),
+                    vol.Optional(
+                        CONF_ADAPTIVE_POLLING,
+                        default=self.config_entry.options.get(
+                            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_MIN_SCAN_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=3),
+                    ),
+                    vol.Optional(
+                        CONF_MAX_SCAN_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=3),
+                    ),
                     vol.Optional(
                         CONF_SPEEDTEST,
                         default=self.config_entry.options.get(
@@ -116,6 +198,64 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             CONF_SPEEDTEST_INTERVAL, DEFAULT_SPEEDTEST_INTERVAL
                         ),
                     ): vol.Coerce(int),
+                    vol.Optional(
+                        CONF_SPEEDTEST_PARALLEL,
+                        default=self.config_entry.options.get(
+                            CONF_SPEEDTEST_PARALLEL, DEFAULT_SPEEDTEST_PARALLEL
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=1),
+                    ),
+                    vol.Optional(
+                        CONF_TRAFFIC_STATISTICS,
+                        default=self.config_entry.options.get(
+                            CONF_TRAFFIC_STATISTICS, DEFAULT_TRAFFIC_STATISTICS
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_TRAFFIC_WINDOW,
+                        default=self.config_entry.options.get(
+                            CONF_TRAFFIC_WINDOW, DEFAULT_TRAFFIC_WINDOW
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=1, max=MAX_TRAFFIC_WINDOW),
+                    ),
+                    vol.Optional(
+                        CONF_DATA_USAGE,
+                        default=self.config_entry.options.get(
+                            CONF_DATA_USAGE, DEFAULT_DATA_USAGE
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_DEVICE_FILTER_MODE,
+                        default=self.config_entry.options.get(
+                            CONF_DEVICE_FILTER_MODE, DEFAULT_DEVICE_FILTER_MODE
+                        ),
+                    ): vol.In(
+                        {
+                            FILTER_OFF: "All devices",
+                            FILTER_ALLOW: "Only listed devices",
+                            FILTER_DENY: "All but listed devices",
+                        }
+                    ),
+                    vol.Optional(
+                        CONF_DEVICE_FILTER,
+                        default=self.config_entry.options.get(CONF_DEVICE_FILTER, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_MAIN_NETWORK_ONLY,
+                        default=self.config_entry.options.get(
+                            CONF_MAIN_NETWORK_ONLY, DEFAULT_MAIN_NETWORK_ONLY
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_TRACKERS_ONLY,
+                        default=self.config_entry.options.get(
+                            CONF_TRACKERS_ONLY, DEFAULT_TRACKERS_ONLY
+                        ),
+                    ): bool,
                     vol.Optional(
                         CONF_SPEED_UNITS,
                         default=self.config_entry.options.get(
@@ -6,6 +6,7 @@ from homeassistant.const import (
 )
 
 DOMAIN = "googlewifi"
+DEFAULT_NAME = "Google Wifi"
 COORDINATOR = "coordinator"
 GOOGLEWIFI_API = "googlewifi_api"
 ATTR_IDENTIFIERS = "identifiers"
@@ -14,37 +15,89 @@ ATTR_MODEL = "model"
 ATTR_SW_VERSION = "sw_version"
 ATTR_CONNECTIONS = "connections"
 POLLING_INTERVAL = 30
+SYSTEM_REFRESH_INTERVAL = 300
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+DEFAULT_ADAPTIVE_POLLING = False
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+DEFAULT_MIN_SCAN_INTERVAL = 10
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+DEFAULT_MAX_SCAN_INTERVAL = 300
+RECONNECT_MAX_INTERVAL = 900
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_COOLDOWN = 600
+STORAGE_VERSION = 1
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.snapshot"
+SNAPSHOT_SAVE_DELAY = 30
+HTTP_SESSION = f"{DOMAIN}_session"
+HTTP_CONNECTIONS_PER_HOST = 10
+HTTP_KEEPALIVE_TIMEOUT = 120
+HTTP_DNS_CACHE_TTL = 300
+TOKEN_CACHE = f"{DOMAIN}_tokens"
+TOKEN_STORAGE_KEY = f"{DOMAIN}.tokens"
+API_TOKEN_LIFETIME = 3600
+API_TOKEN_REFRESH_MARGIN = 300
+TIMING_SAMPLES = 100
+SPEEDTEST_HISTORY = 20
+DEFAULT_NETMASK = "255.255.255.0"
+POLL_PHASES = ("poll", "fetch", "classify", "dispatch", "diff", "write", "speedtest")
 REFRESH_TOKEN = "refresh_token"
 DEV_MANUFACTURER = "Google"
 DEV_CLIENT_MODEL = "Connected Client"
 DEFAULT_ICON = "mdi:wifi"
-PAUSE_UPDATE = 15
+COMMAND_DEBOUNCE = 1
+COMMAND_CONFIRM_TIMEOUT = 60
+COMMAND_LATENCY_SAMPLES = 50
 ADD_DISABLED = "add_disabled"
 CONF_SPEEDTEST = "auto_speedtest"
 DEFAULT_SPEEDTEST = True
 CONF_SPEEDTEST_INTERVAL = "speedtest_interval"
 DEFAULT_SPEEDTEST_INTERVAL = 24
+CONF_SPEEDTEST_PARALLEL = "speedtest_parallel"
+DEFAULT_SPEEDTEST_PARALLEL = 3
+CONF_TRAFFIC_STATISTICS = "traffic_statistics"
+DEFAULT_TRAFFIC_STATISTICS = False
+CONF_TRAFFIC_WINDOW = "traffic_window"
+DEFAULT_TRAFFIC_WINDOW = 60
+MAX_TRAFFIC_WINDOW = 720
+TRAFFIC_MAX_SAMPLES = 720
+CONF_DATA_USAGE = "data_usage"
+DEFAULT_DATA_USAGE = False
+DATA_USAGE_STORAGE_KEY = f"{DOMAIN}.usage"
+DATA_USAGE_SAVE_DELAY = 300
+DATA_USAGE_MAX_GAP = 900
+TOP_DEVICES = 10
+CONF_DEVICE_FILTER_MODE = "device_filter_mode"
+CONF_DEVICE_FILTER = "device_filter"
+FILTER_OFF = "off"
+FILTER_ALLOW = "allow"
+FILTER_DENY = "deny"
+DEFAULT_DEVICE_FILTER_MODE = FILTER_OFF
+CONF_MAIN_NETWORK_ONLY = "main_network_only"
+DEFAULT_MAIN_NETWORK_ONLY = False
+CONF_TRACKERS_ONLY = "trackers_only"
+DEFAULT_TRACKERS_ONLY = False
 CONF_SPEED_UNITS = "speed_units"
 SIGNAL_ADD_DEVICE = "googlewifi_add_device"
 SIGNAL_DELETE_DEVICE = "googlewifi_delete_device"
 
 
+DATA_RATE_FACTORS = {
+    UnitOfDataRate.BYTES_PER_SECOND: 0.125,
+    UnitOfDataRate.KILOBYTES_PER_SECOND: 0.000125,
+    UnitOfDataRate.MEGABYTES_PER_SECOND: 1.25e-7,
+    UnitOfDataRate.GIGABYTES_PER_SECOND: 1.25e-10,
+    UnitOfDataRate.KILOBITS_PER_SECOND: 0.001,
+    UnitOfDataRate.MEGABITS_PER_SECOND: 1e-6,
+    UnitOfDataRate.GIGABITS_PER_SECOND: 1e-9,
+}
+
+
 def unit_convert(data_rate: float, unit_of_measurement: str):
     """Convert the speed based on unit of measure."""
 
-    if unit_of_measurement == UnitOfDataRate.BYTES_PER_SECOND:
-        data_rate *= 0.125
-    elif unit_of_measurement == UnitOfDataRate.KILOBYTES_PER_SECOND:
-        data_rate *= 0.000125
-    elif unit_of_measurement == UnitOfDataRate.MEGABYTES_PER_SECOND:
-        data_rate *= 1.25e-7
-    elif unit_of_measurement == UnitOfDataRate.GIGABYTES_PER_SECOND:
-        data_rate *= 1.25e-10
-    elif unit_of_measurement == UnitOfDataRate.KILOBITS_PER_SECOND:
-        data_rate *= 0.001
-    elif unit_of_measurement == UnitOfDataRate.MEGABITS_PER_SECOND:
-        data_rate *= 1e-6
-    elif unit_of_measurement == UnitOfDataRate.GIGABITS_PER_SECOND:
-        data_rate *= 1e-9
-
-    return round(data_rate, 2)
+    return round(data_rate * DATA_RATE_FACTORS.get(unit_of_measurement, 1), 2)
+
+
+def account_unique_id(system_ids) -> str:
+    """Return the unique id of the account that manages the given systems."""
+    return ",".join(sorted(system_ids))
@@ -0,0 +1,90 @@
+"""Per-system index of the client devices known to the Google Wifi integration."""
+
+
+class DeviceRecord:
+    """Bookkeeping for a single known client device."""
+
+    __slots__ = ("system_id", "device_id", "first_seen")
+
+    def __init__(self, system_id: str, device_id: str, generation: int):
+        """Initialize the record."""
+        self.system_id = system_id
+        self.device_id = device_id
+        self.first_seen = generation
+
+    def __repr__(self):
+        """Return a readable representation of the record."""
+        return (
+            f"DeviceRecord({self.system_id!r}, {self.device_id!r}, "
+            f"first_seen={self.first_seen})"
+        )
+
+
+class DeviceIndex:
+    """Index the known devices of every system by id.
+
+    Joins and leaves are found with set operations against the key views of
+    the index and the polled payload, so nothing is removed from a container
+    while it is being iterated, membership tests are O(1) and the index is
+    only written for the devices that joined or left.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.generation = 0
+        self._systems = {}
+
+    def __contains__(self, key) -> bool:
+        """Return True if a (system_id, device_id) pair is known."""
+        system_id, device_id = key
+        return device_id in self._systems.get(system_id, ())
+
+    def __len__(self) -> int:
+        """Return the number of known devices over all systems."""
+        return sum(len(devices) for devices in self._systems.values())
+
+    def get(self, system_id: str, device_id: str):
+        """Return the record of a known device or None."""
+        return self._systems.get(system_id, {}).get(device_id)
+
+    def devices(self, system_id: str):
+        """Return the known device ids of a system."""
+        return self._systems.get(system_id, {}).keys()
+
+    def next_generation(self) -> int:
+        """Start a new poll generation."""
+        self.generation += 1
+        return self.generation
+
+    def update(self, system_id: str, devices: dict):
+        """Reconcile a system with the devices in the latest poll.
+
+        Returns a tuple of the joined and the left device ids.
+        """
+        known = self._systems.setdefault(system_id, {})
+        generation = self.generation
+
+        joined = devices.keys() - known.keys()
+        left = known.keys() - devices.keys()
+
+        for device_id in left:
+            del known[device_id]
+
+        for device_id in joined:
+            known[device_id] = DeviceRecord(system_id, device_id, generation)
+
+        return joined, left
+
+    def prune(self, system_ids) -> list:
+        """Forget systems that are no longer on the account.
+
+        Returns the (system_id, device_id) pairs that were removed.
+        """
+        removed = []
+
+        for system_id in self._systems.keys() - set(system_ids):
+            removed.extend(
+                (system_id, device_id) for device_id in self._systems.pop(system_id)
+            )
+
+        return removed
@@ -4,6 +4,7 @@ from homeassistant.components.device_tracker.config_entry import ScannerEntity
 from homeassistant.components.device_tracker.const import DOMAIN as DEVICE_TRACKER
 from homeassistant.components.device_tracker.const import SourceType
 from homeassistant.const import ATTR_NAME
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
@@ -28,16 +29,11 @@ async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
     entities = []
 
-    for system_id, system in coordinator.data.items():
-        for dev_id, device in system["devices"].items():
-            device_name = f"{device['friendlyName']}"
-
-            if device.get("friendlyType"):
-                device_name = device_name + f" ({device['friendlyType']})"
-
+    for system_id in coordinator.data:
+        for dev_id, device in coordinator.entity_devices(system_id).items():
             entity = GoogleWifiDeviceTracker(
                 coordinator=coordinator,
-                name=device_name,
+                name=device.name,
                 icon=DEFAULT_ICON,
                 system_id=system_id,
                 item_id=dev_id,
@@ -46,28 +42,27 @@ async def async_setup_entry(hass, entry, async_add_entities):
 
     async_add_entities(entities)
 
-    async def async_new_entities(device_info):
-        """Add new entities when they connect to Google Wifi."""
-        system_id = device_info["system_id"]
-        device_id = device_info["device_id"]
-        device = device_info["device"]
-
-        device_name = f"{device['friendlyName']}"
-
-        if device.get("friendlyType"):
-            device_name = device_name + f" ({device['friendlyType']})"
-
-        entity = GoogleWifiDeviceTracker(
-            coordinator=coordinator,
-            name=device_name,
-            icon=DEFAULT_ICON,
-            system_id=system_id,
-            item_id=device_id,
+    @callback
+    def async_new_entities(new_devices):
+        """Add the devices that connected to Google Wifi since the last poll."""
+        async_add_entities(
+            [
+                GoogleWifiDeviceTracker(
+                    coordinator=coordinator,
+                    name=device_info["device"].name,
+                    icon=DEFAULT_ICON,
+                    system_id=device_info["system_id"],
+                    item_id=device_info["device_id"],
+                )
+                for device_info in new_devices
+            ]
         )
-        entities = [entity]
-        async_add_entities(entities)
 
-    async_dispatcher_connect(hass, SIGNAL_ADD_DEVICE, async_new_entities)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, f"{SIGNAL_ADD_DEVICE}_{entry.entry_id}", async_new_entities
+        )
+    )
 
 
 class GoogleWifiDeviceTracker(GoogleWifiEntity, ScannerEntity):
@@ -86,65 +81,17 @@ class GoogleWifiDeviceTracker(GoogleWifiEntity, ScannerEntity):
         self._is_connected = None
         self._mac = None
 
-    @property
-    def is_connected(self):
-        """Return true if the device is connected."""
         try:
-            if self.coordinator.data[self._system_id]["devices"][self._item_id].get(
-                "connected"
-            ):
-                connected_ap = self.coordinator.data[self._system_id]["devices"][
-                    self._item_id
-                ].get("apId")
-                if connected_ap:
-                    connected_ap = self.coordinator.data[self._system_id][
-                        "access_points"
-                    ][connected_ap]["accessPointSettings"]["accessPointOtherSettings"][
-                        "roomData"
-                    ][
-                        "name"
-                    ]
-                    self._attrs["connected_ap"] = connected_ap
-                else:
-                    self._attrs["connected_ap"] = "NA"
-
-                self._attrs["ip_address"] = self.coordinator.data[self._system_id][
-                    "devices"
-                ][self._item_id].get("ipAddress", "NA")
-
-                self._mac = self.coordinator.data[self._system_id]["devices"][
-                    self._item_id
-                ].get("macAddress")
-
-                self._attrs["mac"] = self._mac if self._mac else "NA"
-
-                self._is_connected = True
-            else:
-                self._is_connected = False
-        except TypeError:
-            pass
-        except KeyError:
+            self._mac = coordinator.data[system_id].devices[item_id].mac_address
+        except (TypeError, KeyError):
             pass
-            # self.hass.async_create_task(
-            #    self.hass.config_entries.async_reload(self.coordinator.entry.entry_id)
-            # )
-
-        return self._is_connected
-
-    @property
-    def source_type(self):
-        """Return the source type of the client."""
-        return SourceType.ROUTER
 
-    @property
-    def device_info(self):
-        """Define the device as a device tracker system."""
         if self._mac:
             mac = {(CONNECTION_NETWORK_MAC, self._mac)}
         else:
             mac = {}
 
-        device_info = {
+        self._attr_device_info = {
             ATTR_IDENTIFIERS: {(DOMAIN, self._item_id)},
             ATTR_NAME: self._name,
             ATTR_CONNECTIONS: mac,
@@ -153,4 +100,40 @@ class GoogleWifiDeviceTracker(GoogleWifiEntity, ScannerEntity):
             "via_device": (DOMAIN, self._system_id),
         }
 
-        return device_info
+    @property
+    def is_connected(self):
+        """Return true if the device is connected."""
+        return self._is_connected
+
+    @property
+    def source_type(self):
+        """Return the source type of the client."""
+        return SourceType.ROUTER
+
+    @callback
+    def _update_attrs(self):
+        """Compute the connection and attributes from the coordinator data."""
+        super()._update_attrs()
+
+        try:
+            system = self.coordinator.data[self._system_id]
+            device = system.devices[self._item_id]
+        except (TypeError, KeyError):
+            return
+
+        if not device.connected:
+            self._is_connected = False
+            return
+
+        if device.ap_id and device.ap_id in system.access_points:
+            self._attrs["connected_ap"] = system.access_points[device.ap_id].room_name
+        else:
+            self._attrs["connected_ap"] = "NA"
+
+        self._attrs["ip_address"] = device.ip_address or "NA"
+
+        self._mac = device.mac_address
+
+        self._attrs["mac"] = self._mac if self._mac else "NA"
+
+        self._is_connected = True
@@ -0,0 +1,96 @@
+"""Diagnostics support for Google Wifi."""
+from collections import Counter
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .const import CONF_DEVICE_FILTER, COORDINATOR, DOMAIN, REFRESH_TOKEN
+
+TO_REDACT = {CONF_DEVICE_FILTER, REFRESH_TOKEN}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+    systems = coordinator.data or {}
+
+    entity_registry = er.async_get(hass)
+    entities = Counter(
+        entity.domain
+        for entity in er.async_entries_for_config_entry(
+            entity_registry, entry.entry_id
+        )
+    )
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "stale": coordinator.stale,
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "poll_offset": coordinator.poll_offset,
+            "state_writes": coordinator.state_writes,
+            "skipped_writes": coordinator.skipped_writes,
+            "token_expires_in": coordinator.tokens.expires_in(
+                coordinator.refresh_token
+            ),
+            "token_exchanges": coordinator.tokens.exchanges,
+            "system_refreshes": coordinator.system_refreshes,
+            "station_refreshes": coordinator.station_refreshes,
+        },
+        "payload": {
+            "system_response_bytes": coordinator.response_bytes,
+            "station_response_bytes": coordinator.station_response_bytes,
+            "systems": {
+                system_id: {
+                    "access_points": len(system.access_points),
+                    "devices": len(system.devices),
+                    "connected_devices": system.connected_devices,
+                    "guest_devices": system.guest_devices,
+                }
+                for system_id, system in systems.items()
+            },
+        },
+        "entities": dict(entities),
+        "timings": {
+            phase: {
+                **coordinator.timings.stats(phase),
+                "history": coordinator.timings.history(phase),
+            }
+            for phase in coordinator.timings.phases
+        },
+        "system_updaters": {
+            system_id: {
+                "last_update_success": updater.last_update_success,
+                "update_interval": updater.update_interval.total_seconds(),
+                "consecutive_failures": updater.reconnect.failures,
+                "total_failures": updater.reconnect.total_failures,
+                "circuit_open": updater.reconnect.is_open,
+                "timings": {
+                    phase: updater.timings.stats(phase)
+                    for phase in updater.timings.phases
+                },
+            }
+            for system_id, updater in coordinator.system_updaters.items()
+        },
+        "reconnect": {
+            "consecutive_failures": coordinator.reconnect.failures,
+            "total_failures": coordinator.reconnect.total_failures,
+            "reconnects": coordinator.reconnect.reconnects,
+            "circuit_trips": coordinator.reconnect.circuit_trips,
+            "circuit_open": coordinator.reconnect.is_open,
+        },
+        "commands": {
+            "sent": coordinator.commands.sent,
+            "collapsed": coordinator.commands.collapsed,
+            "failed": coordinator.commands.failed,
+        },
+        "speedtest_history": list(coordinator.speedtest_history),
+    }
@@ -1,6 +1,4 @@
 """Support for Google Wifi Router light control."""
-import time
-
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ColorMode,
@@ -8,6 +6,7 @@ from homeassistant.components.light import (
     LightEntityFeature,
 )
 from homeassistant.const import ATTR_NAME
+from homeassistant.core import callback
 
 from . import GoogleWifiEntity, GoogleWiFiUpdater
 from .const import (
@@ -18,7 +17,6 @@ from .const import (
     DEFAULT_ICON,
     DEV_CLIENT_MODEL,
     DOMAIN,
-    PAUSE_UPDATE,
 )
 
 
@@ -29,28 +27,10 @@ async def async_setup_entry(hass, entry, async_add_entities):
     entities = []
 
     for system_id, system in coordinator.data.items():
-        for ap_id, access_point in system["access_points"].items():
-            ap_name = "Google Access Point"
-
-            if access_point["accessPointSettings"].get("accessPointOtherSettings"):
-                if access_point["accessPointSettings"]["accessPointOtherSettings"].get(
-                    "apName"
-                ):
-                    ap_name = access_point["accessPointSettings"][
-                        "accessPointOtherSettings"
-                    ]["apName"]
-
-                if access_point["accessPointSettings"]["accessPointOtherSettings"].get(
-                    "roomData"
-                ):
-                    if access_point["accessPointSettings"]["accessPointOtherSettings"][
-                        "roomData"
-                    ].get("name"):
-                        ap_name = f"{access_point['accessPointSettings']['accessPointOtherSettings']['roomData']['name']} Access Point"
-
+        for ap_id, access_point in system.access_points.items():
             entity = GoogleWifiLight(
                 coordinator=coordinator,
-                name=ap_name,
+                name=access_point.name,
                 icon="mdi:lightbulb",
                 system_id=system_id,
                 item_id=ap_id,
@@ -76,99 +56,97 @@ class GoogleWifiLight(GoogleWifiEntity, LightEntity):
         self._last_brightness = 50
         self._state = None
         self._brightness = None
-        self._last_change = 0
+
+        self._attr_device_info = {
+            ATTR_IDENTIFIERS: {(DOMAIN, self._item_id)},
+            ATTR_NAME: self._name,
+            ATTR_MANUFACTURER: "Google",
+            ATTR_MODEL: DEV_CLIENT_MODEL,
+            "via_device": (DOMAIN, self._system_id),
+        }
+
+    _attr_color_mode = ColorMode.BRIGHTNESS
+    _attr_supported_color_modes = {ColorMode.BRIGHTNESS}
 
     @property
     def is_on(self):
-        since_last = int(time.time()) - self._last_change
-
-        if since_last > PAUSE_UPDATE:
-            """Return the on/off state of the light."""
-            try:
-                if self.coordinator.data[self._system_id]["access_points"][
-                    self._item_id
-                ]["accessPointSettings"]["lightingSettings"].get("intensity"):
-                    self._state = True
-                else:
-                    self._state = False
-            except TypeError:
-                pass
-            except KeyError:
-                pass
-
+        """Return the on/off state of the light."""
         return self._state
 
     @property
     def brightness(self):
         """Return the current brightness of the light."""
-        since_last = int(time.time()) - self._last_change
-
-        if since_last > PAUSE_UPDATE:
-            try:
-                brightness = self.coordinator.data[self._system_id]["access_points"][
-                    self._item_id
-                ]["accessPointSettings"]["lightingSettings"].get("intensity")
-
-                if brightness:
-                    if brightness > 0:
-                        self._last_brightness = brightness
-
-                    self._brightness = brightness * 255 / 100
-                else:
-                    self._brightness = 0
-            except TypeError:
-                pass
-            except KeyError:
-                pass
-
         return self._brightness
 
-    @property
-    def color_mode(self):
-        """Return the color mode of the light."""
-        return ColorMode.BRIGHTNESS
-        
-    @property
-    def supported_color_modes(self):
-        """Return the list of supported color modes."""
-        return {ColorMode.BRIGHTNESS}
+    @callback
+    def _update_attrs(self):
+        """Compute the state and brightness from the coordinator data."""
+        super()._update_attrs()
 
-    @property
-    def device_info(self):
-        """Define the device as a device tracker system."""
-        device_info = {
-            ATTR_IDENTIFIERS: {(DOMAIN, self._item_id)},
-            ATTR_NAME: self._name,
-            ATTR_MANUFACTURER: "Google",
-            ATTR_MODEL: DEV_CLIENT_MODEL,
-            "via_device": (DOMAIN, self._system_id),
-        }
+        try:
+            intensity = (
+                self.coordinator.data[self._system_id]
+                .access_points[self._item_id]
+                .intensity
+            )
+        except (TypeError, KeyError):
+            return
+
+        if self._pending is not None and not self._pending.failed:
+            intensity = self._pending.value
+
+        if intensity:
+            self._last_brightness = intensity
+            self._state = True
+            self._brightness = intensity * 255 / 100
+        else:
+            self._state = False
+            self._brightness = 0
+
+    def _slice_changed(self):
+        """Also write when a snapshot resolves a pending command."""
+        try:
+            observed = (
+                self.coordinator.data[self._system_id]
+                .access_points[self._item_id]
+                .intensity
+            )
+        except (TypeError, KeyError):
+            observed = None
 
-        return device_info
+        return self._resolve_pending(observed or 0) or super()._slice_changed()
 
     async def async_turn_on(self, **kwargs):
         """Turn on the light."""
-        brightness_pct = 50
-
-        if self._last_brightness:
-            brightness_pct = (
-                self._last_brightness if self._last_brightness > 0 else brightness_pct
-            )
+        brightness = self._last_brightness if self._last_brightness else 50
 
         if kwargs.get(ATTR_BRIGHTNESS):
-            brightness_pct = kwargs[ATTR_BRIGHTNESS]
-
-        brightness = int(brightness_pct * 100 / 255)
-
-        self._brightness = brightness_pct
-        self._state = True
-        self._last_change = int(time.time())
+            brightness = max(1, int(kwargs[ATTR_BRIGHTNESS] * 100 / 255))
 
-        await self.coordinator.api.set_brightness(self._item_id, brightness)
+        await self._async_set_intensity(brightness)
 
     async def async_turn_off(self, **kwargs):
         """Turn off the light."""
-        self._state = False
-        self._last_change = int(time.time())
-
-        await self.coordinator.api.set_brightness(self._item_id, 0)
+        await self._async_set_intensity(0)
+
+    async def _async_set_intensity(self, intensity):
+        """Queue a lighting command and show it until a snapshot confirms it."""
+        try:
+            previous = (
+                self.coordinator.data[self._system_id]
+                .access_points[self._item_id]
+                .intensity
+            )
+        except (TypeError, KeyError):
+            previous = None
+
+        on_failure = self._start_command(intensity, previous or 0)
+
+        self.coordinator.commands.async_submit(
+            self._system_id,
+            self._item_id,
+            self.coordinator.api.set_brightness,
+            self._item_id,
+            intensity,
+            on_failure=on_failure,
+        )
@@ -0,0 +1,208 @@
+"""Normalized views of the Google Wifi cloud payload.
+
+The coordinator builds these once per poll and the platforms read plain
+attributes from them instead of walking the raw API dicts. Only the fields
+used by the integration are kept, so the raw payload can be dropped as soon
+as the views are built.
+"""
+from sys import intern
+
+
+class _View:
+    """Base for the slotted views, compared field by field."""
+
+    __slots__ = ()
+    _compare = ()
+
+    def __eq__(self, other):
+        """Return True if the compared fields of both views match."""
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return all(
+            getattr(self, field) == getattr(other, field) for field in self._compare
+        )
+
+    __hash__ = None
+
+    def as_dict(self) -> dict:
+        """Return the fields of the view as a JSON serializable dict."""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Rebuild a view from the dict returned by as_dict."""
+        view = cls.__new__(cls)
+        for field in cls.__slots__:
+            setattr(view, field, data.get(field))
+        return view
+
+    def __repr__(self):
+        """Return a readable representation of the view."""
+        fields = ", ".join(
+            f"{field}={getattr(self, field)!r}" for field in self._compare
+        )
+        return f"{type(self).__name__}({fields})"
+
+
+class DeviceView(_View):
+    """A client device (station) connected to a system."""
+
+    __slots__ = (
+        "device_id",
+        "name",
+        "friendly_type",
+        "connected",
+        "paused",
+        "ip_address",
+        "mac_address",
+        "ap_id",
+        "transmit_bps",
+        "receive_bps",
+        "network",
+    )
+    _compare = __slots__
+
+    def __init__(self, device_id: str, device: dict):
+        """Build the view from a device of the cloud payload."""
+        self.device_id = intern(device_id)
+        self.friendly_type = device.get("friendlyType")
+        self.name = device.get("friendlyName", device_id)
+        if self.friendly_type:
+            self.name = f"{self.name} ({self.friendly_type})"
+        self.connected = bool(device.get("connected"))
+        self.paused = bool(device.get("paused"))
+        self.ip_address = device.get("ipAddress")
+        self.mac_address = device.get("macAddress") or None
+        self.ap_id = intern(device["apId"]) if device.get("apId") else None
+        traffic = device.get("traffic") or {}
+        self.transmit_bps = float(traffic.get("transmitSpeedBps", 0))
+        self.receive_bps = float(traffic.get("receiveSpeedBps", 0))
+        self.network = None
+
+
+class AccessPointView(_View):
+    """A Google Wifi access point of a system."""
+
+    __slots__ = (
+        "ap_id",
+        "name",
+        "room_name",
+        "status",
+        "hardware_type",
+        "firmware_version",
+        "intensity",
+    )
+    _compare = __slots__
+
+    def __init__(self, ap_id: str, access_point: dict):
+        """Build the view from an access point of the cloud payload."""
+        settings = access_point.get("accessPointSettings", {})
+        other_settings = settings.get("accessPointOtherSettings") or {}
+        properties = access_point.get("accessPointProperties", {})
+
+        self.ap_id = intern(ap_id)
+        self.room_name = (other_settings.get("roomData") or {}).get("name")
+        self.name = other_settings.get("apName") or "Google Access Point"
+        if self.room_name:
+            self.name = f"{self.room_name} Access Point"
+        self.status = access_point.get("status")
+        self.hardware_type = properties.get("hardwareType")
+        self.firmware_version = properties.get("firmwareVersion")
+        self.intensity = (settings.get("lightingSettings") or {}).get("intensity")
+
+
+class SystemView(_View):
+    """A Google Wifi system (group) with its access points and devices.
+
+    Two views compare equal when their system level fields match; the access
+    points and devices are compared on their own.
+    """
+
+    __slots__ = (
+        "system_id",
+        "status",
+        "firmware_version",
+        "lan_address",
+        "netmask",
+        "dhcp_pool_begin",
+        "prioritized_station",
+        "prioritization_end_time",
+        "transmit_bps",
+        "receive_bps",
+        "wan_transmit_bps",
+        "wan_receive_bps",
+        "connected_devices",
+        "guest_devices",
+        "total_devices",
+        "access_points",
+        "devices",
+    )
+    _compare = __slots__[:-2]
+
+    def __init__(self, system_id: str, system: dict):
+        """Build the view from a system of the cloud payload."""
+        group_settings = system.get("groupSettings", {})
+        lan_settings = group_settings.get("lanSettings", {})
+        prioritized = lan_settings.get("prioritizedStation") or {}
+        traffic = system.get("groupTraffic")
+
+        self.system_id = intern(system_id)
+        self.status = system.get("status")
+        self.firmware_version = (
+            system.get("groupProperties", {})
+            .get("otherProperties", {})
+            .get("firmwareVersion")
+        )
+        self.lan_address = lan_settings.get("ipAddress")
+        self.netmask = lan_settings.get("netmask")
+        self.dhcp_pool_begin = lan_settings.get("dhcpPoolBegin")
+        self.prioritized_station = prioritized.get("stationId")
+        self.prioritization_end_time = prioritized.get("prioritizationEndTime")
+        self.transmit_bps = None
+        self.receive_bps = None
+        if traffic:
+            self.transmit_bps = float(traffic.get("transmitSpeedBps", 0))
+            self.receive_bps = float(traffic.get("receiveSpeedBps", 0))
+        self.wan_transmit_bps = None
+        self.wan_receive_bps = None
+        self.connected_devices = 0
+        self.guest_devices = 0
+        self.total_devices = 0
+        self.access_points = {
+            ap_id: AccessPointView(ap_id, access_point)
+            for ap_id, access_point in system.get("access_points", {}).items()
+        }
+        self.devices = {}
+
+    def as_dict(self) -> dict:
+        """Return the system, access points and devices as a dict."""
+        data = super().as_dict()
+        data["access_points"] = {
+            ap_id: access_point.as_dict()
+            for ap_id, access_point in self.access_points.items()
+        }
+        data["devices"] = {
+            device_id: device.as_dict() for device_id, device in self.devices.items()
+        }
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Rebuild the system, access points and devices from a dict."""
+        view = super().from_dict(data)
+        view.system_id = intern(view.system_id)
+        view.access_points = {
+            intern(ap_id): AccessPointView.from_dict(access_point)
+            for ap_id, access_point in (data.get("access_points") or {}).items()
+        }
+        view.devices = {
+            intern(device_id): DeviceView.from_dict(device)
+            for device_id, device in (data.get("devices") or {}).items()
+        }
+        return view
+
+    def set_speedtest(self, result: dict):
+        """Store the WAN speeds of a speed test result."""
+        self.wan_transmit_bps = float(result["transmitWanSpeedBps"])
+        self.wan_receive_bps = float(result["receiveWanSpeedBps"])
@@ -0,0 +1,56 @@
+"""Classification of device addresses against the LAN of a system."""
+from functools import lru_cache
+import ipaddress
+
+from .const import DEFAULT_NETMASK
+
+
+class SubnetClassifier:
+    """Test whether addresses belong to the main network of a system.
+
+    The LAN prefix is parsed once from the LAN settings. Each test is then
+    an integer mask and compare on the address, which is parsed through a
+    shared cache because device addresses rarely change between polls.
+    """
+
+    __slots__ = ("network", "_prefix", "_mask")
+
+    def __init__(self, address: str, netmask: str = None):
+        """Parse the LAN network from an address in it and its netmask."""
+        self.network = ipaddress.IPv4Network(
+            f"{address}/{netmask or DEFAULT_NETMASK}", strict=False
+        )
+        self._prefix = int(self.network.network_address)
+        self._mask = int(self.network.netmask)
+
+    def __contains__(self, address: str) -> bool:
+        """Return True if the address is on the LAN network."""
+        if not address:
+            return False
+
+        value = address_to_int(address)
+        return value is not None and value & self._mask == self._prefix
+
+    @classmethod
+    def from_system(cls, system):
+        """Return the classifier for the LAN settings of a system view.
+
+        Returns None when the system reports no usable LAN settings.
+        """
+        address = system.lan_address or system.dhcp_pool_begin
+        if not address:
+            return None
+
+        try:
+            return cls(address, system.netmask)
+        except ValueError:
+            return None
+
+
+@lru_cache(maxsize=8192)
+def address_to_int(address: str):
+    """Return an IPv4 address as an integer, or None if it is not one."""
+    try:
+        return int(ipaddress.IPv4Address(address))
+    except ValueError:
+        return None
@@ -0,0 +1,87 @@
+"""Policy deciding which client devices get entities."""
+import re
+
+from .const import FILTER_ALLOW, FILTER_DENY
+
+MAC_PATTERN = re.compile(r"^([0-9a-f]{2}:){5}[0-9a-f]{2}$")
+OUI_PATTERN = re.compile(r"^([0-9a-f]{2}:){2}[0-9a-f]{2}$")
+
+
+class DevicePolicy:
+    """Select the client devices the integration creates entities for.
+
+    The filter is a comma separated list of full MAC addresses, vendor
+    prefixes (the first three octets of a MAC) and device types as reported
+    by Google Wifi (friendlyType, for example "Phone"). In allow mode only
+    matching devices get entities, in deny mode matching devices are left
+    out. Devices can further be limited to the main network, and switches
+    can be turned off so only device trackers are created.
+    """
+
+    __slots__ = (
+        "mode",
+        "macs",
+        "vendors",
+        "types",
+        "main_network_only",
+        "trackers_only",
+    )
+
+    def __init__(
+        self,
+        mode: str = None,
+        device_filter: str = "",
+        main_network_only: bool = False,
+        trackers_only: bool = False,
+    ):
+        """Parse the policy from the integration options."""
+        self.mode = mode if mode in (FILTER_ALLOW, FILTER_DENY) else None
+        self.macs = set()
+        self.vendors = set()
+        self.types = set()
+        self.main_network_only = main_network_only
+        self.trackers_only = trackers_only
+
+        for token in (device_filter or "").split(","):
+            token = token.strip().lower().replace("-", ":")
+            if not token:
+                continue
+            if MAC_PATTERN.match(token):
+                self.macs.add(token)
+            elif OUI_PATTERN.match(token):
+                self.vendors.add(token)
+            else:
+                self.types.add(token)
+
+    def allows(self, device) -> bool:
+        """Return True if entities should be created for a device view."""
+        if self.main_network_only and device.network != "main":
+            return False
+
+        if self.mode is None:
+            return True
+
+        return self._matches(device) == (self.mode == FILTER_ALLOW)
+
+    def excludes(self, device) -> bool:
+        """Return True if the policy rules a device view out for good.
+
+        The network of a device is only known while it is connected, so a
+        device that is offline is not excluded for the main network rule.
+        """
+        if self.main_network_only and device.network not in (None, "main"):
+            return True
+
+        if self.mode is None:
+            return False
+
+        return self._matches(device) != (self.mode == FILTER_ALLOW)
+
+    def _matches(self, device) -> bool:
+        """Return True if the device matches an entry of the filter."""
+        mac = (device.mac_address or "").lower()
+
+        if mac and (mac in self.macs or mac[:8] in self.vendors):
+            return True
+
+        return (device.friendly_type or "").lower() in self.types
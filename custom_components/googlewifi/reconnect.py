@@ -0,0 +1,67 @@
+"""Reconnect policy for the Google Wifi cloud API."""
+import random
+import time
+
+
+class ReconnectPolicy:
+    """Exponential backoff with jitter and a circuit breaker.
+
+    Every consecutive failure doubles the delay before the next poll, up to
+    a maximum, with jitter so many instances do not retry in lockstep. After
+    a number of consecutive failures the circuit opens and no API calls are
+    made until the cooldown has passed; the next poll is then a single trial
+    that closes the circuit on success or opens it again on failure.
+    """
+
+    def __init__(
+        self,
+        base_interval: float,
+        max_interval: float,
+        threshold: int,
+        cooldown: float,
+    ):
+        """Initialize the policy."""
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.total_failures = 0
+        self.reconnects = 0
+        self.circuit_trips = 0
+        self._opened_at = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while the circuit is open and calls should be skipped."""
+        return (
+            self._opened_at is not None
+            and time.monotonic() - self._opened_at < self.cooldown
+        )
+
+    @property
+    def cooldown_remaining(self) -> float:
+        """Return the seconds left before the circuit allows a trial call."""
+        if self._opened_at is None:
+            return 0
+
+        return max(0, self.cooldown - (time.monotonic() - self._opened_at))
+
+    def record_success(self):
+        """Close the circuit and reset the backoff."""
+        self.failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> float:
+        """Record a failed poll and return the delay before the next one."""
+        self.failures += 1
+        self.total_failures += 1
+
+        if self.failures >= self.threshold:
+            if not self.is_open:
+                self.circuit_trips += 1
+            self._opened_at = time.monotonic()
+            return self.cooldown
+
+        delay = min(self.max_interval, self.base_interval * 2**self.failures)
+        return random.uniform(delay / 2, delay)
@@ -1,8 +1,17 @@
 """Definition and setup of the Google Wifi Speed Sensor for Home Assistant."""
 
-from homeassistant.const import ATTR_NAME, UnitOfDataRate
+from homeassistant.const import (
+    ATTR_NAME,
+    EntityCategory,
+    UnitOfDataRate,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_platform
+from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.util.dt import as_local, parse_datetime
 from homeassistant.components.sensor import (
@@ -13,6 +22,7 @@ from homeassistant.components.sensor import (
 
 from . import GoogleWifiEntity, GoogleWiFiUpdater
 from .const import (
+    ATTR_CONNECTIONS,
     ATTR_IDENTIFIERS,
     ATTR_MANUFACTURER,
     ATTR_MODEL,
@@ -20,13 +30,24 @@ from .const import (
     CONF_SPEED_UNITS,
     COORDINATOR,
     DEFAULT_ICON,
+    DEV_CLIENT_MODEL,
     DEV_MANUFACTURER,
     DOMAIN,
+    POLL_PHASES,
+    SIGNAL_ADD_DEVICE,
     unit_convert,
 )
+from .usage import DAY_RECEIVE, DAY_TRANSMIT, MONTH_RECEIVE, MONTH_TRANSMIT
 
 SERVICE_SPEED_TEST = "speed_test"
 
+SPEED_ATTRS = {
+    "transmitWanSpeedBps": "wan_transmit_bps",
+    "receiveWanSpeedBps": "wan_receive_bps",
+    "transmitSpeedBps": "transmit_bps",
+    "receiveSpeedBps": "receive_bps",
+}
+
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the sensor platform for a Wifi system."""
@@ -114,8 +135,65 @@ async def async_setup_entry(hass, entry, async_add_entities):
         )
         entities.append(entity)
 
+        for phase in POLL_PHASES:
+            entity = GoogleWifiPollTimeSensor(
+                coordinator=coordinator,
+                name=f"Google Wifi System {system_id} {phase.title()} Time",
+                icon="mdi:timer-outline",
+                system_id=system_id,
+                phase=phase,
+            )
+            entities.append(entity)
+
+        entity = GoogleWifiTopDevicesSensor(
+            coordinator=coordinator,
+            name=f"Google Wifi System {system_id} Top Devices",
+            icon="mdi:podium",
+            system_id=system_id,
+            unit_of_measure=entry.options.get(
+                CONF_SPEED_UNITS, UnitOfDataRate.MEGABITS_PER_SECOND
+            ),
+        )
+        entities.append(entity)
+
+        if coordinator.traffic is not None:
+            entities.extend(
+                traffic_sensors(
+                    coordinator, f"Google Wifi System {system_id}", system_id, None
+                )
+            )
+
+        for device_id, device in coordinator.entity_devices(system_id).items():
+            entities.extend(
+                device_sensors(coordinator, device.name, system_id, device_id)
+            )
+
     async_add_entities(entities)
 
+    if coordinator.traffic is not None or coordinator.usage is not None:
+
+        @callback
+        def async_new_entities(new_devices):
+            """Add sensors for the devices that joined since the last poll."""
+            async_add_entities(
+                [
+                    entity
+                    for device_info in new_devices
+                    for entity in device_sensors(
+                        coordinator,
+                        device_info["device"].name,
+                        device_info["system_id"],
+                        device_info["device_id"],
+                    )
+                ]
+            )
+
+        entry.async_on_unload(
+            async_dispatcher_connect(
+                hass, f"{SIGNAL_ADD_DEVICE}_{entry.entry_id}", async_new_entities
+            )
+        )
+
     # register service for reset
     platform = entity_platform.current_platform.get()
 
@@ -126,6 +204,85 @@ async def async_setup_entry(hass, entry, async_add_entities):
     )
 
 
+def device_sensors(coordinator, name, system_id, device_id):
+    """Return the optional traffic and data usage sensors of a device."""
+    entities = []
+
+    if coordinator.traffic is not None:
+        entities.extend(traffic_sensors(coordinator, name, system_id, device_id))
+
+    if coordinator.usage is not None:
+        entities.extend(usage_sensors(coordinator, name, system_id, device_id))
+
+    return entities
+
+
+def traffic_sensors(coordinator, name, system_id, device_id):
+    """Return the rolling upload and download sensors of a system or device."""
+    unit = coordinator.entry.options.get(
+        CONF_SPEED_UNITS, UnitOfDataRate.MEGABITS_PER_SECOND
+    )
+
+    return [
+        GoogleWifiTrafficStatsSensor(
+            coordinator=coordinator,
+            name=f"{name} {label} Traffic Average",
+            icon=DEFAULT_ICON,
+            system_id=system_id,
+            item_id=device_id,
+            direction=direction,
+            unit_of_measure=unit,
+        )
+        for direction, label in (("transmit", "Upload"), ("receive", "Download"))
+    ]
+
+
+def usage_sensors(coordinator, name, system_id, device_id):
+    """Return the daily and monthly data usage sensors of a device."""
+    return [
+        GoogleWifiDataUsageSensor(
+            coordinator=coordinator,
+            name=f"{name} {period.title()} Data Usage",
+            icon="mdi:counter",
+            system_id=system_id,
+            item_id=device_id,
+            period=period,
+        )
+        for period in ("daily", "monthly")
+    ]
+
+
+def system_device_info(coordinator, system_id, name):
+    """Define the device as an individual Google WiFi system."""
+    try:
+        return {
+            ATTR_IDENTIFIERS: {(DOMAIN, system_id)},
+            ATTR_MANUFACTURER: DEV_MANUFACTURER,
+            ATTR_NAME: name,
+            ATTR_MODEL: "Google Wifi",
+            ATTR_SW_VERSION: coordinator.data[system_id].firmware_version,
+        }
+    except (TypeError, KeyError):
+        return None
+
+
+def client_device_info(coordinator, system_id, device_id, name):
+    """Define the device as a client of a Google Wifi system."""
+    try:
+        mac = coordinator.data[system_id].devices[device_id].mac_address
+    except (TypeError, KeyError):
+        mac = None
+
+    return {
+        ATTR_IDENTIFIERS: {(DOMAIN, device_id)},
+        ATTR_CONNECTIONS: {(CONNECTION_NETWORK_MAC, mac)} if mac else set(),
+        ATTR_NAME: name,
+        ATTR_MANUFACTURER: "Google",
+        ATTR_MODEL: DEV_CLIENT_MODEL,
+        "via_device": (DOMAIN, system_id),
+    }
+
+
 class GoogleWifiSpeedSensor(GoogleWifiEntity, SensorEntity):
     """Defines a Google WiFi Speed sensor."""
 
@@ -142,14 +299,15 @@ class GoogleWifiSpeedSensor(GoogleWifiEntity, SensorEntity):
         )
 
         self._state = None
-        self._device_info = None
         self._speed_key = speed_key
+        self._speed_attr = SPEED_ATTRS[speed_key]
         self._speed_type = speed_type
         self.attrs = {}
         self._unit_of_measurement = unit_of_measure
+        self._attr_device_info = system_device_info(coordinator, system_id, name)
 
     _attr_state_class = SensorStateClass.MEASUREMENT
-    
+
     @property
     def unique_id(self):
         """Return the unique id for this sensor."""
@@ -158,57 +316,25 @@ class GoogleWifiSpeedSensor(GoogleWifiEntity, SensorEntity):
     @property
     def state(self):
         """Return the state of the sensor."""
-        if self.coordinator.data:
-            if self._speed_type == "speed_test":
-                if self.coordinator.data[self._system_id].get("speedtest"):
-                    self._state = float(
-                        self.coordinator.data[self._system_id]["speedtest"][
-                            self._speed_key
-                        ]
-                    )
-
-                    self._state = unit_convert(self._state, self._unit_of_measurement)
-
-            elif self._speed_type == "realtime":
-                if self.coordinator.data[self._system_id].get("groupTraffic"):
-                    self._state = float(
-                        self.coordinator.data[self._system_id]["groupTraffic"].get(
-                            self._speed_key, 0
-                        )
-                    )
-
-                    self._state = unit_convert(self._state, self._unit_of_measurement)
+        return self._state
 
-            return self._state
-    
     @property
     def unit_of_measurement(self):
         """Return the unit of measurement of the sensor."""
         return self._unit_of_measurement
 
-    @property
-    def device_info(self):
-        """Define the device as an individual Google WiFi system."""
+    @callback
+    def _update_attrs(self):
+        """Compute the converted speed from the coordinator data."""
+        super()._update_attrs()
 
         try:
-            device_info = {
-                ATTR_MANUFACTURER: DEV_MANUFACTURER,
-                ATTR_NAME: self._name,
-            }
+            speed = getattr(self.coordinator.data[self._system_id], self._speed_attr)
+        except (TypeError, KeyError):
+            return
 
-            device_info[ATTR_IDENTIFIERS] = {(DOMAIN, self._system_id)}
-            device_info[ATTR_MODEL] = "Google Wifi"
-            device_info[ATTR_SW_VERSION] = self.coordinator.data[self._system_id][
-                "groupProperties"
-            ]["otherProperties"]["firmwareVersion"]
-
-            self._device_info = device_info
-        except TypeError:
-            pass
-        except KeyError:
-            pass
-
-        return self._device_info
+        if speed is not None:
+            self._state = unit_convert(speed, self._unit_of_measurement)
 
     async def async_speed_test(self, **kwargs):
         """Run a speed test."""
@@ -231,6 +357,7 @@ class GoogleWifiConnectedDevices(GoogleWifiEntity):
 
         self._count_type = count_type
         self._state = None
+        self._attr_device_info = system_device_info(coordinator, system_id, name)
 
     @property
     def unique_id(self):
@@ -243,41 +370,314 @@ class GoogleWifiConnectedDevices(GoogleWifiEntity):
         return "Devices"
 
     @property
-    def device_info(self):
-        """Define the device as an individual Google WiFi system."""
+    def state(self):
+        """Return the current count of connected devices."""
+        return self._state
+
+    @callback
+    def _update_attrs(self):
+        """Compute the device count from the coordinator data."""
+        super()._update_attrs()
 
         try:
-            device_info = {
+            system = self.coordinator.data[self._system_id]
+        except (TypeError, KeyError):
+            return
+
+        if self._count_type == "main":
+            self._state = system.connected_devices
+        elif self._count_type == "guest":
+            self._state = system.guest_devices
+        elif self._count_type == "total":
+            self._state = system.total_devices
+
+
+class GoogleWifiPollTimeSensor(GoogleWifiEntity, SensorEntity):
+    """Define a diagnostic sensor for the duration of an update phase."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator, name, icon, system_id, phase):
+        """Initialize the timing sensor."""
+
+        super().__init__(
+            coordinator=coordinator,
+            name=name,
+            icon=icon,
+            system_id=system_id,
+            item_id=None,
+        )
+
+        self._phase = phase
+        self._attr_device_info = system_device_info(coordinator, system_id, name)
+
+    @property
+    def unique_id(self):
+        """Return the unique id for this sensor."""
+        return f"{self._system_id}_timing_{self._phase}"
+
+    @property
+    def entity_registry_enabled_default(self):
+        """Keep the timing sensors disabled unless enabled by the user."""
+        return False
+
+    @callback
+    def _update_attrs(self):
+        """Compute the median duration, p95, max and sample count of the phase."""
+        super()._update_attrs()
+
+        # Speed tests run for the account, the other phases per system.
+        updater = self.coordinator.system_updater(self._system_id)
+        timings = (
+            self.coordinator.timings if self._phase == "speedtest" else updater.timings
+        )
+        stats = timings.stats(self._phase)
+        self._attr_native_value = stats["p50"] if stats else None
+        self._attrs.update(stats or {})
+
+        if self._phase == "poll":
+            self._attrs["account"] = self.coordinator.entry.title
+            self._attrs["update_interval"] = updater.update_interval.total_seconds()
+            self._attrs["poll_offset"] = self.coordinator.poll_offset
+
+    def _slice_changed(self):
+        """Write the timings after every update of the system."""
+        return self.coordinator.has_changed(self._system_id, None)
+
+
+class GoogleWifiTrafficStatsSensor(GoogleWifiEntity, SensorEntity):
+    """Define a rolling traffic sensor for a system or device."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self, coordinator, name, icon, system_id, item_id, direction, unit_of_measure
+    ):
+        """Initialize the traffic sensor."""
+
+        super().__init__(
+            coordinator=coordinator,
+            name=name,
+            icon=icon,
+            system_id=system_id,
+            item_id=item_id,
+        )
+
+        self._direction = direction
+        self._attr_native_unit_of_measurement = unit_of_measure
+
+        if item_id:
+            self._attr_device_info = client_device_info(
+                coordinator, system_id, item_id, name
+            )
+        else:
+            self._attr_device_info = {
+                ATTR_IDENTIFIERS: {(DOMAIN, system_id)},
                 ATTR_MANUFACTURER: DEV_MANUFACTURER,
-                ATTR_NAME: self._name,
+                ATTR_MODEL: "Google Wifi",
             }
 
-            device_info[ATTR_IDENTIFIERS] = {(DOMAIN, self._system_id)}
-            device_info[ATTR_MODEL] = "Google Wifi"
-            device_info[ATTR_SW_VERSION] = self.coordinator.data[self._system_id][
-                "groupProperties"
-            ]["otherProperties"]["firmwareVersion"]
+    @property
+    def unique_id(self):
+        """Return the unique id for this sensor."""
+        return f"{self._item_id or self._system_id}_traffic_{self._direction}_average"
+
+    @property
+    def entity_registry_enabled_default(self):
+        """Only enable the system sensors by default."""
+        if self._item_id:
+            return False
+
+        return self.coordinator.add_disabled
+
+    @callback
+    def _update_attrs(self):
+        """Compute the mean, p95 and peak traffic over the window."""
+        super()._update_attrs()
+
+        stats = self.coordinator.traffic_stats(self._system_id, self._item_id)
+        unit = self._attr_native_unit_of_measurement
+
+        window = self.coordinator.traffic_window if stats is None else stats["window"]
+        self._attrs["window_minutes"] = round(window / 60)
+        if stats is None:
+            self._attr_native_value = None
+            self._attrs["samples"] = 0
+            self._attrs.pop("p95", None)
+            self._attrs.pop("peak", None)
+            return
 
-            self._device_info = device_info
-        except TypeError:
-            pass
-        except KeyError:
-            pass
+        direction = stats[self._direction]
+        self._attr_native_value = unit_convert(direction["mean"], unit)
+        self._attrs["samples"] = stats["samples"]
+        self._attrs["p95"] = unit_convert(direction["p95"], unit)
+        self._attrs["peak"] = unit_convert(direction["peak"], unit)
 
-        return self._device_info
+    def _slice_changed(self):
+        """Write after every update of the system as the window moves on."""
+        changed = self.coordinator.has_changed(self._system_id, None)
+        return changed or super()._slice_changed()
+
+
+class GoogleWifiDataUsageSensor(GoogleWifiEntity, SensorEntity):
+    """Define a daily or monthly data usage sensor for a device."""
+
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+    _attr_suggested_unit_of_measurement = UnitOfInformation.MEGABYTES
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator, name, icon, system_id, item_id, period):
+        """Initialize the data usage sensor."""
+
+        super().__init__(
+            coordinator=coordinator,
+            name=name,
+            icon=icon,
+            system_id=system_id,
+            item_id=item_id,
+        )
+
+        self._period = period
+        self._written = None
+        self._attr_device_info = client_device_info(
+            coordinator, system_id, item_id, name
+        )
 
     @property
-    def state(self):
-        """Return the current count of connected devices."""
+    def unique_id(self):
+        """Return the unique id for this sensor."""
+        return f"{self._item_id}_data_usage_{self._period}"
 
-        if self.coordinator.data:
-            if self._count_type == "main":
-                self._state = self.coordinator.data[self._system_id][
-                    "connected_devices"
-                ]
-            elif self._count_type == "guest":
-                self._state = self.coordinator.data[self._system_id]["guest_devices"]
-            elif self._count_type == "total":
-                self._state = self.coordinator.data[self._system_id]["total_devices"]
+    def _usage(self):
+        """Return the transmitted and received bytes of the period."""
+        counters = self.coordinator.usage.get(self._system_id, self._item_id)
+        if counters is None:
+            return 0, 0
 
-        return self._state
+        if self._period == "daily":
+            return counters[DAY_TRANSMIT], counters[DAY_RECEIVE]
+
+        return counters[MONTH_TRANSMIT], counters[MONTH_RECEIVE]
+
+    @callback
+    def _update_attrs(self):
+        """Compute the bytes transferred in the period."""
+        super()._update_attrs()
+
+        transmitted, received = self._written = self._usage()
+        self._attr_native_value = round(transmitted + received)
+        self._attrs["upload"] = round(transmitted)
+        self._attrs["download"] = round(received)
+
+    def _slice_changed(self):
+        """Write only when the counted usage changed."""
+        return self._usage() != self._written
+
+
+class GoogleWifiTopDevicesSensor(GoogleWifiEntity, SensorEntity):
+    """Define a sensor listing the devices using the most bandwidth."""
+
+    def __init__(self, coordinator, name, icon, system_id, unit_of_measure):
+        """Initialize the top devices sensor."""
+
+        super().__init__(
+            coordinator=coordinator,
+            name=name,
+            icon=icon,
+            system_id=system_id,
+            item_id=None,
+        )
+
+        self._unit_of_measurement = unit_of_measure
+        self._written = None
+        self._attr_device_info = {
+            ATTR_IDENTIFIERS: {(DOMAIN, system_id)},
+            ATTR_MANUFACTURER: DEV_MANUFACTURER,
+            ATTR_MODEL: "Google Wifi",
+        }
+
+    @property
+    def unique_id(self):
+        """Return the unique id for this sensor."""
+        return f"{self._system_id}_top_devices"
+
+    @callback
+    def _update_attrs(self):
+        """Compute the top devices by current and by rolling traffic."""
+        super()._update_attrs()
+
+        self._written = self._ranking()
+        top = self.coordinator.top_devices.get(self._system_id, [])
+
+        try:
+            self._attr_native_value = (
+                self.coordinator.data[self._system_id].devices[top[0]].name
+                if top
+                else None
+            )
+        except (TypeError, KeyError):
+            return
+
+        self._attrs["current"] = self._describe(top)
+
+        if self.coordinator.traffic is not None:
+            self._attrs["rolling"] = self._describe(
+                self.coordinator.rolling_top_devices(self._system_id), rolling=True
+            )
+
+    def _describe(self, device_ids, rolling=False):
+        """Return the names and traffic of the listed devices."""
+        system = self.coordinator.data[self._system_id]
+        unit = self._unit_of_measurement
+        described = []
+
+        for device_id in device_ids:
+            device = system.devices[device_id]
+            transmit = device.transmit_bps
+            receive = device.receive_bps
+
+            if rolling:
+                stats = self.coordinator.traffic_stats(self._system_id, device_id)
+                transmit = stats["transmit"]["mean"]
+                receive = stats["receive"]["mean"]
+
+            described.append(
+                {
+                    "name": device.name,
+                    "transmit": unit_convert(transmit, unit),
+                    "receive": unit_convert(receive, unit),
+                }
+            )
+
+        return described
+
+    def _ranking(self):
+        """Return the listed devices with their current traffic."""
+        try:
+            devices = self.coordinator.data[self._system_id].devices
+            return [
+                (
+                    device_id,
+                    devices[device_id].transmit_bps,
+                    devices[device_id].receive_bps,
+                )
+                for device_id in self.coordinator.top_devices.get(self._system_id, [])
+            ]
+        except (TypeError, KeyError):
+            return None
+
+    def _slice_changed(self):
+        """Write when the ranking or the traffic of a listed device changed.
+
+        The rolling ranking moves with every update of the system.
+        """
+        if self.coordinator.traffic is not None and self.coordinator.has_changed(
+            self._system_id, None
+        ):
+            return True
+
+        return self._ranking() != self._written
@@ -0,0 +1,48 @@
+"""Shared HTTP session for the Google Wifi API."""
+import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import (
+    HTTP_CONNECTIONS_PER_HOST,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_SESSION,
+)
+
+
+@callback
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the session shared by the config flow and every account.
+
+    All accounts talk to the same Google hosts, so they share one connection
+    pool. Idle connections are kept open longer than a polling interval, so
+    polls reuse them instead of opening a new TLS connection each time, and
+    the connections per host are bounded, so the polls of many accounts queue
+    for a connection instead of opening one each.
+    """
+    session = hass.data.get(HTTP_SESSION)
+
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit_per_host=HTTP_CONNECTIONS_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            enable_cleanup_closed=True,
+        )
+        session = hass.data[HTTP_SESSION] = aiohttp.ClientSession(connector=connector)
+
+        async def async_close(event: Event):
+            await session.close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, async_close)
+
+    return session
+
+
+async def async_close_session(hass: HomeAssistant):
+    """Close the shared session once no account uses it."""
+    session = hass.data.pop(HTTP_SESSION, None)
+
+    if session is not None and not session.closed:
+        await session.close()
@@ -19,13 +19,12 @@ from .const import (
     ATTR_MODEL,
     CONF_SPEED_UNITS,
     COORDINATOR,
+    DATA_RATE_FACTORS,
     DEFAULT_ICON,
     DEV_CLIENT_MODEL,
     DOMAIN,
-    PAUSE_UPDATE,
     SIGNAL_ADD_DEVICE,
     SIGNAL_DELETE_DEVICE,
-    unit_convert,
 )
 
 SERVICE_PRIORITIZE = "prioritize"
@@ -38,20 +37,18 @@ async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
     device = hass.data[DOMAIN][entry.entry_id]
 
+    if coordinator.device_policy.trackers_only:
+        return
+
     entities = []
 
     data_unit = entry.options.get(CONF_SPEED_UNITS, UnitOfDataRate.MEGABITS_PER_SECOND)
 
-    for system_id, system in coordinator.data.items():
-        for dev_id, device in system["devices"].items():
-            device_name = f"{device['friendlyName']}"
-
-            if device.get("friendlyType"):
-                device_name = device_name + f" ({device['friendlyType']})"
-
+    for system_id in coordinator.data:
+        for dev_id, device in coordinator.entity_devices(system_id).items():
             entity = GoogleWifiSwitch(
                 coordinator=coordinator,
-                name=device_name,
+                name=device.name,
                 icon=DEFAULT_ICON,
                 system_id=system_id,
                 item_id=dev_id,
@@ -61,29 +58,28 @@ async def async_setup_entry(hass, entry, async_add_entities):
 
     async_add_entities(entities)
 
-    async def async_new_entities(device_info):
-        """Add new entities when they connect to Google Wifi."""
-        system_id = device_info["system_id"]
-        device_id = device_info["device_id"]
-        device = device_info["device"]
-
-        device_name = f"{device['friendlyName']}"
-
-        if device.get("friendlyType"):
-            device_name = device_name + f" ({device['friendlyType']})"
-
-        entity = GoogleWifiSwitch(
-            coordinator=coordinator,
-            name=device_name,
-            icon=DEFAULT_ICON,
-            system_id=system_id,
-            item_id=device_id,
-            data_unit=data_unit,
+    @callback
+    def async_new_entities(new_devices):
+        """Add the devices that connected to Google Wifi since the last poll."""
+        async_add_entities(
+            [
+                GoogleWifiSwitch(
+                    coordinator=coordinator,
+                    name=device_info["device"].name,
+                    icon=DEFAULT_ICON,
+                    system_id=device_info["system_id"],
+                    item_id=device_info["device_id"],
+                    data_unit=data_unit,
+                )
+                for device_info in new_devices
+            ]
         )
-        entities = [entity]
-        async_add_entities(entities)
 
-    async_dispatcher_connect(hass, SIGNAL_ADD_DEVICE, async_new_entities)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, f"{SIGNAL_ADD_DEVICE}_{entry.entry_id}", async_new_entities
+        )
+    )
 
     # register service for reset
     platform = entity_platform.current_platform.get()
@@ -118,121 +114,25 @@ class GoogleWifiSwitch(GoogleWifiEntity, SwitchEntity):
 
         self._state = None
         self._available = None
-        self._last_change = 0
         self._mac = None
         self._unit_of_measurement = data_unit
+        self._unit_factor = DATA_RATE_FACTORS.get(data_unit, 1)
 
-    @property
-    def is_on(self):
-        """Return the status of the internet for this device."""
-        since_last = int(time.time()) - self._last_change
-
-        if since_last > PAUSE_UPDATE:
-            try:
-                is_prioritized = False
-                is_prioritized_end = "NA"
-
-                if (
-                    self.coordinator.data[self._system_id]["groupSettings"][
-                        "lanSettings"
-                    ]
-                    .get("prioritizedStation")
-                    .get("stationId")
-                ):
-                    if (
-                        self.coordinator.data[self._system_id]["groupSettings"][
-                            "lanSettings"
-                        ]["prioritizedStation"]["stationId"]
-                        == self._item_id
-                    ):
-                        end_time = self.coordinator.data[self._system_id][
-                            "groupSettings"
-                        ]["lanSettings"]["prioritizedStation"]["prioritizationEndTime"]
-                        is_prioritized_end = as_local(
-                            parse_datetime(end_time)
-                        ).strftime("%d-%b-%y %I:%M %p")
-
-                        if as_timestamp(parse_datetime(end_time)) > time.time():
-                            is_prioritized = True
-
-                self._attrs["prioritized"] = is_prioritized
-                self._attrs["prioritized_end"] = is_prioritized_end
-
-                if self.coordinator.data[self._system_id]["devices"][self._item_id][
-                    "paused"
-                ]:
-                    self._state = False
-                else:
-                    self._state = True
-            except TypeError:
-                pass
-            except KeyError:
-                pass
-
-        if self.coordinator.data:
-            self._mac = self.coordinator.data[self._system_id]["devices"][
-                self._item_id
-            ].get("macAddress", None)
-
-            self._attrs["mac"] = self._mac if self._mac else "NA"
-            self._attrs["ip"] = self.coordinator.data[self._system_id]["devices"][
-                self._item_id
-            ].get("ipAddress", "NA")
-
-            transmit_speed = float(
-                self.coordinator.data[self._system_id]["devices"][self._item_id]
-                .get("traffic", {})
-                .get("transmitSpeedBps", 0)
-            )
-
-            receive_speed = float(
-                self.coordinator.data[self._system_id]["devices"][self._item_id]
-                .get("traffic", {})
-                .get("receiveSpeedBps", 0)
-            )
-
-            self._attrs[
-                f"transmit_speed_{self._unit_of_measurement.replace('/', 'p').replace(' ', '_').lower()}"
-            ] = unit_convert(transmit_speed, self._unit_of_measurement)
-            self._attrs[
-                f"receive_speed_{self._unit_of_measurement.replace('/', 'p').replace(' ', '_').lower()}"
-            ] = unit_convert(receive_speed, self._unit_of_measurement)
+        unit_key = data_unit.replace("/", "p").replace(" ", "_").lower()
+        self._transmit_attr = f"transmit_speed_{unit_key}"
+        self._receive_attr = f"receive_speed_{unit_key}"
 
-            self._attrs["network"] = self.coordinator.data[self._system_id]["devices"][
-                self._item_id
-            ]["network"]
-
-        return self._state
-
-    @property
-    def available(self):
-        """Switch is not available if it is not connected."""
         try:
-            if (
-                self.coordinator.data[self._system_id]["devices"][self._item_id].get(
-                    "connected"
-                )
-                == True
-            ):
-                self._available = True
-            else:
-                self._available = False
-        except TypeError:
-            pass
-        except KeyError:
+            self._mac = coordinator.data[system_id].devices[item_id].mac_address
+        except (TypeError, KeyError):
             pass
 
-        return self._available
-
-    @property
-    def device_info(self):
-        """Define the device as a device tracker system."""
         if self._mac:
             mac = {(CONNECTION_NETWORK_MAC, self._mac)}
         else:
             mac = {}
 
-        device_info = {
+        self._attr_device_info = {
             ATTR_IDENTIFIERS: {(DOMAIN, self._item_id)},
             ATTR_CONNECTIONS: mac,
             ATTR_NAME: self._name,
@@ -241,21 +141,92 @@ class GoogleWifiSwitch(GoogleWifiEntity, SwitchEntity):
             "via_device": (DOMAIN, self._system_id),
         }
 
-        return device_info
+    @property
+    def is_on(self):
+        """Return the status of the internet for this device."""
+        return self._state
+
+    @property
+    def available(self):
+        """Switch is not available if it is not connected."""
+        return self._available
+
+    @callback
+    def _update_attrs(self):
+        """Compute the state and attributes from the coordinator data."""
+        super()._update_attrs()
+
+        try:
+            system = self.coordinator.data[self._system_id]
+            device = system.devices[self._item_id]
+        except (TypeError, KeyError):
+            device = None
+
+        if device is not None:
+            is_prioritized = False
+            is_prioritized_end = "NA"
+
+            if (
+                system.prioritized_station == self._item_id
+                and system.prioritization_end_time
+            ):
+                end_time = parse_datetime(system.prioritization_end_time)
+                is_prioritized_end = as_local(end_time).strftime("%d-%b-%y %I:%M %p")
+
+                if as_timestamp(end_time) > time.time():
+                    is_prioritized = True
+
+            self._attrs["prioritized"] = is_prioritized
+            self._attrs["prioritized_end"] = is_prioritized_end
+
+            self._state = not device.paused
+            self._available = device.connected
+            self._mac = device.mac_address
+
+            self._attrs["mac"] = self._mac if self._mac else "NA"
+            self._attrs["ip"] = device.ip_address or "NA"
+            self._attrs[self._transmit_attr] = round(
+                device.transmit_bps * self._unit_factor, 2
+            )
+            self._attrs[self._receive_attr] = round(
+                device.receive_bps * self._unit_factor, 2
+            )
+            self._attrs["network"] = device.network
+
+        if self._pending is not None and not self._pending.failed:
+            self._state = self._pending.value
+
+    def _slice_changed(self):
+        """Also write when a snapshot resolves a pending command."""
+        try:
+            device = self.coordinator.data[self._system_id].devices[self._item_id]
+            observed = not device.paused
+        except (TypeError, KeyError):
+            observed = None
+
+        return self._resolve_pending(observed) or super()._slice_changed()
 
     async def async_turn_on(self, **kwargs):
         """Turn on (unpause) internet to the client."""
-        self._state = True
-        self._last_change = time.time()
-        self.async_schedule_update_ha_state()
-        await self.coordinator.api.pause_device(self._system_id, self._item_id, False)
+        await self._async_set_paused(False)
 
     async def async_turn_off(self, **kwargs):
         """Turn on (pause) internet to the client."""
-        self._state = False
-        self._last_change = time.time()
-        self.async_schedule_update_ha_state()
-        await self.coordinator.api.pause_device(self._system_id, self._item_id, True)
+        await self._async_set_paused(True)
+
+    async def _async_set_paused(self, paused):
+        """Queue a pause command and show it until a snapshot confirms it."""
+        on_failure = self._start_command(not paused, self._state)
+
+        self.coordinator.commands.async_submit(
+            self._system_id,
+            self._item_id,
+            self.coordinator.api.pause_device,
+            self._system_id,
+            self._item_id,
+            paused,
+            on_failure=on_failure,
+        )
 
     async def async_prioritize_device(self, duration):
         """Prioritize a device for (optional) x hours."""
@@ -267,8 +238,10 @@ class GoogleWifiSwitch(GoogleWifiEntity, SwitchEntity):
             self._item_id,
             duration,
         )
+        await self.coordinator.async_request_refresh()
 
     async def async_clear_prioritization(self):
         """Clear previous prioritization."""
 
         await self.coordinator.api.clear_prioritization(self._system_id)
+        await self.coordinator.async_request_refresh()
@@ -0,0 +1,64 @@
+"""Rolling timings of the Google Wifi update cycle."""
+from collections import deque
+from contextlib import contextmanager
+import math
+import time
+
+from .const import TIMING_SAMPLES
+
+
+class PhaseTimings:
+    """Keep the latest durations of each phase of the update cycle.
+
+    Only a fixed number of samples is kept per phase, so the percentiles
+    follow recent behaviour and the memory use does not grow.
+    """
+
+    def __init__(self, samples: int = TIMING_SAMPLES):
+        """Initialize the timings."""
+        self._samples = samples
+        self._timings = {}
+
+    @contextmanager
+    def measure(self, phase: str):
+        """Time the enclosed block as a sample of a phase."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - started)
+
+    def record(self, phase: str, seconds: float):
+        """Add a duration in seconds to a phase."""
+        if phase not in self._timings:
+            self._timings[phase] = deque(maxlen=self._samples)
+
+        self._timings[phase].append(seconds)
+
+    @property
+    def phases(self):
+        """Return the phases that have samples."""
+        return self._timings.keys()
+
+    def history(self, phase: str) -> list:
+        """Return the samples of a phase in milliseconds, oldest first."""
+        return [round(seconds * 1000, 1) for seconds in self._timings.get(phase, ())]
+
+    def stats(self, phase: str):
+        """Return the p50, p95 and max of a phase in milliseconds, or None."""
+        samples = sorted(self._timings.get(phase, ()))
+        if not samples:
+            return None
+
+        return {
+            "p50": round(_percentile(samples, 50) * 1000, 1),
+            "p95": round(_percentile(samples, 95) * 1000, 1),
+            "max": round(samples[-1] * 1000, 1),
+            "samples": len(samples),
+        }
+
+
+def _percentile(samples: list, percent: float) -> float:
+    """Return the nearest-rank percentile of sorted samples."""
+    rank = math.ceil(percent / 100 * len(samples))
+    return samples[max(0, rank - 1)]
@@ -0,0 +1,189 @@
+"""Rolling traffic history of Google Wifi systems and devices."""
+from array import array
+import heapq
+import math
+
+from .const import TOP_DEVICES, TRAFFIC_MAX_SAMPLES
+
+
+class TrafficHistory:
+    """Fixed-size ring buffers of traffic samples.
+
+    Every poll writes one transmit and one receive sample per key (a system
+    or a (system, device) pair) into preallocated float arrays, with the poll
+    times kept once in a shared array. The memory per key is fixed by the
+    capacity and statistics are only computed when they are read.
+
+    Each key also keeps a running total of its traffic, so the mean of any
+    window can be read in constant time to rank keys without ordering their
+    samples.
+    """
+
+    def __init__(self, capacity: int):
+        """Initialize an empty history."""
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._position = 0
+        self._count = 0
+        self._rings = {}
+
+    def __len__(self) -> int:
+        """Return the number of tracked keys."""
+        return len(self._rings)
+
+    def record(self, now: float, samples: dict):
+        """Write the (transmit, receive) samples of a poll.
+
+        Keys that are missing from the samples are dropped from the history.
+        """
+        position = self._position
+        self._times[position] = now
+
+        for key in self._rings.keys() - samples.keys():
+            del self._rings[key]
+
+        for key, (transmit, receive) in samples.items():
+            ring = self._rings.get(key)
+            if ring is None:
+                ring = self._rings[key] = _TrafficRing(self.capacity, self._count)
+            ring.transmit[position] = transmit
+            ring.receive[position] = receive
+            ring.total += transmit + receive
+            ring.totals[self._count % (self.capacity + 1)] = ring.total
+
+        self._count += 1
+        self._position = (position + 1) % self.capacity
+
+    def stats(self, key, now: float, window: float):
+        """Return the mean, p95 and peak of the last window seconds, or None.
+
+        The window is cut short when the buffers hold fewer seconds, and the
+        seconds actually covered are returned with the statistics.
+        """
+        ring = self._rings.get(key)
+        if ring is None:
+            return None
+
+        available = min(self._count - ring.first, self.capacity)
+        transmit = []
+        receive = []
+        covered = window
+
+        for step in range(1, available + 1):
+            index = (self._position - step) % self.capacity
+            if now - self._times[index] > window:
+                break
+            transmit.append(ring.transmit[index])
+            receive.append(ring.receive[index])
+        else:
+            if available == self.capacity:
+                # The ring is full before the window is, so it is cut short.
+                covered = now - self._times[self._position]
+
+        if not transmit:
+            return None
+
+        return {
+            "samples": len(transmit),
+            "window": covered,
+            "transmit": _summary(transmit),
+            "receive": _summary(receive),
+        }
+
+    def window_samples(self, now: float, window: float) -> int:
+        """Return the number of polls within the last window seconds."""
+        samples = 0
+
+        for step in range(1, min(self._count, self.capacity) + 1):
+            index = (self._position - step) % self.capacity
+            if now - self._times[index] > window:
+                break
+            samples += 1
+
+        return samples
+
+    def largest(self, keys, now: float, window: float, count: int) -> list:
+        """Return the count keys with the highest mean traffic over the window.
+
+        The means come from the running totals, so only the top entries are
+        ordered and no samples are copied.
+        """
+        samples = self.window_samples(now, window)
+        if not samples:
+            return []
+
+        last = self._count - 1
+        slots = self.capacity + 1
+        means = []
+
+        for key in keys:
+            ring = self._rings.get(key)
+            if ring is None:
+                continue
+
+            taken = min(samples, self._count - ring.first)
+            total = ring.totals[last % slots] - ring.totals[(last - taken) % slots]
+            means.append((total / taken, key))
+
+        return [key for _mean, key in heapq.nlargest(count, means)]
+
+
+def traffic_samples(window: float, interval: float, system_interval: float) -> int:
+    """Return the buffer size that holds a window of polls at the shortest interval.
+
+    Both the station and the system polls record samples. The size is bounded
+    by TRAFFIC_MAX_SAMPLES.
+    """
+    samples = math.ceil(window / interval) + math.ceil(window / system_interval) + 1
+    return min(samples, TRAFFIC_MAX_SAMPLES)
+
+
+def top_devices(devices, count: int = TOP_DEVICES) -> list:
+    """Return the ids of the connected devices with the most current traffic.
+
+    Uses a bounded heap, so only the top entries are ordered instead of
+    sorting every device of the system.
+    """
+    return [
+        device.device_id
+        for device in heapq.nlargest(
+            count,
+            (
+                device
+                for device in devices
+                if device.connected and (device.transmit_bps or device.receive_bps)
+            ),
+            key=lambda device: device.transmit_bps + device.receive_bps,
+        )
+    ]
+
+
+class _TrafficRing:
+    """The transmit and receive samples of a single key.
+
+    totals holds the running total after each of the last polls, with one
+    more slot than the samples so the total before the oldest sample is
+    kept. A new key starts from a zero total.
+    """
+
+    __slots__ = ("transmit", "receive", "first", "total", "totals")
+
+    def __init__(self, capacity: int, first: int):
+        """Allocate the buffers of a key first seen in poll number first."""
+        self.transmit = array("f", bytes(4 * capacity))
+        self.receive = array("f", bytes(4 * capacity))
+        self.first = first
+        self.total = 0.0
+        self.totals = array("d", bytes(8 * (capacity + 1)))
+
+
+def _summary(values: list) -> dict:
+    """Return the mean, nearest-rank p95 and peak of the values."""
+    ordered = sorted(values)
+    rank = max(0, math.ceil(0.95 * len(ordered)) - 1)
+
+    return {
+        "mean": sum(ordered) / len(ordered),
+        "p95": ordered[rank],
+        "peak": ordered[-1],
+    }
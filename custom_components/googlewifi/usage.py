@@ -0,0 +1,132 @@
+"""Cumulative data usage of Google Wifi client devices."""
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DATA_USAGE_MAX_GAP,
+    DATA_USAGE_SAVE_DELAY,
+    DATA_USAGE_STORAGE_KEY,
+    STORAGE_VERSION,
+)
+
+DAY_TRANSMIT = 0
+DAY_RECEIVE = 1
+MONTH_TRANSMIT = 2
+MONTH_RECEIVE = 3
+
+
+class DataUsage:
+    """Daily and monthly bytes per device, integrated from the traffic rates.
+
+    Each poll adds the reported rate of every connected device times the
+    seconds since the previous poll. The counters are saved to a Store with
+    a delayed save, so they are checkpointed in batches rather than on every
+    poll, and they restart at midnight and on the first of the month.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        """Initialize the counters."""
+        self._store = Store(
+            hass, STORAGE_VERSION, f"{DATA_USAGE_STORAGE_KEY}.{entry_id}"
+        )
+        self._day = None
+        self._month = None
+        self._devices = {}
+        self._last_poll = {}
+
+    async def async_load(self):
+        """Restore the counters saved by a previous run."""
+        stored = await self._store.async_load() or {}
+
+        self._day = stored.get("day")
+        self._month = stored.get("month")
+        self._devices = {
+            tuple(key.split("/", 1)): counters
+            for key, counters in stored.get("devices", {}).items()
+        }
+
+    async def async_remove(self):
+        """Remove the saved counters."""
+        await self._store.async_remove()
+
+    def get(self, system_id: str, device_id: str):
+        """Return the counters of a device, or None if it has no usage."""
+        return self._devices.get((system_id, device_id))
+
+    @callback
+    def async_integrate(self, now: float, system_data: dict):
+        """Add the traffic of the connected devices since the previous poll.
+
+        Systems are polled separately, so the time since the previous poll is
+        kept per system.
+        """
+        self._roll_periods(system_data)
+        integrated = False
+
+        for system_id, system in system_data.items():
+            last_poll = self._last_poll.get(system_id)
+            self._last_poll[system_id] = now
+
+            if last_poll is None or not 0 < now - last_poll <= DATA_USAGE_MAX_GAP:
+                continue
+
+            elapsed = now - last_poll
+            integrated = True
+
+            for device_id, device in system.devices.items():
+                if not device.connected:
+                    continue
+
+                transmitted = device.transmit_bps * elapsed / 8
+                received = device.receive_bps * elapsed / 8
+                if not transmitted and not received:
+                    continue
+
+                counters = self._devices.get((system_id, device_id))
+                if counters is None:
+                    counters = self._devices[(system_id, device_id)] = [0, 0, 0, 0]
+
+                counters[DAY_TRANSMIT] += transmitted
+                counters[DAY_RECEIVE] += received
+                counters[MONTH_TRANSMIT] += transmitted
+                counters[MONTH_RECEIVE] += received
+
+        if integrated:
+            self._store.async_delay_save(self._data_to_save, DATA_USAGE_SAVE_DELAY)
+
+    def _roll_periods(self, system_data: dict):
+        """Restart the counters when a new day or month begins."""
+        today = dt_util.now().date()
+        day = today.isoformat()
+        month = day[:7]
+
+        if day == self._day:
+            return
+
+        if month != self._month:
+            self._devices = {}
+        else:
+            for key, counters in list(self._devices.items()):
+                system = system_data.get(key[0])
+                if system is not None and key[1] not in system.devices:
+                    del self._devices[key]
+                    continue
+
+                counters[DAY_TRANSMIT] = 0
+                counters[DAY_RECEIVE] = 0
+
+        self._day = day
+        self._month = month
+
+    @callback
+    def _data_to_save(self) -> dict:
+        """Return the counters in their stored form."""
+        return {
+            "day": self._day,
+            "month": self._month,
+            "devices": {
+                f"{system_id}/{device_id}": [round(value) for value in counters]
+                for (system_id, device_id), counters in self._devices.items()
+            },
+        }
@@ -0,0 +1,73 @@
+"""Fixtures for the Google Wifi tests."""
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.googlewifi.const import (
+    CONF_SPEEDTEST,
+    DOMAIN,
+    HTTP_SESSION,
+    REFRESH_TOKEN,
+)
+
+from .mock_cloud import MockCloudSession, MockGoogleWifiCloud
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load the integration from custom_components."""
+    yield
+
+
+@pytest.fixture
+def cloud_options() -> dict:
+    """Return the size of the mock cloud, overridden by tests."""
+    return {}
+
+
+@pytest.fixture
+async def mock_cloud(hass, socket_enabled, cloud_options):
+    """Start a mock Google Wifi cloud and route the integration to it.
+
+    Every session the integration opens, also after unloading the last entry
+    closed the previous one, sends its requests to the mock cloud.
+    """
+    cloud = MockGoogleWifiCloud(**cloud_options)
+    await cloud.start()
+
+    client_session_class = aiohttp.ClientSession
+
+    def client_session(**kwargs):
+        return MockCloudSession(cloud, client_session_class(**kwargs))
+
+    with patch(
+        "custom_components.googlewifi.session.aiohttp.ClientSession", client_session
+    ):
+        yield cloud
+
+    session = hass.data.pop(HTTP_SESSION, None)
+    if session is not None and not session.closed:
+        await session.close()
+    await cloud.close()
+
+
+@pytest.fixture
+def config_entry(hass) -> MockConfigEntry:
+    """Add a config entry with the automatic speed test turned off."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Google Wifi",
+        data={REFRESH_TOKEN: "mock-refresh-token", "add_disabled": True},
+        options={CONF_SPEEDTEST: False},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def async_setup_integration(hass, entry) -> bool:
+    """Set up a config entry and wait for its platforms."""
+    result = await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return result
@@ -0,0 +1,477 @@
+"""Local stand-in for the Google Wifi cloud.
+
+Serves the OAuth, token and Foyer endpoints called by googlewifi.GoogleWifi
+from synthetic systems of a configurable size. Every tick changes the
+traffic and connection state of a share of the stations and lets stations
+join and leave, so polls see a realistic amount of churn.
+
+The client is left untouched. MockCloudSession routes its https requests to
+the local aiohttp server, so the integration goes through the real client,
+aiohttp and JSON code.
+"""
+import asyncio
+from collections import Counter
+import random
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from yarl import URL
+
+FOYER = "/googlehomefoyer-pa.googleapis.com/v2"
+FRIENDLY_TYPES = ("Phone", "Laptop", "Tablet", "Speaker", "TV", "Camera")
+HARDWARE_TYPES = ("GALE", "MISTRAL", "ACJYW")
+PAUSED_FOREVER = "1970-01-01T00:00:00Z"
+
+
+class MockSystem:
+    """A synthetic Google Wifi system with its access points and stations."""
+
+    def __init__(self, index: int, access_points: int, stations: int, rng):
+        """Generate the access points and stations of the system."""
+        self.system_id = f"system-{index:03d}"
+        self.index = index
+        self.rng = rng
+        self.wan_status = "ONLINE"
+        self.paused = set()
+        self.prioritized = None
+        self.next_station = 0
+        self.access_points = {
+            f"{self.system_id}-ap-{number:03d}": {
+                "name": f"Point {number}",
+                "room": f"Room {number}",
+                "state": "AP_ONLINE",
+                "hardware": HARDWARE_TYPES[number % len(HARDWARE_TYPES)],
+                "intensity": 50,
+            }
+            for number in range(access_points)
+        }
+        self.stations = {}
+        for _ in range(stations):
+            self.add_station()
+
+    def add_station(self, guest_share: float = 0.1) -> str:
+        """Add a station and return its id."""
+        number = self.next_station
+        self.next_station += 1
+        station_id = f"{self.system_id}-station-{number:05d}"
+        guest = self.rng.random() < guest_share
+
+        if guest:
+            ip_address = f"192.168.{self.index % 256}.{number % 250 + 2}"
+        else:
+            ip_address = f"10.{self.index % 256}.{number // 250}.{number % 250 + 20}"
+
+        self.stations[station_id] = {
+            "id": station_id,
+            "friendlyName": f"Device {self.index}-{number}",
+            "friendlyType": FRIENDLY_TYPES[number % len(FRIENDLY_TYPES)],
+            "connected": True,
+            "ipAddress": ip_address,
+            "apId": list(self.access_points)[number % len(self.access_points)],
+            "macAddress": "02:{:02x}:{:02x}:{:02x}:{:02x}:{:02x}".format(
+                self.index % 256,
+                (number >> 16) & 0xFF,
+                (number >> 8) & 0xFF,
+                number & 0xFF,
+                self.rng.randrange(256),
+            ),
+            "traffic": self.random_traffic(),
+        }
+        return station_id
+
+    def random_traffic(self) -> dict:
+        """Return a random transmit and receive rate."""
+        return {
+            "transmitSpeedBps": str(self.rng.randrange(0, 2_000_000)),
+            "receiveSpeedBps": str(self.rng.randrange(0, 20_000_000)),
+        }
+
+    def tick(self, churn: float, turnover: float):
+        """Change a share of the stations and let some join and leave."""
+        stations = list(self.stations.values())
+
+        for station in self.rng.sample(stations, round(len(stations) * churn)):
+            if self.rng.random() < 0.2:
+                station["connected"] = not station["connected"]
+            station["traffic"] = self.random_traffic()
+
+        moving = round(len(stations) * turnover)
+        for station_id in self.rng.sample(list(self.stations), moving):
+            del self.stations[station_id]
+            self.paused.discard(station_id)
+        for _ in range(moving):
+            self.add_station()
+
+    def group(self) -> dict:
+        """Return the system as listed by the groups endpoint."""
+        prioritized = {}
+        if self.prioritized:
+            prioritized = {
+                "stationId": self.prioritized[0],
+                "prioritizationEndTime": self.prioritized[1],
+            }
+
+        return {
+            "id": self.system_id,
+            "groupProperties": {"otherProperties": {"firmwareVersion": "14150.376"}},
+            "groupSettings": {
+                "lanSettings": {
+                    "ipAddress": f"10.{self.index % 256}.0.1",
+                    "netmask": "255.255.0.0",
+                    "dhcpPoolBegin": f"10.{self.index % 256}.0.20",
+                    "prioritizedStation": prioritized,
+                },
+                "familyHubSettings": {
+                    "stationPolicies": [
+                        {
+                            "stationId": station_id,
+                            "blockingPolicy": {"expiryTimestamp": PAUSED_FOREVER},
+                        }
+                        for station_id in sorted(self.paused)
+                    ]
+                },
+            },
+            "accessPoints": [
+                {
+                    "id": ap_id,
+                    "accessPointSettings": {
+                        "accessPointOtherSettings": {
+                            "apName": access_point["name"],
+                            "roomData": {"name": access_point["room"]},
+                        },
+                        "lightingSettings": {"intensity": access_point["intensity"]},
+                    },
+                    "accessPointProperties": {
+                        "hardwareType": access_point["hardware"],
+                        "firmwareVersion": "14150.376",
+                    },
+                }
+                for ap_id, access_point in self.access_points.items()
+            ],
+        }
+
+    def status(self) -> dict:
+        """Return the WAN and access point status."""
+        return {
+            "wanConnectionStatus": self.wan_status,
+            "apStatuses": [
+                {"apId": ap_id, "apState": access_point["state"]}
+                for ap_id, access_point in self.access_points.items()
+            ],
+        }
+
+    def metrics(self) -> dict:
+        """Return the realtime traffic of the system and connected stations."""
+        connected = [
+            station for station in self.stations.values() if station["connected"]
+        ]
+        transmit = sum(int(item["traffic"]["transmitSpeedBps"]) for item in connected)
+        receive = sum(int(item["traffic"]["receiveSpeedBps"]) for item in connected)
+
+        return {
+            "groupTraffic": {
+                "transmitSpeedBps": str(transmit),
+                "receiveSpeedBps": str(receive),
+            },
+            "stationMetrics": [
+                {"station": {"id": station["id"]}, "traffic": station["traffic"]}
+                for station in connected
+            ],
+        }
+
+    def station_list(self) -> dict:
+        """Return the stations without the fields of other endpoints."""
+        return {
+            "stations": [
+                {
+                    key: value
+                    for key, value in station.items()
+                    if key not in ("macAddress", "traffic")
+                }
+                for station in self.stations.values()
+            ]
+        }
+
+
+class MockGoogleWifiCloud:
+    """Serve synthetic Google Wifi systems over the cloud API.
+
+    latency delays every response by that many seconds. requests counts the
+    requests per route, and rotate_tokens makes the issued API token invalid
+    so the next request is rejected like an expired token.
+    """
+
+    def __init__(
+        self,
+        systems: int = 1,
+        access_points: int = 3,
+        stations: int = 20,
+        churn: float = 0.05,
+        turnover: float = 0.0,
+        latency: float = 0.0,
+        seed: int = 0,
+    ):
+        """Generate the systems."""
+        rng = random.Random(seed)
+        self.systems = {}
+        for index in range(systems):
+            system = MockSystem(index, access_points, stations, rng)
+            self.systems[system.system_id] = system
+        self.churn = churn
+        self.turnover = turnover
+        self.latency = latency
+        self.requests = Counter()
+        self.commands = []
+        self._token_generation = 0
+        self._operations = {}
+        self._server = None
+
+    @property
+    def api_token(self) -> str:
+        """Return the API token currently accepted."""
+        return f"mock-api-token-{self._token_generation}"
+
+    def rotate_tokens(self):
+        """Reject the API tokens issued so far."""
+        self._token_generation += 1
+
+    def tick(self):
+        """Apply one round of churn to every system."""
+        for system in self.systems.values():
+            system.tick(self.churn, self.turnover)
+
+    async def start(self):
+        """Start the server on a free local port."""
+        app = web.Application(middlewares=[self._middleware])
+        app.add_routes(
+            [
+                web.post("/www.googleapis.com/oauth2/v4/token", self._access_token),
+                web.post(
+                    "/oauthaccountmanager.googleapis.com/v1/issuetoken",
+                    self._issue_token,
+                ),
+                web.get(f"{FOYER}/groups", self._groups),
+                web.get(f"{FOYER}/groups/{{system_id}}/status", self._status),
+                web.get(f"{FOYER}/groups/{{system_id}}/realtimeMetrics", self._metrics),
+                web.get(f"{FOYER}/groups/{{system_id}}/stations", self._stations),
+                web.post(
+                    f"{FOYER}/groups/{{system_id}}/stations/operations/sensitiveInfo",
+                    self._start_sensitive_info,
+                ),
+                web.get(f"{FOYER}/operations/{{operation_id}}", self._operation),
+                web.get(
+                    f"{FOYER}/operations/{{operation_id}}/sensitiveInfo",
+                    self._sensitive_info,
+                ),
+                web.put(
+                    f"{FOYER}/groups/{{system_id}}/stationBlocking", self._block_station
+                ),
+                web.put(
+                    f"{FOYER}/groups/{{system_id}}/prioritizedStation", self._prioritize
+                ),
+                web.delete(
+                    f"{FOYER}/groups/{{system_id}}/prioritizedStation",
+                    self._clear_prioritization,
+                ),
+                web.put(f"{FOYER}/accesspoints/{{ap_id}}/lighting", self._lighting),
+                web.post(f"{FOYER}/accesspoints/{{ap_id}}/reboot", self._reboot),
+                web.post(f"{FOYER}/groups/{{system_id}}/reboot", self._reboot),
+                web.post(
+                    f"{FOYER}/groups/{{system_id}}/wanSpeedTest", self._start_speed_test
+                ),
+                web.get(
+                    f"{FOYER}/groups/{{system_id}}/speedTestResults",
+                    self._speed_test_results,
+                ),
+            ]
+        )
+        self._server = TestServer(app, host="127.0.0.1")
+        await self._server.start_server()
+
+    async def close(self):
+        """Stop the server."""
+        await self._server.close()
+
+    def route(self, url) -> URL:
+        """Return the local URL serving a Google API URL."""
+        url = URL(url)
+        return self._server.make_url(f"/{url.host}{url.path}").with_query(url.query)
+
+    @web.middleware
+    async def _middleware(self, request, handler):
+        """Count the request, apply the latency and check the API token."""
+        self.requests[request.match_info.route.resource.canonical] += 1
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if request.path.startswith(FOYER) and (
+            request.headers.get("Authorization") != f"Bearer {self.api_token}"
+        ):
+            return web.json_response(
+                {
+                    "error": {
+                        "code": 401,
+                        "message": "Request had invalid authentication credentials.",
+                        "status": "UNAUTHENTICATED",
+                    }
+                },
+                status=401,
+            )
+
+        return await handler(request)
+
+    def _system(self, request) -> MockSystem:
+        """Return the system of a request or raise a 404."""
+        try:
+            return self.systems[request.match_info["system_id"]]
+        except KeyError as error:
+            raise web.HTTPNotFound() from error
+
+    def _operation_created(self, result=None) -> web.Response:
+        """Register a finished operation and return its creation."""
+        operation_id = f"operation-{len(self._operations)}"
+        self._operations[operation_id] = result
+        return web.json_response(
+            {"operation": {"operationId": operation_id, "operationState": "CREATED"}}
+        )
+
+    async def _access_token(self, request):
+        return web.json_response({"access_token": "mock-access-token"})
+
+    async def _issue_token(self, request):
+        if request.headers.get("Authorization") != "Bearer mock-access-token":
+            return web.json_response({})
+        return web.json_response({"token": self.api_token})
+
+    async def _groups(self, request):
+        return web.json_response(
+            {"groups": [system.group() for system in self.systems.values()]}
+        )
+
+    async def _status(self, request):
+        return web.json_response(self._system(request).status())
+
+    async def _metrics(self, request):
+        return web.json_response(self._system(request).metrics())
+
+    async def _stations(self, request):
+        return web.json_response(self._system(request).station_list())
+
+    async def _start_sensitive_info(self, request):
+        system = self._system(request)
+        station_ids = (await request.json())["stationIds"]
+        return self._operation_created(
+            [
+                {
+                    "stationId": station_id,
+                    "macAddress": system.stations[station_id]["macAddress"],
+                }
+                for station_id in station_ids
+                if station_id in system.stations
+            ]
+        )
+
+    async def _operation(self, request):
+        if request.match_info["operation_id"] not in self._operations:
+            raise web.HTTPNotFound()
+        return web.json_response({"operationState": "DONE"})
+
+    async def _sensitive_info(self, request):
+        result = self._operations.get(request.match_info["operation_id"])
+        return web.json_response({"stationSensitiveInfos": result or []})
+
+    async def _block_station(self, request):
+        system = self._system(request)
+        payload = await request.json()
+        station_id = payload["stationId"]
+        self.commands.append(("pause", station_id, payload["blocked"]))
+
+        if payload["blocked"] == "true":
+            system.paused.add(station_id)
+        else:
+            system.paused.discard(station_id)
+
+        return self._operation_created()
+
+    async def _prioritize(self, request):
+        payload = await request.json()
+        self._system(request).prioritized = (
+            payload["stationId"],
+            payload["prioritizationEndTime"],
+        )
+        return self._operation_created()
+
+    async def _clear_prioritization(self, request):
+        self._system(request).prioritized = None
+        return self._operation_created()
+
+    async def _lighting(self, request):
+        ap_id = request.match_info["ap_id"]
+        payload = await request.json()
+        self.commands.append(("lighting", ap_id, payload["intensity"]))
+
+        for system in self.systems.values():
+            if ap_id in system.access_points:
+                system.access_points[ap_id]["intensity"] = payload["intensity"]
+                return self._operation_created()
+
+        raise web.HTTPNotFound()
+
+    async def _reboot(self, request):
+        return self._operation_created()
+
+    async def _start_speed_test(self, request):
+        self._system(request)
+        return self._operation_created()
+
+    async def _speed_test_results(self, request):
+        self._system(request)
+        return web.json_response(
+            {
+                "speedTestResults": [
+                    {
+                        "transmitWanSpeedBps": "95000000",
+                        "receiveWanSpeedBps": "480000000",
+                    }
+                ]
+            }
+        )
+
+
+class MockCloudSession:
+    """Send the requests of a GoogleWifi client to the mock cloud.
+
+    Exposes the part of aiohttp.ClientSession the client and the integration
+    use, on top of a real session.
+    """
+
+    def __init__(self, cloud: MockGoogleWifiCloud, session):
+        """Wrap a real session."""
+        self._cloud = cloud
+        self._session = session
+
+    @property
+    def closed(self) -> bool:
+        """Return True if the wrapped session is closed."""
+        return self._session.closed
+
+    async def close(self):
+        """Close the wrapped session."""
+        await self._session.close()
+
+    def get(self, url, **kwargs):
+        """Send a GET request to the mock cloud."""
+        return self._session.get(self._cloud.route(url), **kwargs)
+
+    def post(self, url, **kwargs):
+        """Send a POST request to the mock cloud."""
+        return self._session.post(self._cloud.route(url), **kwargs)
+
+    def put(self, url, **kwargs):
+        """Send a PUT request to the mock cloud."""
+        return self._session.put(self._cloud.route(url), **kwargs)
+
+    def delete(self, url, **kwargs):
+        """Send a DELETE request to the mock cloud."""
+        return self._session.delete(self._cloud.route(url), **kwargs)
@@ -0,0 +1,71 @@
+"""Tests for adaptive polling of the stations."""
+from datetime import timedelta
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.googlewifi.const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_SPEEDTEST,
+    COORDINATOR,
+    DOMAIN,
+    POLLING_INTERVAL,
+)
+
+from .conftest import async_setup_integration
+from .mock_cloud import FOYER
+
+STATIONS_ROUTE = f"{FOYER}/groups/{{system_id}}/stations"
+MIN_INTERVAL = 10
+MAX_INTERVAL = 120
+
+
+async def test_adaptive_polling(hass, mock_cloud, config_entry):
+    """Traffic alone backs off, devices coming and going speed polls up."""
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={
+            CONF_SPEEDTEST: False,
+            CONF_ADAPTIVE_POLLING: True,
+            CONF_MIN_SCAN_INTERVAL: MIN_INTERVAL,
+            CONF_MAX_SCAN_INTERVAL: MAX_INTERVAL,
+        },
+    )
+    assert await async_setup_integration(hass, config_entry)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR]
+    system = next(iter(mock_cloud.systems.values()))
+    updater = coordinator.system_updaters[system.system_id]
+
+    def interval() -> float:
+        return updater.update_interval.total_seconds()
+
+    for expected in (2 * POLLING_INTERVAL, MAX_INTERVAL, MAX_INTERVAL):
+        for station in system.stations.values():
+            station["traffic"] = system.random_traffic()
+        await updater.async_refresh()
+        assert interval() == expected
+
+    station = next(iter(system.stations.values()))
+    station["connected"] = not station["connected"]
+    await updater.async_refresh()
+    assert interval() == POLLING_INTERVAL
+
+    await updater.async_refresh()
+    assert interval() == 2 * POLLING_INTERVAL
+
+    # A station that leaves brings the next poll forward.
+    del system.stations[station["id"]]
+    await updater.async_refresh()
+    assert interval() == MIN_INTERVAL
+
+    station_requests = mock_cloud.requests[STATIONS_ROUTE]
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=MIN_INTERVAL + 1)
+    )
+    await hass.async_block_till_done()
+    assert mock_cloud.requests[STATIONS_ROUTE] == station_requests + 1
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
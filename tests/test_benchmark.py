@@ -0,0 +1,157 @@
+"""End-to-end scale benchmark against the mock Google Wifi cloud.
+
+Sets up 50 access points and 5,000 clients over five systems, lets a share
+of the clients change before every poll and measures the poll wall time,
+the state writes per poll, the peak memory of a poll cycle and the longest
+event loop stall. Each figure has a regression threshold. The thresholds
+leave room for slow CI machines, so a failure means the cost of a poll grew,
+not that the machine was busy.
+
+GOOGLEWIFI_BENCHMARK_SCALE scales the number of clients, for example 0.1 for
+a quick run or 4 to look for the next bottleneck.
+"""
+import asyncio
+import os
+import statistics
+import time
+import tracemalloc
+
+import pytest
+
+from custom_components.googlewifi.const import COORDINATOR, DOMAIN
+
+from .conftest import async_setup_integration
+
+SCALE = float(os.environ.get("GOOGLEWIFI_BENCHMARK_SCALE", "1"))
+SYSTEMS = 5
+ACCESS_POINTS = 10
+STATIONS = max(10, round(1000 * SCALE))
+CHURN = 0.05
+POLLS = 5
+
+THRESHOLDS = {
+    # Seconds until every entity of every system is set up.
+    "setup_seconds": 30.0 * max(1.0, SCALE),
+    # Median and p95 seconds of a station poll of one system.
+    "station_poll_p50_seconds": 0.25 * max(1.0, SCALE),
+    "station_poll_p95_seconds": 0.5 * max(1.0, SCALE),
+    # Seconds of a get_systems poll of the whole account.
+    "system_poll_seconds": 1.0 * max(1.0, SCALE),
+    # Share of the entities of a system written per poll at 5% churn.
+    "write_share": 0.1,
+    # Peak memory allocated during a poll cycle of every system.
+    "peak_memory_mb": 25.0 * max(1.0, SCALE),
+    # Longest time the event loop was blocked during the polls.
+    "loop_stall_ms": 200.0 * max(1.0, SCALE),
+}
+
+
+@pytest.fixture
+def cloud_options() -> dict:
+    """Size the mock cloud for the benchmark."""
+    return {
+        "systems": SYSTEMS,
+        "access_points": ACCESS_POINTS,
+        "stations": STATIONS,
+        "churn": CHURN,
+    }
+
+
+class LoopStallMonitor:
+    """Measure the longest time the event loop did not run a timer on time."""
+
+    def __init__(self, interval: float = 0.005):
+        """Initialize the monitor."""
+        self.interval = interval
+        self.longest = 0.0
+        self._task = None
+
+    def __enter__(self):
+        """Start watching the event loop."""
+        self._task = asyncio.get_running_loop().create_task(self._watch())
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop watching the event loop."""
+        self._task.cancel()
+
+    async def _watch(self):
+        """Sleep in short steps and record how late each wake up is."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.longest = max(self.longest, loop.time() - started - self.interval)
+
+
+async def test_scale(hass, mock_cloud, config_entry):
+    """Poll 5,000 clients and compare the costs with the thresholds."""
+    # Debug mode checks every callback and would dominate the timings.
+    asyncio.get_running_loop().set_debug(False)
+
+    started = time.perf_counter()
+    assert await async_setup_integration(hass, config_entry)
+    setup_seconds = time.perf_counter() - started
+
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR]
+    updaters = list(coordinator.system_updaters.values())
+    assert len(updaters) == SYSTEMS
+    entities_per_system = len(hass.states.async_all()) / SYSTEMS
+
+    poll_seconds = []
+    writes = []
+
+    with LoopStallMonitor() as monitor:
+        for _ in range(POLLS):
+            mock_cloud.tick()
+
+            for updater in updaters:
+                state_writes = coordinator.state_writes
+                started = time.perf_counter()
+                await updater.async_refresh()
+                poll_seconds.append(time.perf_counter() - started)
+                writes.append(coordinator.state_writes - state_writes)
+                assert updater.last_update_success
+
+            await asyncio.sleep(0)
+
+        started = time.perf_counter()
+        await coordinator.async_refresh()
+        system_poll_seconds = time.perf_counter() - started
+        assert coordinator.last_update_success
+
+    mock_cloud.tick()
+    tracemalloc.start()
+    try:
+        for updater in updaters:
+            await updater.async_refresh()
+        _current, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    results = {
+        "setup_seconds": setup_seconds,
+        "station_poll_p50_seconds": statistics.median(poll_seconds),
+        "station_poll_p95_seconds": statistics.quantiles(poll_seconds, n=20)[-1],
+        "system_poll_seconds": system_poll_seconds,
+        "write_share": statistics.mean(writes) / entities_per_system,
+        "peak_memory_mb": peak_memory / 2**20,
+        "loop_stall_ms": monitor.longest * 1000,
+    }
+
+    print(
+        f"\nGoogle Wifi benchmark: {SYSTEMS} systems, "
+        f"{SYSTEMS * ACCESS_POINTS} access points, {SYSTEMS * STATIONS} clients, "
+        f"{len(hass.states.async_all())} entities, "
+        f"{statistics.mean(writes):.0f} state writes per poll"
+    )
+    for name, value in results.items():
+        print(f"  {name:<26} {value:>10.3f}  (threshold {THRESHOLDS[name]:.3f})")
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+    exceeded = {
+        name: value for name, value in results.items() if value > THRESHOLDS[name]
+    }
+    assert not exceeded, f"Benchmark thresholds exceeded: {exceeded}"
@@ -0,0 +1,228 @@
+"""Tests for the command queue and the confirmation of commands."""
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+from aiohttp import ClientError
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from custom_components.googlewifi.commands import CommandQueue, PendingCommand
+from custom_components.googlewifi.const import (
+    COMMAND_CONFIRM_TIMEOUT,
+    COMMAND_DEBOUNCE,
+    COORDINATOR,
+    DOMAIN,
+)
+
+from .conftest import async_setup_integration
+
+
+class FakeApi:
+    """Record the commands and how many run at once."""
+
+    def __init__(self, result=True, error=None):
+        """Initialize the fake API."""
+        self.calls = []
+        self.result = result
+        self.error = error
+        self.running = 0
+        self.most_running = 0
+
+    async def command(self, target, value):
+        """Run a command."""
+        self.running += 1
+        self.most_running = max(self.most_running, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            self.calls.append((target, value))
+            if self.error:
+                raise self.error
+            return self.result
+        finally:
+            self.running -= 1
+
+
+async def async_flush(hass, queue):
+    """Let the debounce delay pass and wait for the queued commands."""
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=COMMAND_DEBOUNCE + 1)
+    )
+    await hass.async_block_till_done()
+    await asyncio.gather(*queue._tasks)
+
+
+async def test_collapse(hass):
+    """Only the last command for a target is sent."""
+    api = FakeApi()
+    sent = []
+
+    async def on_sent():
+        sent.append(True)
+
+    queue = CommandQueue(hass, on_sent=on_sent)
+
+    for value in (True, False, True):
+        queue.async_submit("system-1", "device-1", api.command, "device-1", value)
+    queue.async_submit("system-1", "device-2", api.command, "device-2", False)
+    await async_flush(hass, queue)
+
+    assert sorted(api.calls) == [("device-1", True), ("device-2", False)]
+    assert (queue.sent, queue.collapsed, queue.failed) == (2, 2, 0)
+    assert len(sent) == 2
+
+
+async def test_send_replaces_pending(hass):
+    """A command sent right away drops the queued one for the same target."""
+    api = FakeApi()
+    queue = CommandQueue(hass)
+
+    queue.async_submit("system-1", "device-1", api.command, "device-1", 1)
+    assert await queue.async_send("system-1", "device-1", api.command, "device-1", 2)
+    await async_flush(hass, queue)
+
+    assert api.calls == [("device-1", 2)]
+    assert (queue.sent, queue.collapsed) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    ("result", "error"),
+    [(False, None), (True, ClientError("reset")), (True, asyncio.TimeoutError())],
+)
+async def test_failure(hass, result, error):
+    """A rejected or failed command calls back and is counted."""
+    api = FakeApi(result, error)
+    failures = []
+    queue = CommandQueue(hass)
+
+    queue.async_submit(
+        "system-1",
+        "device-1",
+        api.command,
+        "device-1",
+        True,
+        on_failure=lambda: failures.append(True),
+    )
+    await async_flush(hass, queue)
+
+    assert failures == [True]
+    assert (queue.sent, queue.failed) == (0, 1)
+    assert not await queue.async_send(
+        "system-1", "device-1", api.command, "device-1", True
+    )
+    assert queue.failed == 2
+
+
+async def test_serialized_per_system(hass):
+    """Commands of a system are sent one at a time, systems in parallel."""
+    one_system = FakeApi()
+    two_systems = FakeApi()
+    queue = CommandQueue(hass)
+
+    await asyncio.gather(
+        *[
+            queue.async_send("system-1", target, one_system.command, target, 1)
+            for target in ("device-1", "device-2", "device-3")
+        ],
+        *[
+            queue.async_send(system_id, "device-1", two_systems.command, system_id, 1)
+            for system_id in ("system-2", "system-3")
+        ],
+    )
+
+    assert one_system.most_running == 1
+    assert two_systems.most_running == 2
+
+
+async def test_shutdown(hass):
+    """Pending commands are dropped on shutdown."""
+    api = FakeApi()
+    queue = CommandQueue(hass)
+
+    queue.async_submit("system-1", "device-1", api.command, "device-1", 1)
+    await queue.async_shutdown()
+    await async_flush(hass, queue)
+
+    assert api.calls == []
+
+
+@pytest.mark.parametrize(
+    ("observed", "failed", "elapsed", "result"),
+    [
+        (False, False, 0, "confirmed"),
+        (False, True, 0, "confirmed"),
+        (True, True, 0, "failed"),
+        (None, False, 0, "contradicted"),
+        (True, False, 0, None),
+        (True, False, COMMAND_CONFIRM_TIMEOUT + 1, "expired"),
+    ],
+)
+def test_resolve(observed, failed, elapsed, result):
+    """A pending command resolves against the observed value."""
+    pending = PendingCommand(False, True)
+    pending.failed = failed
+
+    with patch(
+        "custom_components.googlewifi.commands.time.monotonic",
+        return_value=pending.started + elapsed,
+    ):
+        assert pending.resolve(observed, COMMAND_CONFIRM_TIMEOUT) == result
+
+
+@pytest.fixture
+def cloud_options() -> dict:
+    """Use one small system."""
+    return {"systems": 1, "access_points": 1, "stations": 3}
+
+
+async def test_switch_confirmed(hass, mock_cloud, config_entry):
+    """A pause shows right away and is confirmed by a snapshot."""
+    assert await async_setup_integration(hass, config_entry)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR]
+    system = next(iter(mock_cloud.systems.values()))
+    device_id = next(iter(system.stations))
+    entity_id = er.async_get(hass).async_get_entity_id("switch", DOMAIN, device_id)
+
+    await hass.services.async_call(
+        "switch", "turn_off", {"entity_id": entity_id}, blocking=True
+    )
+    assert hass.states.get(entity_id).state == STATE_OFF
+    assert device_id not in system.paused
+
+    await async_flush(hass, coordinator.commands)
+    await hass.async_block_till_done()
+
+    assert device_id in system.paused
+    assert hass.states.get(entity_id).state == STATE_OFF
+    assert len(coordinator.command_latency["switch"]) == 1
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_switch_failed(hass, mock_cloud, config_entry):
+    """A pause the API fails reverts the switch."""
+    assert await async_setup_integration(hass, config_entry)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR]
+    system = next(iter(mock_cloud.systems.values()))
+    device_id = next(iter(system.stations))
+    entity_id = er.async_get(hass).async_get_entity_id("switch", DOMAIN, device_id)
+
+    with patch.object(
+        coordinator.api, "pause_device", side_effect=ClientError("reset")
+    ):
+        await hass.services.async_call(
+            "switch", "turn_off", {"entity_id": entity_id}, blocking=True
+        )
+        assert hass.states.get(entity_id).state == STATE_OFF
+
+        await async_flush(hass, coordinator.commands)
+
+    assert hass.states.get(entity_id).state == STATE_ON
+    assert coordinator.commands.failed == 1
+    assert "switch" not in coordinator.command_latency
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
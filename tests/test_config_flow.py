@@ -0,0 +1,96 @@
+"""Tests for the config flow."""
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant import config_entries
+from homeassistant.const import CONF_NAME
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.googlewifi.const import (
+    ADD_DISABLED,
+    DOMAIN,
+    REFRESH_TOKEN,
+    account_unique_id,
+)
+
+from .conftest import async_setup_integration
+
+
+async def async_configure(hass, name, token):
+    """Run the user step of the config flow."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["type"] == FlowResultType.FORM
+
+    with patch("custom_components.googlewifi.async_setup_entry", return_value=True):
+        return await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_NAME: name, REFRESH_TOKEN: token, ADD_DISABLED: True},
+        )
+
+
+async def test_create_entry(hass, mock_cloud):
+    """The entry is named by the user and identified by the account."""
+    result = await async_configure(hass, " Home ", "token-1")
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["title"] == "Home"
+    assert result["data"] == {REFRESH_TOKEN: "token-1", ADD_DISABLED: True}
+    assert result["result"].unique_id == account_unique_id(mock_cloud.systems)
+
+
+async def test_same_account(hass, mock_cloud):
+    """The same account cannot be added twice, even with another token."""
+    await async_configure(hass, "Home", "token-1")
+    result = await async_configure(hass, "Cabin", "token-2")
+
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+
+
+async def test_name_exists(hass, mock_cloud):
+    """Another account needs another name."""
+    MockConfigEntry(domain=DOMAIN, title="Home", unique_id="system-999").add_to_hass(
+        hass
+    )
+
+    result = await async_configure(hass, "Home", "token-1")
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {CONF_NAME: "name_exists"}
+
+    with patch("custom_components.googlewifi.async_setup_entry", return_value=True):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_NAME: "Cabin", REFRESH_TOKEN: "token-1", ADD_DISABLED: True},
+        )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["title"] == "Cabin"
+
+
+async def test_invalid_token(hass, mock_cloud):
+    """A token the cloud does not accept shows an error."""
+    with patch(
+        "custom_components.googlewifi.config_flow.GoogleWifi.get_systems",
+        return_value=None,
+    ):
+        result = await async_configure(hass, "Home", "token-1")
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_auth"}
+
+
+async def test_migrate_unique_id(hass, mock_cloud, config_entry):
+    """Entries identified by their refresh token move to the account."""
+    hass.config_entries.async_update_entry(
+        config_entry, unique_id=config_entry.data[REFRESH_TOKEN]
+    )
+
+    assert await async_setup_integration(hass, config_entry)
+
+    assert config_entry.unique_id == account_unique_id(mock_cloud.systems)
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
@@ -0,0 +1,164 @@
+"""Tests for the per-system device index."""
+import random
+
+import pytest
+
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.googlewifi.const import COORDINATOR, DOMAIN
+from custom_components.googlewifi.device_index import DeviceIndex
+
+from .conftest import async_setup_integration
+
+SYSTEMS = 4
+DEVICES = 10_000
+
+
+def synthetic_devices() -> dict:
+    """Spread 10,000 synthetic devices over the systems."""
+    systems = {f"system-{number}": {} for number in range(SYSTEMS)}
+    for number in range(DEVICES):
+        systems[f"system-{number % SYSTEMS}"][f"device-{number:05d}"] = {}
+    return systems
+
+
+def test_initial_poll():
+    """Every device of the first poll joins its own system."""
+    index = DeviceIndex()
+    index.next_generation()
+
+    for system_id, devices in synthetic_devices().items():
+        joined, left = index.update(system_id, devices)
+        assert joined == devices.keys()
+        assert not left
+
+    assert len(index) == DEVICES
+    assert ("system-0", "device-00000") in index
+    assert ("system-1", "device-00000") not in index
+    assert index.get("system-1", "device-00001").first_seen == 1
+
+
+def test_join_and_leave_across_systems():
+    """Only the devices that joined or left are reported and written."""
+    rng = random.Random(1)
+    systems = synthetic_devices()
+    index = DeviceIndex()
+    index.next_generation()
+    for system_id, devices in systems.items():
+        index.update(system_id, devices)
+
+    records = {
+        (system_id, device_id): index.get(system_id, device_id)
+        for system_id, devices in systems.items()
+        for device_id in devices
+    }
+
+    # Every system loses 50 devices, gains 25 and hands one to the next system.
+    expected = {}
+    for system_id, devices in systems.items():
+        left = set(rng.sample(sorted(devices), 50))
+        joined = {f"new-{system_id}-{count}" for count in range(25)}
+        for device_id in left:
+            del devices[device_id]
+        devices.update(dict.fromkeys(joined, {}))
+        expected[system_id] = (joined, left)
+
+    for number, system_id in enumerate(systems):
+        moved = f"device-{number:05d}"
+        target = f"system-{(number + 1) % SYSTEMS}"
+        if systems[system_id].pop(moved, None) is not None:
+            expected[system_id][1].add(moved)
+            systems[target][moved] = {}
+            expected[target][0].add(moved)
+
+    index.next_generation()
+    for system_id, devices in systems.items():
+        joined, left = index.update(system_id, devices)
+        assert joined == expected[system_id][0]
+        assert left == expected[system_id][1]
+        assert index.devices(system_id) == devices.keys()
+
+    assert len(index) == sum(len(devices) for devices in systems.values())
+
+    for (system_id, device_id), record in records.items():
+        if device_id in systems[system_id]:
+            # Devices that stayed keep their record and generation.
+            assert index.get(system_id, device_id) is record
+            assert record.first_seen == 1
+        else:
+            assert index.get(system_id, device_id) is None
+
+    for system_id, (joined, _left) in expected.items():
+        for device_id in joined:
+            assert index.get(system_id, device_id).first_seen == 2
+
+
+def test_unchanged_poll():
+    """A poll without changes reports nothing."""
+    systems = synthetic_devices()
+    index = DeviceIndex()
+    index.next_generation()
+    for system_id, devices in systems.items():
+        index.update(system_id, devices)
+
+    index.next_generation()
+    for system_id, devices in systems.items():
+        assert index.update(system_id, dict(devices)) == (set(), set())
+
+
+def test_prune_systems():
+    """Systems that left the account take their devices with them."""
+    systems = synthetic_devices()
+    index = DeviceIndex()
+    index.next_generation()
+    for system_id, devices in systems.items():
+        index.update(system_id, devices)
+
+    removed = index.prune(["system-0", "system-1"])
+
+    assert sorted(removed) == sorted(
+        (system_id, device_id)
+        for system_id in ("system-2", "system-3")
+        for device_id in systems[system_id]
+    )
+    assert len(index) == len(systems["system-0"]) + len(systems["system-1"])
+    assert not index.devices("system-2")
+
+
+@pytest.fixture
+def cloud_options() -> dict:
+    """Let a tenth of the stations of three systems change every tick."""
+    return {"systems": 3, "access_points": 2, "stations": 100, "turnover": 0.1}
+
+
+async def test_coordinator_membership(hass, mock_cloud, config_entry):
+    """Joins and leaves on the cloud reach the index and the entities."""
+    assert await async_setup_integration(hass, config_entry)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR]
+    entity_registry = er.async_get(hass)
+
+    seen = set()
+    for _ in range(3):
+        mock_cloud.tick()
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+        stations = set()
+        for system_id, system in mock_cloud.systems.items():
+            assert coordinator.device_index.devices(system_id) == (
+                system.stations.keys()
+            )
+            stations.update(system.stations)
+        seen |= stations
+
+        switches = {
+            entity.unique_id
+            for entity in er.async_entries_for_config_entry(
+                entity_registry, config_entry.entry_id
+            )
+            if entity.domain == "switch"
+        }
+        assert stations <= switches
+        assert not switches & (seen - stations)
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
@@ -0,0 +1,29 @@
+"""Tests for the diagnostics."""
+from homeassistant.components.diagnostics import REDACTED
+
+from custom_components.googlewifi.const import COORDINATOR, DOMAIN, REFRESH_TOKEN
+from custom_components.googlewifi.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+from .conftest import async_setup_integration
+
+
+async def test_diagnostics(hass, mock_cloud, config_entry):
+    """Diagnostics redact the token and report the size of the responses."""
+    assert await async_setup_integration(hass, config_entry)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR]
+    system_id = next(iter(mock_cloud.systems))
+    await coordinator.system_updaters[system_id].async_refresh()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    assert diagnostics["entry"]["data"][REFRESH_TOKEN] == REDACTED
+    payload = diagnostics["payload"]
+    station_bytes = payload["station_response_bytes"]
+    assert list(station_bytes) == [system_id]
+    # The system tier fetches the stations of every system and more.
+    assert payload["system_response_bytes"] > station_bytes[system_id] > 0
+    assert set(payload["systems"]) == set(mock_cloud.systems)
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
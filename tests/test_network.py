@@ -0,0 +1,84 @@
+"""Tests for the classification of device addresses."""
+import pytest
+
+from custom_components.googlewifi.models import SystemView
+from custom_components.googlewifi.network import SubnetClassifier
+
+
+def system(**lan_settings) -> SystemView:
+    """Return a system view with the given LAN settings."""
+    return SystemView("system-1", {"groupSettings": {"lanSettings": lan_settings}})
+
+
+@pytest.mark.parametrize(
+    ("address", "netmask", "inside", "outside"),
+    [
+        (
+            "10.0.1.1",
+            "255.255.252.0",
+            ["10.0.0.1", "10.0.3.254"],
+            ["10.0.4.1", "10.1.0.1", "192.168.86.20"],
+        ),
+        (
+            "10.0.1.1",
+            "255.255.0.0",
+            ["10.0.0.1", "10.0.255.254"],
+            ["10.1.0.1", "11.0.0.1"],
+        ),
+        ("10.0.0.1", "255.255.255.0", ["10.0.0.254"], ["10.0.1.1"]),
+    ],
+)
+def test_prefix(address, netmask, inside, outside):
+    """Addresses match on the prefix length of the netmask."""
+    classifier = SubnetClassifier.from_system(
+        system(ipAddress=address, netmask=netmask)
+    )
+
+    for device_address in inside:
+        assert device_address in classifier
+    for device_address in outside:
+        assert device_address not in classifier
+
+
+def test_missing_netmask():
+    """Without a netmask the LAN is a /24 network."""
+    classifier = SubnetClassifier.from_system(system(ipAddress="192.168.86.1"))
+
+    assert str(classifier.network) == "192.168.86.0/24"
+    assert "192.168.86.20" in classifier
+    assert "192.168.87.20" not in classifier
+
+
+def test_dhcp_pool():
+    """Without a LAN address the DHCP pool locates the network."""
+    classifier = SubnetClassifier.from_system(
+        system(dhcpPoolBegin="10.0.4.20", netmask="255.255.252.0")
+    )
+
+    assert str(classifier.network) == "10.0.4.0/22"
+
+
+@pytest.mark.parametrize(
+    "lan_settings",
+    [
+        {},
+        {"netmask": "255.255.255.0"},
+        {"ipAddress": "10.0.0.1", "netmask": "255.0.255.0"},
+        {"ipAddress": "10.0.0.1", "netmask": "not a netmask"},
+        {"ipAddress": "10.0.0", "netmask": "255.255.255.0"},
+        {"ipAddress": "10.0.0.256"},
+    ],
+)
+def test_unusable_lan_settings(lan_settings):
+    """LAN settings that do not describe a network give no classifier."""
+    assert SubnetClassifier.from_system(system(**lan_settings)) is None
+
+
+@pytest.mark.parametrize(
+    "address", [None, "", "10.0.0", "10.0.0.256", "10.0.0.1.5", "fe80::1", "host"]
+)
+def test_malformed_address(address):
+    """Addresses that are not IPv4 addresses are not on the network."""
+    classifier = SubnetClassifier("10.0.0.1", "255.0.0.0")
+
+    assert address not in classifier
@@ -0,0 +1,168 @@
+"""Tests for the device policy."""
+import pytest
+
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.googlewifi.const import (
+    CONF_DEVICE_FILTER,
+    CONF_DEVICE_FILTER_MODE,
+    CONF_MAIN_NETWORK_ONLY,
+    CONF_SPEEDTEST,
+    FILTER_ALLOW,
+    FILTER_DENY,
+)
+from custom_components.googlewifi.models import DeviceView
+from custom_components.googlewifi.policy import DevicePolicy
+
+from .conftest import async_setup_integration
+
+
+def device(mac="02:00:00:00:00:01", friendly_type="Phone", network="main"):
+    """Return a device view with the given identity and network."""
+    view = DeviceView("device-1", {"macAddress": mac, "friendlyType": friendly_type})
+    view.network = network
+    return view
+
+
+def test_no_filter():
+    """Without a filter every device is allowed."""
+    policy = DevicePolicy()
+
+    assert policy.allows(device())
+    assert not policy.excludes(device())
+
+
+@pytest.mark.parametrize(
+    ("device_filter", "matches"),
+    [
+        ("02:00:00:00:00:01", True),
+        ("02-00-00-00-00-01", True),
+        ("02:00:00:00:00:02", False),
+        ("02:00:00", True),
+        ("02:00:01", False),
+        ("phone", True),
+        (" Laptop , Phone ", True),
+        ("Laptop", False),
+        ("", False),
+    ],
+)
+def test_allow_and_deny(device_filter, matches):
+    """Devices match by MAC, vendor prefix and device type."""
+    allow = DevicePolicy(mode=FILTER_ALLOW, device_filter=device_filter)
+    deny = DevicePolicy(mode=FILTER_DENY, device_filter=device_filter)
+
+    assert allow.allows(device()) is matches
+    assert allow.excludes(device()) is not matches
+    assert deny.allows(device()) is not matches
+    assert deny.excludes(device()) is matches
+
+
+def test_unknown_mode():
+    """An unknown mode does not filter."""
+    policy = DevicePolicy(mode="other", device_filter="Laptop")
+
+    assert policy.mode is None
+    assert policy.allows(device())
+
+
+def test_device_without_mac():
+    """A device without a MAC address can still match by type."""
+    policy = DevicePolicy(mode=FILTER_ALLOW, device_filter="02:00:00, Phone")
+
+    assert policy.allows(device(mac=None))
+    assert not policy.allows(device(mac=None, friendly_type="TV"))
+
+
+@pytest.mark.parametrize(
+    ("network", "allows", "excludes"),
+    [("main", True, False), ("guest", False, True), (None, False, False)],
+)
+def test_main_network_only(network, allows, excludes):
+    """Offline devices of unknown network get no entities but keep theirs."""
+    policy = DevicePolicy(main_network_only=True)
+
+    assert policy.allows(device(network=network)) is allows
+    assert policy.excludes(device(network=network)) is excludes
+
+
+@pytest.fixture
+def cloud_options() -> dict:
+    """Use one system with a few guests."""
+    return {"systems": 1, "access_points": 1, "stations": 40}
+
+
+async def test_offline_devices_keep_entities(hass, mock_cloud, config_entry):
+    """A reload with offline devices keeps their entities on the main network."""
+    hass.config_entries.async_update_entry(
+        config_entry, options={CONF_SPEEDTEST: False, CONF_MAIN_NETWORK_ONLY: True}
+    )
+    assert await async_setup_integration(hass, config_entry)
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_registry = er.async_get(hass)
+
+    def trackers() -> set:
+        return {
+            entity.unique_id
+            for entity in er.async_entries_for_config_entry(
+                entity_registry, config_entry.entry_id
+            )
+            if entity.domain == "device_tracker"
+        }
+
+    system = next(iter(mock_cloud.systems.values()))
+    main = {
+        station_id
+        for station_id, station in system.stations.items()
+        if station["ipAddress"].startswith("10.")
+    }
+    assert trackers() == main
+
+    offline = sorted(main)[:5]
+    for station_id in offline:
+        system.stations[station_id]["connected"] = False
+
+    assert await async_setup_integration(hass, config_entry)
+
+    assert trackers() == main
+
+    # A device on the guest network is still removed.
+    guest = sorted(main)[5]
+    system.stations[guest]["ipAddress"] = "192.168.0.99"
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    assert await async_setup_integration(hass, config_entry)
+
+    assert trackers() == main - {guest}
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_filter_removes_entities(hass, mock_cloud, config_entry):
+    """Entities of devices the new filter denies are removed on reload."""
+    assert await async_setup_integration(hass, config_entry)
+    system = next(iter(mock_cloud.systems.values()))
+    denied = next(iter(system.stations.values()))
+
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={
+            CONF_SPEEDTEST: False,
+            CONF_DEVICE_FILTER_MODE: FILTER_DENY,
+            CONF_DEVICE_FILTER: denied["macAddress"],
+        },
+    )
+    await hass.async_block_till_done()
+
+    entity_registry = er.async_get(hass)
+    unique_ids = {
+        entity.unique_id
+        for entity in er.async_entries_for_config_entry(
+            entity_registry, config_entry.entry_id
+        )
+    }
+    assert denied["id"] not in unique_ids
+    assert len(system.stations) > 1
+    assert set(system.stations) - {denied["id"]} <= unique_ids
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
@@ -0,0 +1,95 @@
+"""Tests for the station and system polling tiers."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.googlewifi.const import COORDINATOR, DOMAIN
+
+from .conftest import async_setup_integration
+from .mock_cloud import FOYER
+
+STATIONS_ROUTE = f"{FOYER}/groups/{{system_id}}/stations"
+
+
+@pytest.fixture
+def cloud_options() -> dict:
+    """Use two systems."""
+    return {"systems": 2, "access_points": 2, "stations": 20}
+
+
+async def test_station_poll_keeps_base_only(hass, mock_cloud, config_entry):
+    """Station polls reuse the settings of the system tier, not its payload."""
+    assert await async_setup_integration(hass, config_entry)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR]
+    system = next(iter(mock_cloud.systems.values()))
+    system.paused.add(next(iter(system.stations)))
+
+    await coordinator.async_refresh()
+    system_view = coordinator.data[system.system_id]
+
+    base = coordinator._station_bases[system.system_id]
+    assert set(base["groupSettings"]) == {"lanSettings"}
+    assert "accessPoints" not in base
+    for device in base["devices"].values():
+        assert set(device) <= {"paused", "macAddress"}
+
+    updater = coordinator.system_updaters[system.system_id]
+    await updater.async_refresh()
+    station_view = coordinator.data[system.system_id]
+
+    assert station_view is not system_view
+    assert station_view.lan_address == system_view.lan_address
+    assert station_view.firmware_version == system_view.firmware_version
+    assert station_view.access_points == system_view.access_points
+    for device_id, device in station_view.devices.items():
+        assert device.paused == system_view.devices[device_id].paused
+        assert device.mac_address == system_view.devices[device_id].mac_address
+    assert any(device.paused for device in station_view.devices.values())
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_station_poll_waits_for_system_poll(hass, mock_cloud, config_entry):
+    """A slow system poll does not bring back a station that just left."""
+    assert await async_setup_integration(hass, config_entry)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR]
+    system = next(iter(mock_cloud.systems.values()))
+    updater = coordinator.system_updaters[system.system_id]
+    departed = next(iter(system.stations))
+
+    get_systems = coordinator.api.get_systems
+    fetched = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_get_systems():
+        # Fetch before the station leaves and return after the station poll.
+        systems = await get_systems()
+        fetched.set()
+        await release.wait()
+        return systems
+
+    with patch.object(coordinator.api, "get_systems", slow_get_systems):
+        system_poll = hass.async_create_task(coordinator.async_refresh())
+        await fetched.wait()
+
+        del system.stations[departed]
+        station_requests = mock_cloud.requests[STATIONS_ROUTE]
+        station_poll = hass.async_create_task(updater.async_refresh())
+        await asyncio.sleep(0.1)
+
+        assert not station_poll.done()
+        assert mock_cloud.requests[STATIONS_ROUTE] == station_requests
+
+        release.set()
+        await system_poll
+        await station_poll
+    await hass.async_block_till_done()
+
+    assert departed not in coordinator.data[system.system_id].devices
+    assert (system.system_id, departed) not in coordinator.device_index
+    assert er.async_get(hass).async_get_entity_id("switch", DOMAIN, departed) is None
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
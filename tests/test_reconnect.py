@@ -0,0 +1,140 @@
+"""Tests for the reconnect backoff and circuit breaker."""
+from unittest.mock import patch
+
+from aiohttp import ClientError
+import pytest
+
+from custom_components.googlewifi.const import (
+    CIRCUIT_BREAKER_COOLDOWN,
+    CIRCUIT_BREAKER_THRESHOLD,
+    COORDINATOR,
+    DOMAIN,
+)
+from custom_components.googlewifi.reconnect import ReconnectPolicy
+
+from .conftest import async_setup_integration
+from .mock_cloud import FOYER
+
+STATUS_ROUTE = f"{FOYER}/groups/{{system_id}}/status"
+
+
+class Clock:
+    """A monotonic clock the test moves by hand."""
+
+    def __init__(self):
+        """Start the clock."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the time."""
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Replace the monotonic clock of the policy."""
+    clock = Clock()
+    with patch("custom_components.googlewifi.reconnect.time.monotonic", clock):
+        yield clock
+
+
+def policy(**kwargs) -> ReconnectPolicy:
+    """Return a policy with small numbers."""
+    options = {"base_interval": 30, "max_interval": 300, "threshold": 5}
+    return ReconnectPolicy(cooldown=600, **{**options, **kwargs})
+
+
+def test_backoff(clock):
+    """Each failure doubles the delay up to the maximum, with jitter below it."""
+    reconnect = policy(threshold=100)
+
+    with patch(
+        "custom_components.googlewifi.reconnect.random.uniform",
+        side_effect=lambda low, high: high,
+    ):
+        delays = [reconnect.record_failure() for _ in range(5)]
+
+    assert delays == [60, 120, 240, 300, 300]
+    assert not reconnect.is_open
+
+    for _ in range(50):
+        assert 150 <= reconnect.record_failure() <= 300
+
+
+def test_success_resets(clock):
+    """A success restarts the backoff from the base interval."""
+    reconnect = policy()
+
+    for _ in range(3):
+        reconnect.record_failure()
+    reconnect.record_success()
+
+    assert reconnect.failures == 0
+    assert reconnect.total_failures == 3
+    assert 30 <= reconnect.record_failure() <= 60
+
+
+def test_circuit_breaker(clock):
+    """The circuit opens at the threshold and allows a trial after the cooldown."""
+    reconnect = policy()
+
+    for _ in range(4):
+        reconnect.record_failure()
+    assert not reconnect.is_open
+    assert reconnect.cooldown_remaining == 0
+
+    assert reconnect.record_failure() == 600
+    assert reconnect.is_open
+    assert reconnect.circuit_trips == 1
+
+    clock.now += 400
+    assert reconnect.is_open
+    assert reconnect.cooldown_remaining == 200
+
+    # The trial poll fails and opens the circuit again.
+    clock.now += 200
+    assert not reconnect.is_open
+    assert reconnect.record_failure() == 600
+    assert reconnect.is_open
+    assert reconnect.circuit_trips == 2
+
+    # The next trial succeeds and closes it.
+    clock.now += 600
+    reconnect.record_success()
+    assert not reconnect.is_open
+    assert reconnect.cooldown_remaining == 0
+    assert reconnect.record_failure() <= 60
+
+
+async def test_station_polls_pause(hass, mock_cloud, config_entry):
+    """A system that keeps failing stops calling the API for the cooldown."""
+    assert await async_setup_integration(hass, config_entry)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR]
+    system_id = next(iter(mock_cloud.systems))
+    updater = coordinator.system_updaters[system_id]
+
+    with patch.object(
+        coordinator.api, "get_status", side_effect=ClientError("unreachable")
+    ) as get_status:
+        for _ in range(CIRCUIT_BREAKER_THRESHOLD):
+            await updater.async_refresh()
+        assert get_status.call_count == CIRCUIT_BREAKER_THRESHOLD
+        assert updater.reconnect.is_open
+        assert updater.update_interval.total_seconds() == CIRCUIT_BREAKER_COOLDOWN
+
+        await updater.async_refresh()
+        assert get_status.call_count == CIRCUIT_BREAKER_THRESHOLD
+        assert not updater.last_update_success
+        assert not coordinator.system_available(system_id)
+
+    # Once the cooldown has passed a trial poll closes the circuit.
+    requests = mock_cloud.requests[STATUS_ROUTE]
+    updater.reconnect._opened_at -= CIRCUIT_BREAKER_COOLDOWN
+    await updater.async_refresh()
+
+    assert mock_cloud.requests[STATUS_ROUTE] == requests + 1
+    assert updater.last_update_success
+    assert not updater.reconnect.failures
+    assert coordinator.system_available(system_id)
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
@@ -0,0 +1,71 @@
+"""Tests for starting from the saved snapshot."""
+import asyncio
+from datetime import timedelta
+import time
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.googlewifi.const import (
+    COORDINATOR,
+    DOMAIN,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_KEY,
+)
+
+from .conftest import async_setup_integration
+
+LATENCY = 1.0
+
+
+def system_states(hass) -> list:
+    """Return the states of the entities that carry the system attribute."""
+    return [state for state in hass.states.async_all() if "system" in state.attributes]
+
+
+async def test_start_from_snapshot(hass, hass_storage, mock_cloud, config_entry):
+    """Entities are ready from the snapshot long before the cloud answers."""
+    assert await async_setup_integration(hass, config_entry)
+    assert not any("stale" in state.attributes for state in system_states(hass))
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SNAPSHOT_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+    assert f"{SNAPSHOT_STORAGE_KEY}.{config_entry.entry_id}" in hass_storage
+
+    live_states = len(hass.states.async_all())
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    # A station that joins while Home Assistant is down only shows up live.
+    system = next(iter(mock_cloud.systems.values()))
+    joined = system.add_station()
+    mock_cloud.latency = LATENCY
+
+    started = time.perf_counter()
+    assert await async_setup_integration(hass, config_entry)
+    ready_seconds = time.perf_counter() - started
+    print(f"\nEntities ready from the snapshot in {ready_seconds * 1000:.0f} ms")
+
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR]
+    assert ready_seconds < LATENCY
+    assert coordinator.stale
+    assert len(hass.states.async_all()) == live_states
+    stale_states = system_states(hass)
+    assert stale_states
+    assert all(state.attributes.get("stale") for state in stale_states)
+    assert (system.system_id, joined) not in coordinator.device_index
+
+    async with asyncio.timeout(30):
+        while coordinator.stale:
+            await asyncio.sleep(0.05)
+    await hass.async_block_till_done()
+
+    assert coordinator.last_update_success
+    assert not any("stale" in state.attributes for state in system_states(hass))
+    assert (system.system_id, joined) in coordinator.device_index
+
+    mock_cloud.latency = 0
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
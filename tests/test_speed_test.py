@@ -0,0 +1,49 @@
+"""Tests for the background speed tests."""
+import asyncio
+from unittest.mock import patch
+
+from aiohttp import ClientError
+import pytest
+
+from custom_components.googlewifi.const import COORDINATOR, DOMAIN
+
+from .conftest import async_setup_integration
+
+RESULT = {"transmitWanSpeedBps": "95000000", "receiveWanSpeedBps": "480000000"}
+
+
+@pytest.fixture
+def cloud_options() -> dict:
+    """Use four systems."""
+    return {"systems": 4, "access_points": 1, "stations": 5}
+
+
+async def test_failed_speed_tests(hass, mock_cloud, config_entry):
+    """A system whose speed test fails does not drop the others."""
+    assert await async_setup_integration(hass, config_entry)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR]
+    system_ids = list(mock_cloud.systems)
+    errors = {
+        system_ids[0]: ClientError("connection reset"),
+        system_ids[1]: asyncio.TimeoutError(),
+        system_ids[2]: RuntimeError("unexpected"),
+    }
+
+    async def run_speed_test(system_id):
+        if system_id in errors:
+            raise errors[system_id]
+        return RESULT
+
+    refreshes = coordinator.system_refreshes
+    with patch.object(coordinator.api, "run_speed_test", side_effect=run_speed_test):
+        await coordinator._async_run_speed_tests(system_ids)
+    await hass.async_block_till_done()
+
+    history = {entry["system_id"]: entry for entry in coordinator.speedtest_history}
+    assert "error" in history[system_ids[0]]
+    assert "error" in history[system_ids[1]]
+    assert history[system_ids[3]]["result"] == RESULT
+    assert coordinator.data[system_ids[3]].wan_receive_bps is not None
+    assert coordinator.system_refreshes == refreshes + 1
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
@@ -0,0 +1,314 @@
+"""Benchmark of the cost of an entity state write.
+
+Entities compute their state once per coordinator update in _update_attrs()
+and the properties Home Assistant reads are plain lookups. The baseline
+subclasses restore the read path from before that change: is_on, available,
+is_connected and the attributes walk the coordinator data, parse the
+prioritization end and build the attribute keys every time they are read.
+
+The timing covers what differs between the two: computing the state and
+reading the properties Home Assistant reads on a write, for the client
+switches and device trackers of the mock cloud. The repeats of both variants
+alternate with the garbage collector off and the fastest of each counts. The
+state machine work is the same for both and only checked to give equal
+states. A write of every entity also counts the lookups of the coordinator
+data, which does not depend on the machine.
+"""
+import asyncio
+from contextlib import contextmanager
+import gc
+import os
+import time
+
+import pytest
+
+from homeassistant.util.dt import as_local, as_timestamp, parse_datetime
+
+from custom_components.googlewifi.const import unit_convert
+from custom_components.googlewifi.device_tracker import GoogleWifiDeviceTracker
+from custom_components.googlewifi.switch import GoogleWifiSwitch
+
+from .conftest import async_setup_integration
+
+SCALE = float(os.environ.get("GOOGLEWIFI_BENCHMARK_SCALE", "1"))
+STATIONS = max(10, round(500 * SCALE))
+ROUNDS = 10
+REPEATS = 9
+
+THRESHOLDS = {
+    # Lookups of the coordinator data per state write of a client entity.
+    "lookups_per_write": 1.0,
+    # Cost of computing and reading a state relative to the baseline. It is
+    # about 0.9, the headroom absorbs noise of a busy machine.
+    "compute_ratio": 1.1,
+}
+
+
+class BaselineEntityMixin:
+    """The attributes read path of the entities before the change."""
+
+    @property
+    def extra_state_attributes(self):
+        """Return the attributes."""
+        self._attrs["system"] = self._system_id
+        if self.coordinator.stale:
+            self._attrs["stale"] = True
+        else:
+            self._attrs.pop("stale", None)
+        return self._attrs
+
+
+class BaselineSwitch(BaselineEntityMixin, GoogleWifiSwitch):
+    """A switch with the read path from before the change."""
+
+    @property
+    def is_on(self):
+        """Return the status of the internet for this device."""
+        try:
+            system = self.coordinator.data[self._system_id]
+            is_prioritized = False
+            is_prioritized_end = "NA"
+
+            if (
+                system.prioritized_station == self._item_id
+                and system.prioritization_end_time
+            ):
+                end_time = parse_datetime(system.prioritization_end_time)
+                is_prioritized_end = as_local(end_time).strftime("%d-%b-%y %I:%M %p")
+
+                if as_timestamp(end_time) > time.time():
+                    is_prioritized = True
+
+            self._attrs["prioritized"] = is_prioritized
+            self._attrs["prioritized_end"] = is_prioritized_end
+
+            if system.devices[self._item_id].paused:
+                self._state = False
+            else:
+                self._state = True
+        except TypeError:
+            pass
+        except KeyError:
+            pass
+
+        if self._pending is not None and not self._pending.failed:
+            self._state = self._pending.value
+
+        try:
+            device = self.coordinator.data[self._system_id].devices[self._item_id]
+        except (TypeError, KeyError):
+            return self._state
+
+        self._mac = device.mac_address
+
+        self._attrs["mac"] = self._mac if self._mac else "NA"
+        self._attrs["ip"] = device.ip_address or "NA"
+
+        unit = self._unit_of_measurement
+        self._attrs[
+            f"transmit_speed_{unit.replace('/', 'p').replace(' ', '_').lower()}"
+        ] = unit_convert(device.transmit_bps, unit)
+        self._attrs[
+            f"receive_speed_{unit.replace('/', 'p').replace(' ', '_').lower()}"
+        ] = unit_convert(device.receive_bps, unit)
+
+        self._attrs["network"] = device.network
+
+        return self._state
+
+    @property
+    def available(self):
+        """Switch is not available if it is not connected."""
+        try:
+            if self.coordinator.data[self._system_id].devices[self._item_id].connected:
+                self._available = True
+            else:
+                self._available = False
+        except TypeError:
+            pass
+        except KeyError:
+            pass
+
+        return self._available
+
+
+class BaselineDeviceTracker(BaselineEntityMixin, GoogleWifiDeviceTracker):
+    """A device tracker with the read path from before the change."""
+
+    @property
+    def is_connected(self):
+        """Return true if the device is connected."""
+        try:
+            system = self.coordinator.data[self._system_id]
+            device = system.devices[self._item_id]
+
+            if device.connected:
+                if device.ap_id:
+                    self._attrs["connected_ap"] = system.access_points[
+                        device.ap_id
+                    ].room_name
+                else:
+                    self._attrs["connected_ap"] = "NA"
+
+                self._attrs["ip_address"] = device.ip_address or "NA"
+
+                self._mac = device.mac_address
+
+                self._attrs["mac"] = self._mac if self._mac else "NA"
+
+                self._is_connected = True
+            else:
+                self._is_connected = False
+        except TypeError:
+            pass
+        except KeyError:
+            pass
+
+        return self._is_connected
+
+
+BASELINES = {
+    GoogleWifiSwitch: BaselineSwitch,
+    GoogleWifiDeviceTracker: BaselineDeviceTracker,
+}
+
+
+class CountingDict(dict):
+    """A dict that counts its item lookups."""
+
+    lookups = 0
+
+    def __getitem__(self, key):
+        """Count the lookup and return the item."""
+        self.lookups += 1
+        return super().__getitem__(key)
+
+
+@pytest.fixture
+def cloud_options() -> dict:
+    """Size the mock cloud for the benchmark."""
+    return {"systems": 1, "access_points": 3, "stations": STATIONS}
+
+
+def time_rounds(entities, compute) -> float:
+    """Return the seconds taken by ROUNDS computes of every entity."""
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            for entity in entities:
+                compute(entity)
+        return time.perf_counter() - started
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+@contextmanager
+def baseline(entities):
+    """Give the entities the read path from before the change."""
+    classes = {entity: type(entity) for entity in entities}
+    for entity in entities:
+        entity.__class__ = BASELINES[classes[entity]]
+    try:
+        yield
+    finally:
+        for entity, cls in classes.items():
+            entity.__class__ = cls
+
+
+def count_lookups(coordinator, entities, write) -> int:
+    """Return the lookups of the coordinator data in one write of every entity."""
+    data = coordinator.data
+    coordinator.data = CountingDict(data)
+    try:
+        for entity in entities:
+            write(entity)
+        return coordinator.data.lookups
+    finally:
+        coordinator.data = data
+
+
+def read_state(entity):
+    """Read the properties Home Assistant reads to write the state."""
+    return entity.available, entity.state, entity.extra_state_attributes
+
+
+def compute_after(entity):
+    """Compute the state once and read it, as on a coordinator update."""
+    entity._update_attrs()
+    return read_state(entity)
+
+
+def write_after(entity):
+    """Compute the state once and write it, as on a coordinator update."""
+    entity._async_write_state()
+
+
+def write_before(entity):
+    """Write the state, computing it in the properties."""
+    entity.async_write_ha_state()
+
+
+async def test_state_write_cost(hass, mock_cloud, config_entry):
+    """Computing once per update is cheaper than computing on every read."""
+    # Debug mode checks every callback and would dominate the timings.
+    asyncio.get_running_loop().set_debug(False)
+
+    assert await async_setup_integration(hass, config_entry)
+
+    entities = [
+        entity
+        for domain in ("switch", "device_tracker")
+        for entity in hass.data[domain].entities
+        if type(entity) in BASELINES
+    ]
+    assert len(entities) == 2 * STATIONS
+    coordinator = entities[0].coordinator
+
+    # Alternate the variants so that drift of the machine hits both.
+    timings_after, timings_before = [], []
+    for _ in range(REPEATS):
+        timings_after.append(time_rounds(entities, compute_after))
+        with baseline(entities):
+            timings_before.append(time_rounds(entities, read_state))
+    after, before = min(timings_after), min(timings_before)
+
+    lookups = count_lookups(coordinator, entities, write_after)
+    states_after = {entity: hass.states.get(entity.entity_id) for entity in entities}
+    with baseline(entities):
+        lookups_before = count_lookups(coordinator, entities, write_before)
+        states_before = {
+            entity: hass.states.get(entity.entity_id) for entity in entities
+        }
+
+    # Both read paths write the same states.
+    for entity in entities:
+        assert states_before[entity].state == states_after[entity].state
+        assert states_before[entity].attributes == states_after[entity].attributes
+
+    computes = ROUNDS * len(entities)
+    results = {
+        "lookups_per_write": lookups / len(entities),
+        "compute_ratio": after / before,
+    }
+
+    print(
+        f"\nGoogle Wifi state writes: {computes} computes, "
+        f"{before / computes * 1e6:.1f} us before and "
+        f"{after / computes * 1e6:.1f} us "
+        f"after, {lookups_before / len(entities):.1f} data lookups per write "
+        "before"
+    )
+    for name, value in results.items():
+        print(f"  {name:<20} {value:>10.3f}  (threshold {THRESHOLDS[name]:.3f})")
+
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+    assert lookups_before > lookups
+    exceeded = {
+        name: value for name, value in results.items() if value > THRESHOLDS[name]
+    }
+    assert not exceeded, f"Benchmark thresholds exceeded: {exceeded}"
@@ -0,0 +1,75 @@
+"""Tests for the rolling traffic history."""
+import pytest
+
+from custom_components.googlewifi.const import TRAFFIC_MAX_SAMPLES
+from custom_components.googlewifi.traffic import TrafficHistory, traffic_samples
+
+
+@pytest.mark.parametrize(
+    ("window", "interval", "samples"),
+    [
+        (3600, 30, 120 + 12 + 1),
+        (3600, 10, 360 + 12 + 1),
+        (600, 10, 60 + 2 + 1),
+        (12 * 3600, 10, TRAFFIC_MAX_SAMPLES),
+    ],
+)
+def test_traffic_samples(window, interval, samples):
+    """The buffers hold the window at the shortest interval, within the bound."""
+    assert traffic_samples(window, interval, 300) == samples
+
+
+def test_stats_within_window():
+    """Only the samples of the window count."""
+    history = TrafficHistory(10)
+    for second in range(5):
+        history.record(second * 10, {"system": (second, 10 * second)})
+
+    stats = history.stats("system", 40, 25)
+
+    assert stats["samples"] == 3
+    assert stats["window"] == 25
+    assert stats["transmit"] == {"mean": 3, "p95": 4, "peak": 4}
+    assert stats["receive"]["mean"] == 30
+
+
+def test_stats_cut_short():
+    """A full buffer reports the seconds it covers instead of the window."""
+    history = TrafficHistory(4)
+    for second in range(10):
+        history.record(second * 10, {"system": (1, 1)})
+
+    stats = history.stats("system", 90, 3600)
+
+    assert stats["samples"] == 4
+    assert stats["window"] == 30
+
+
+def test_stats_young_history():
+    """A history younger than the window reports the configured window."""
+    history = TrafficHistory(10)
+    history.record(0, {"system": (1, 1)})
+
+    assert history.stats("system", 0, 3600)["window"] == 3600
+    assert history.stats("other", 0, 3600) is None
+
+
+def test_largest():
+    """Keys are ranked on their mean over the window."""
+    history = TrafficHistory(3)
+    history.record(0, {"a": (100, 0), "b": (0, 0), "c": (1, 1)})
+    for second in range(1, 4):
+        history.record(second, {"a": (0, 0), "b": (10, 10), "c": (1, 1)})
+
+    assert history.largest(["a", "b", "c"], 3, 3600, 2) == ["b", "c"]
+    assert history.largest(["a", "b", "c"], 3, 0.5, 3) == ["b", "c", "a"]
+
+
+def test_dropped_keys():
+    """Keys missing from a poll leave the history."""
+    history = TrafficHistory(3)
+    history.record(0, {"a": (1, 1), "b": (1, 1)})
+    history.record(1, {"a": (1, 1)})
+
+    assert len(history) == 1
+    assert history.stats("b", 1, 60) is None
@@ -0,0 +1,97 @@
+"""Tests for the daily and monthly data usage."""
+from datetime import datetime
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.googlewifi.const import (
+    DATA_USAGE_MAX_GAP,
+    DATA_USAGE_STORAGE_KEY,
+)
+from custom_components.googlewifi.models import DeviceView, SystemView
+from custom_components.googlewifi.usage import DataUsage
+
+# 8 kbit/s up and 16 kbit/s down: 1,000 and 2,000 bytes per second.
+TRAFFIC = {"transmitSpeedBps": "8000", "receiveSpeedBps": "16000"}
+
+
+def local(text: str) -> datetime:
+    """Return a local time of Home Assistant."""
+    return datetime.fromisoformat(text).replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+
+def systems(*device_ids, connected=True) -> dict:
+    """Return a system whose devices all send and receive TRAFFIC."""
+    system = SystemView("system-1", {})
+    for device_id in device_ids:
+        system.devices[device_id] = DeviceView(
+            device_id, {"connected": connected, "traffic": TRAFFIC}
+        )
+    return {"system-1": system}
+
+
+async def test_integrate(hass, freezer):
+    """Rates count from the second poll, for connected devices only."""
+    freezer.move_to(local("2026-03-10T12:00:00"))
+    usage = DataUsage(hass, "entry")
+
+    usage.async_integrate(0, systems("phone"))
+    assert usage.get("system-1", "phone") is None
+
+    usage.async_integrate(10, systems("phone"))
+    assert usage.get("system-1", "phone") == [10_000, 20_000, 10_000, 20_000]
+
+    usage.async_integrate(20, systems("phone", connected=False))
+    assert usage.get("system-1", "phone") == [10_000, 20_000, 10_000, 20_000]
+
+    # A gap longer than the maximum is not counted.
+    usage.async_integrate(30 + DATA_USAGE_MAX_GAP, systems("phone"))
+    assert usage.get("system-1", "phone") == [10_000, 20_000, 10_000, 20_000]
+
+
+async def test_day_rollover(hass, freezer):
+    """The daily counters restart at midnight, the monthly ones keep counting."""
+    freezer.move_to(local("2026-03-10T23:59:50"))
+    usage = DataUsage(hass, "entry")
+    usage.async_integrate(0, systems("phone", "laptop"))
+    usage.async_integrate(10, systems("phone", "laptop"))
+
+    freezer.move_to(local("2026-03-11T00:00:10"))
+    usage.async_integrate(30, systems("phone"))
+
+    assert usage.get("system-1", "phone") == [20_000, 40_000, 30_000, 60_000]
+    # A device that left the system is dropped at the rollover.
+    assert usage.get("system-1", "laptop") is None
+
+
+async def test_month_rollover(hass, freezer):
+    """Every counter restarts on the first of the month."""
+    freezer.move_to(local("2026-03-31T23:59:50"))
+    usage = DataUsage(hass, "entry")
+    usage.async_integrate(0, systems("phone"))
+    usage.async_integrate(10, systems("phone"))
+
+    freezer.move_to(local("2026-04-01T00:00:10"))
+    usage.async_integrate(30, systems("phone"))
+
+    assert usage.get("system-1", "phone") == [20_000, 40_000, 20_000, 40_000]
+
+
+async def test_restore(hass, hass_storage, freezer):
+    """Saved counters of the same day are restored, older days roll over."""
+    freezer.move_to(local("2026-03-11T08:00:00"))
+    hass_storage[f"{DATA_USAGE_STORAGE_KEY}.entry"] = {
+        "version": 1,
+        "key": f"{DATA_USAGE_STORAGE_KEY}.entry",
+        "data": {
+            "day": "2026-03-10",
+            "month": "2026-03",
+            "devices": {"system-1/phone": [5, 6, 7, 8]},
+        },
+    }
+    usage = DataUsage(hass, "entry")
+    await usage.async_load()
+
+    assert usage.get("system-1", "phone") == [5, 6, 7, 8]
+
+    usage.async_integrate(0, systems("phone"))
+    assert usage.get("system-1", "phone") == [0, 0, 7, 8]